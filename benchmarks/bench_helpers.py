@@ -0,0 +1,62 @@
+"""
+Micro-benchmarks of the helper functions on the object import hot path.
+
+Usage, from the top of the repository: PYTHONPATH=. python benchmarks/bench_helpers.py [names]
+"""
+
+import logging
+import re
+import sys
+import timeit
+
+from fmcapi.api_objects.helper_functions import (
+    syntax_correcter,
+    syntax_correcter_batch,
+)
+
+PERMITTED = r"""[.\w\d_\-]"""
+
+
+def syntax_correcter_per_character(value, permitted_syntax=PERMITTED, replacer="_"):
+    """The original implementation, one re.match() per character, kept as the reference."""
+    new_value = ""
+    for char in range(0, len(value)):
+        if not re.match(permitted_syntax, value[char]):
+            new_value += replacer
+        else:
+            new_value += value[char]
+    return new_value
+
+
+def best_of(statement, number, repeat=5):
+    """Fastest of repeat runs, in seconds per call."""
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    names = [f"host {i}/web-server_{i}.example.com" for i in range(count)]
+    assert [syntax_correcter(n) for n in names] == syntax_correcter_batch(names)
+    assert syntax_correcter_batch(names[:100]) == [
+        syntax_correcter_per_character(n) for n in names[:100]
+    ]
+    cases = {
+        "per character (original)": lambda: [
+            syntax_correcter_per_character(n) for n in names
+        ],
+        "syntax_correcter": lambda: [syntax_correcter(n) for n in names],
+        "syntax_correcter_batch": lambda: syntax_correcter_batch(names),
+    }
+    baseline = None
+    for label, statement in cases.items():
+        seconds = best_of(statement, number=1)
+        baseline = baseline or seconds
+        print(
+            f"{label}: {seconds * 1e6 / count:.2f} us/name "
+            f"({baseline / seconds:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Time "import fmcapi" in fresh interpreters.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+CASES = {
+    "import fmcapi": "import fmcapi",
+    "import fmcapi + one class": "import fmcapi; fmcapi.Hosts",
+    "import every class": "from fmcapi import *",
+}
+
+
+def measure(code, runs):
+    """Return the wall clock seconds of each run of code in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code], check=True
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = statistics.median(measure("pass", runs))
+    print(f"interpreter startup: {baseline * 1000:.1f} ms (subtracted below)")
+    for label, code in CASES.items():
+        median = statistics.median(measure(code, runs)) - baseline
+        print(f"{label}: {median * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
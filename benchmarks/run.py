@@ -0,0 +1,149 @@
+"""
+Run the benchmarks in benchmarks/suite.py and compare them to benchmarks/baselines.json.
+
+Each benchmark's best time is divided by the best time of a fixed pure-Python loop, so that baselines saved on one
+machine remain comparable on another.  A benchmark regresses when its normalized time exceeds its baseline by more
+than the tolerance, or when it isn't faster than the benchmark it must beat (FASTER_THAN in suite.py); the script
+then exits with status 1.
+
+Usage: python benchmarks/run.py [--save] [--tolerance 0.5] [--repeat N] [name filter ...]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from suite import BENCHMARKS, FASTER_THAN  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+def calibrate(runs=10):
+    """Best seconds of a fixed pure-Python workload, the unit benchmarks are expressed in."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        table = {}
+        for i in range(200000):
+            table[f"key-{i % 1000}"] = table.get(f"key-{i % 1000}", 0) + i
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure(setup, repeat):
+    """Best seconds of repeat calls of the function a benchmark yields.  Like timeit, the garbage collector is off."""
+    timings = []
+    with setup() as run:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                result = run()
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+            timings.append(result if isinstance(result, float) else elapsed)
+    return min(timings)
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get("benchmarks", {})
+
+
+def save_baselines(path, results, unit):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "calibration_seconds": round(unit, 6),
+                "benchmarks": {
+                    name: round(score, 4) for name, score in results.items()
+                },
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "filters",
+        nargs="*",
+        help="Only run benchmarks whose name contains one of these.",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the new baselines."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown relative to the baseline. (Default is 0.5, i.e. 50%%)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, help="Override the number of runs of each benchmark."
+    )
+    parser.add_argument("--baselines", default=BASELINES, help="Baselines file.")
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baselines)
+    unit = calibrate()
+    print(f"calibration: {unit * 1000:.1f} ms")
+    print(
+        f"{'benchmark':<40} {'seconds':>9} {'score':>9} {'baseline':>9} {'change':>8}"
+    )
+    results = {}
+    regressions = []
+    for name, (setup, repeat) in BENCHMARKS.items():
+        if args.filters and not any(f.lower() in name.lower() for f in args.filters):
+            continue
+        seconds = measure(setup, args.repeat or repeat)
+        score = results[name] = seconds / unit
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<40} {seconds:>9.4f} {score:>9.2f} {'-':>9} {'-':>8}")
+            continue
+        change = score / baseline - 1
+        flag = ""
+        if change > args.tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<40} {seconds:>9.4f} {score:>9.2f} {baseline:>9.2f} {change:>+8.0%}{flag}"
+        )
+    slower = [
+        name
+        for name, other in FASTER_THAN.items()
+        if name in results and other in results and results[name] >= results[other]
+    ]
+    for name in slower:
+        print(f'{name} is not faster than "{FASTER_THAN[name]}".')
+
+    if slower:
+        return 1
+    if args.save:
+        save_baselines(args.baselines, dict(baselines, **results), unit)
+        print(f"Baselines saved to {args.baselines}.")
+    elif regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Benchmarks of fmcapi's hot paths, run against an in-process FMCSimulator.
+
+A benchmark is a generator function registered with @benchmark: the code before its "yield" is setup, the function
+it yields is what gets timed and the code after the "yield" is teardown.  If the timed function returns a number,
+that number is used as the measurement instead of the wall clock time of the call.
+
+A benchmark registered with faster_than=other must beat that other benchmark, e.g. parallel paging must beat serial
+paging.
+
+Run them, and compare them to the stored baselines, with benchmarks/run.py.
+"""
+
+import contextlib
+import subprocess
+import sys
+
+from fmcapi.api_objects.object_services.hosts import Hosts
+from fmcapi.api_objects.policy_services.accessrules import AccessRules, Bulk
+from fmcapi.api_objects.deployment_services.deploymentpipeline import (
+    DeploymentPipeline,
+)
+from fmcapi.fmc import FMC
+from fmcapi.simulator import FMCSimulator
+
+BENCHMARKS = {}
+# Benchmark name -> name of the benchmark it must be faster than.
+FASTER_THAN = {}
+# Seconds each simulated request to the FMC takes in the paging benchmarks.  Without it the simulator answers
+# instantly and the benchmarks measure only the GIL bound parsing, which parallel requests can't speed up.
+PAGE_LATENCY = 0.02
+
+
+def benchmark(name, repeat=5, faster_than=None):
+    """Register a benchmark under name, timed repeat times and required to beat the faster_than benchmark."""
+
+    def register(setup):
+        BENCHMARKS[name] = (contextlib.contextmanager(setup), repeat)
+        if faster_than is not None:
+            FASTER_THAN[name] = faster_than
+        return setup
+
+    return register
+
+
+@contextlib.contextmanager
+def connect(simulator, **kwargs):
+    """Log into the simulator with a quiet FMC object."""
+    kwargs.setdefault("rate_limit", None)
+    fmc = FMC(
+        host="fmc.simulator",
+        autodeploy=False,
+        logging_level="CRITICAL",
+        wait_time=0,
+        **kwargs,
+    )
+    with simulator.attach(fmc):
+        yield fmc
+
+
+def hosts(count):
+    """Keyword arguments of count Hosts objects."""
+    return [
+        {
+            "name": f"host-{i}",
+            "value": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+        }
+        for i in range(count)
+    ]
+
+
+def import_time(code):
+    """Seconds an "import" statement takes in a fresh interpreter."""
+    timer = (
+        "import time; start = time.perf_counter(); "
+        f"{code}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", timer],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
+@benchmark("import fmcapi", repeat=10)
+def bench_import():
+    yield lambda: import_time("import fmcapi")
+
+
+@benchmark("import every class", repeat=10)
+def bench_import_all():
+    yield lambda: import_time("from fmcapi import *")
+
+
+@benchmark("Hosts construct x10000")
+def bench_construct():
+    kwargs = hosts(10000)
+    with connect(FMCSimulator()) as fmc:
+
+        def run():
+            for item in kwargs:
+                Hosts(fmc=fmc, **item)
+
+        yield run
+
+
+@benchmark("Hosts parse_kwargs x10000")
+def bench_parse_kwargs():
+    kwargs = hosts(10000)
+    with connect(FMCSimulator()) as fmc:
+        host = Hosts(fmc=fmc)
+
+        def run():
+            for item in kwargs:
+                host.parse_kwargs(**item)
+
+        yield run
+
+
+@benchmark("Hosts format_data x10000")
+def bench_format_data():
+    with connect(FMCSimulator()) as fmc:
+        objects = [Hosts(fmc=fmc, **item) for item in hosts(10000)]
+
+        def run():
+            for host in objects:
+                host.format_data()
+
+        yield run
+
+
+@benchmark("Hosts get 100k, 1 worker", repeat=3)
+def bench_paging():
+    simulator = FMCSimulator(latency=PAGE_LATENCY)
+    simulator.load("object/hosts", hosts(100000))
+    with connect(simulator, max_workers=1) as fmc:
+        yield lambda: Hosts(fmc=fmc).get()
+
+
+@benchmark(
+    "Hosts get 100k, 4 workers", repeat=3, faster_than="Hosts get 100k, 1 worker"
+)
+def bench_paging_parallel():
+    simulator = FMCSimulator(latency=PAGE_LATENCY)
+    simulator.load("object/hosts", hosts(100000))
+    with connect(simulator, max_workers=4) as fmc:
+        yield lambda: Hosts(fmc=fmc).get()
+
+
+@benchmark("Bulk.post 5000 AccessRules")
+def bench_bulk_post():
+    simulator = FMCSimulator()
+    policy = simulator.load(
+        "policy/accesspolicies", [{"name": "benchmark", "type": "AccessPolicy"}]
+    )[0]
+    collection = (
+        simulator.domain_uuid,
+        f"policy/accesspolicies/{policy['id']}/accessrules",
+    )
+    with connect(simulator) as fmc:
+        rules = []
+        for i in range(5000):
+            rule = AccessRules(fmc=fmc, name=f"rule-{i}", action="ALLOW", enabled=True)
+            rule.acp(id=policy["id"])
+            rules.append(rule)
+
+        def run():
+            simulator.collections.pop(collection, None)
+            bulk = Bulk(fmc=fmc)
+            for rule in rules:
+                bulk.add(rule)
+            if not bulk.post():
+                raise RuntimeError("Bulk.post() failed.")
+
+        yield run
+
+
+@benchmark("AccessRules network resolution x2000")
+def bench_resolution():
+    simulator = FMCSimulator()
+    simulator.load(
+        "object/networkaddresses",
+        [
+            {
+                "name": f"net-{i}",
+                "value": f"10.{i // 256}.{i % 256}.0/24",
+                "type": "Network",
+            }
+            for i in range(500)
+        ],
+    )
+    simulator.load(
+        "object/networkgroups",
+        [{"name": f"group-{i}", "type": "NetworkGroup"} for i in range(50)],
+    )
+    with connect(simulator) as fmc:
+
+        def run():
+            # Start cold, so that loading the catalog is part of the measurement.
+            fmc.catalog.invalidate()
+            for i in range(2000):
+                rule = AccessRules(fmc=fmc, name=f"rule-{i}")
+                rule.source_network(action="add", name=f"net-{i % 500}")
+                rule.destination_network(action="add", name=f"group-{i % 50}")
+
+        yield run
+
+
+@benchmark("DeploymentPipeline 20 devices", repeat=3)
+def bench_deployment():
+    simulator = FMCSimulator(task_time=0.2)
+    devices = [
+        {
+            "name": f"ftd-{i}",
+            "canBeDeployed": True,
+            "version": "1000",
+            "device": {"id": f"device-{i}", "type": "Device"},
+        }
+        for i in range(20)
+    ]
+    with connect(simulator) as fmc:
+        fmc.task_tracker.POLL_INTERVAL = 0.02
+
+        def run():
+            simulator.load("deployment/deployabledevices", devices)
+            pipeline = DeploymentPipeline(fmc=fmc, settle_time=0)
+            pipeline.POLL_INTERVAL = 0.01
+            if pipeline.deploy()["status"] != "Deployed":
+                raise RuntimeError("The deployment didn't finish.")
+
+        yield run
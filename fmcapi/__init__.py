@@ -2,10 +2,29 @@
 
 import logging
 from .fmc import FMC
-from .api_objects import *
+from . import api_objects
 
 logging.debug("In the fmcapi __init__.py file.")
 
+__all__ = ["FMC", "AsyncFMC"] + api_objects.__all__
+
+
+def __getattr__(name):
+    """Import AsyncFMC and the api_objects classes (fmcapi.Hosts etc.) the first time they are used."""
+    if name == "AsyncFMC":
+        from .asyncfmc import AsyncFMC as value
+    else:
+        try:
+            value = getattr(api_objects, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 def __authorship__():
     """
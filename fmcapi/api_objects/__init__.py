@@ -1,125 +1,128 @@
 """Update Packages Classes."""
 
 import logging
-
-# TODO: Why is this the case?
-from .policy_services.accesspolicies import AccessPolicies  # Needs loaded before Device
-from .device_services.devicerecords import DeviceRecords  # Needs loaded early.
-
-from .audit_services.audit_records import AuditRecords
-from .backup_services.backup import Backup
-from .deployment_services import DeployableDevices
-from .deployment_services import DeploymentRequests
-from .device_clusters import FTDDeviceCluster
-from .device_group_services import DeviceGroupRecords
-from .device_ha_pair_services import FTDDeviceHAPairs
-from .device_ha_pair_services.failoverinterfacemacaddressconfigs import (
-    FailoverInterfaceMACAddressConfigs,
-)
-from .device_ha_pair_services.monitoredinterfaces import MonitoredInterfaces
-from .device_services.bridgegroupinterfaces import BridgeGroupInterfaces
-from .device_services.etherchannelinterfaces import EtherchannelInterfaces
-from .device_services.ipv4staticroutes import IPv4StaticRoutes
-from .device_services.ipv6staticroutes import IPv6StaticRoutes
-from .device_services.physicalinterfaces import PhysicalInterfaces
-from .device_services.redundantinterfaces import RedundantInterfaces
-from .device_services.staticroutes import StaticRoutes
-from .device_services.subinterfaces import SubInterfaces
-from .health.terminateravpnsessions import TerminateRAVPNSessions
-from .object_services.anyprotocolportobjects import AnyProtocolPortObjects
-from .object_services.applicationcategories import ApplicationCategories
-from .object_services.applicationfilters import ApplicationFilters
-from .object_services.applicationproductivities import ApplicationProductivities
-from .object_services.applicationrisks import ApplicationRisks
-from .object_services.applications import Applications
-from .object_services.applicationtags import ApplicationTags
-from .object_services.applicationtypes import ApplicationTypes
-from .object_services.certenrollments import CertEnrollments
-from .object_services.continents import Continents
-from .object_services.countries import Countries
-from .object_services.dnsservergroups import DNSServerGroups
-from .object_services.endpointdevicetypes import EndPointDeviceTypes
-from .object_services.extendedaccesslist import ExtendedAccessList
-from .object_services.extendedaccesslist import ExtendedAccessListAce
-from .object_services.fqdns import FQDNS
-from .object_services.geolocation import Geolocation
-from .object_services.hosts import Hosts
-from .object_services.icmpv4objects import ICMPv4Objects
-from .object_services.icmpv6objects import ICMPv6Objects
-from .object_services.ikev1ipsecproposals import IKEv1IpsecProposals
-from .object_services.ikev1policies import IKEv1Policies
-from .object_services.ikev2ipsecproposals import IKEv2IpsecProposals
-from .object_services.ikev2policies import IKEv2Policies
-from .object_services.interfacegroups import InterfaceGroups
-from .object_services.interfaceobjects import InterfaceObjects
-from .object_services.isesecuritygrouptags import ISESecurityGroupTags
-from .object_services.networkaddresses import NetworkAddresses
-from .object_services.networkgroups import NetworkGroups
-from .object_services.networks import Networks
-from .object_services.portobjectgroups import PortObjectGroups
-from .object_services.ports import Ports
-from .object_services.protocolportobjects import ProtocolPortObjects
-from .object_services.ranges import Ranges
-from .object_services.realms import Realms
-from .object_services.realmusergroups import RealmUserGroups
-from .object_services.realmusers import RealmUsers
-from .object_services.securitygrouptags import SecurityGroupTags
-from .object_services.securityzones import SecurityZones
-from .object_services.siurlfeeds import SIUrlFeeds
-from .object_services.siurllists import SIUrlLists
-from .object_services.slamonitors import SLAMonitors
-from .object_services.tunneltags import TunnelTags
-from .object_services.urlcategories import URLCategories
-from .object_services.urlgroups import URLGroups
-from .object_services.urls import URLs
-from .object_services.usage import Usage
-from .object_services.variablesets import VariableSets
-from .object_services.vlangrouptags import VlanGroupTags
-from .object_services.vlantags import VlanTags
-from .policy_assignment_services.policyassignments import PolicyAssignments
-from .policy_services.accessrules import AccessRules
-from .policy_services.accessrules import Bulk
-from .policy_services.advancedsettings import AdvancedSettings
-from .policy_services.autonatrules import AutoNatRules
-from .policy_services.defaultactions import DefaultActions
-from .policy_services.endpoints import Endpoints
-from .policy_services.filepolicies import FilePolicies
-from .policy_services.ftdnatpolicies import FTDNatPolicies
-from .policy_services.ftds2svpns import FTDS2SVPNs
-from .policy_services.hitcounts import HitCounts
-from .policy_services.ikesettings import IKESettings
-from .policy_services.intrusionpolicies import IntrusionPolicies
-from .policy_services.ipsecsettings import IPSecSettings
-from .policy_services.loggingsettings import LoggingSettings
-from .policy_services.manualnatrules import ManualNatRules
-from .policy_services.natrules import NatRules
-from .policy_services.prefilterpolicies import PreFilterPolicies
-from .policy_services.prefilterrules import PreFilterRules
-from .search.globalsearch import GlobalSearch
-from .search.object import Object
-from .search.policy import Policy
-from .status_services.taskstatuses import TaskStatuses
-from .system_information import ServerVersion
-from .update_packages.listapplicabledevices import ListApplicableDevices
-from .update_packages.upgradepackage import Upgrades
-from .update_packages.upgradepackages import UpgradePackages
-from .object_services.dynamicobjects import DynamicObject
-from .object_services.dynamicobjectmappings import DynamicObjectMappings
-from .object_services.grouppolicies import GroupPolicies
-from .policy_services.ravpns import RAVpn
-from .policy_services import ConnectionProfiles
-from .policy_services import DynamicAccessPolicies
-from .policy_services.operational import AccessControlPolicyClone
-from .object_services import TimeRanges
-from .health import TunnelStatuses
-from .health import TunnelDetails
-from .health import TunnelSummaries
-from .health import Metrics
-from .health import Alerts
-from .health import Events
+from .helper_functions import lazy_import
 
 logging.debug("In the api_objects __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "AccessPolicies": ".policy_services.accesspolicies",
+    "DeviceRecords": ".device_services.devicerecords",
+    "AuditRecords": ".audit_services.audit_records",
+    "Backup": ".backup_services.backup",
+    "DeployableDevices": ".deployment_services",
+    "DeploymentRequests": ".deployment_services",
+    "DeploymentPipeline": ".deployment_services",
+    "FTDDeviceCluster": ".device_clusters",
+    "DeviceGroupRecords": ".device_group_services",
+    "FTDDeviceHAPairs": ".device_ha_pair_services",
+    "FailoverInterfaceMACAddressConfigs": ".device_ha_pair_services.failoverinterfacemacaddressconfigs",
+    "MonitoredInterfaces": ".device_ha_pair_services.monitoredinterfaces",
+    "BridgeGroupInterfaces": ".device_services.bridgegroupinterfaces",
+    "EtherchannelInterfaces": ".device_services.etherchannelinterfaces",
+    "IPv4StaticRoutes": ".device_services.ipv4staticroutes",
+    "IPv6StaticRoutes": ".device_services.ipv6staticroutes",
+    "PhysicalInterfaces": ".device_services.physicalinterfaces",
+    "RedundantInterfaces": ".device_services.redundantinterfaces",
+    "StaticRoutes": ".device_services.staticroutes",
+    "SubInterfaces": ".device_services.subinterfaces",
+    "TerminateRAVPNSessions": ".health.terminateravpnsessions",
+    "AnyProtocolPortObjects": ".object_services.anyprotocolportobjects",
+    "ApplicationCategories": ".object_services.applicationcategories",
+    "ApplicationFilters": ".object_services.applicationfilters",
+    "ApplicationProductivities": ".object_services.applicationproductivities",
+    "ApplicationRisks": ".object_services.applicationrisks",
+    "Applications": ".object_services.applications",
+    "ApplicationTags": ".object_services.applicationtags",
+    "ApplicationTypes": ".object_services.applicationtypes",
+    "CertEnrollments": ".object_services.certenrollments",
+    "Continents": ".object_services.continents",
+    "Countries": ".object_services.countries",
+    "DNSServerGroups": ".object_services.dnsservergroups",
+    "EndPointDeviceTypes": ".object_services.endpointdevicetypes",
+    "ExtendedAccessList": ".object_services.extendedaccesslist",
+    "ExtendedAccessListAce": ".object_services.extendedaccesslist",
+    "FQDNS": ".object_services.fqdns",
+    "Geolocation": ".object_services.geolocation",
+    "Hosts": ".object_services.hosts",
+    "ICMPv4Objects": ".object_services.icmpv4objects",
+    "ICMPv6Objects": ".object_services.icmpv6objects",
+    "IKEv1IpsecProposals": ".object_services.ikev1ipsecproposals",
+    "IKEv1Policies": ".object_services.ikev1policies",
+    "IKEv2IpsecProposals": ".object_services.ikev2ipsecproposals",
+    "IKEv2Policies": ".object_services.ikev2policies",
+    "InterfaceGroups": ".object_services.interfacegroups",
+    "InterfaceObjects": ".object_services.interfaceobjects",
+    "ISESecurityGroupTags": ".object_services.isesecuritygrouptags",
+    "NetworkAddresses": ".object_services.networkaddresses",
+    "NetworkGroups": ".object_services.networkgroups",
+    "Networks": ".object_services.networks",
+    "PortObjectGroups": ".object_services.portobjectgroups",
+    "Ports": ".object_services.ports",
+    "ProtocolPortObjects": ".object_services.protocolportobjects",
+    "Ranges": ".object_services.ranges",
+    "Realms": ".object_services.realms",
+    "RealmUserGroups": ".object_services.realmusergroups",
+    "RealmUsers": ".object_services.realmusers",
+    "SecurityGroupTags": ".object_services.securitygrouptags",
+    "SecurityZones": ".object_services.securityzones",
+    "SIUrlFeeds": ".object_services.siurlfeeds",
+    "SIUrlLists": ".object_services.siurllists",
+    "SLAMonitors": ".object_services.slamonitors",
+    "TunnelTags": ".object_services.tunneltags",
+    "URLCategories": ".object_services.urlcategories",
+    "URLGroups": ".object_services.urlgroups",
+    "URLs": ".object_services.urls",
+    "Usage": ".object_services.usage",
+    "VariableSets": ".object_services.variablesets",
+    "VlanGroupTags": ".object_services.vlangrouptags",
+    "VlanTags": ".object_services.vlantags",
+    "PolicyAssignments": ".policy_assignment_services.policyassignments",
+    "AccessRules": ".policy_services.accessrules",
+    "Bulk": ".policy_services.accessrules",
+    "AdvancedSettings": ".policy_services.advancedsettings",
+    "AutoNatRules": ".policy_services.autonatrules",
+    "DefaultActions": ".policy_services.defaultactions",
+    "Endpoints": ".policy_services.endpoints",
+    "FilePolicies": ".policy_services.filepolicies",
+    "FTDNatPolicies": ".policy_services.ftdnatpolicies",
+    "FTDS2SVPNs": ".policy_services.ftds2svpns",
+    "HitCounts": ".policy_services.hitcounts",
+    "IKESettings": ".policy_services.ikesettings",
+    "IntrusionPolicies": ".policy_services.intrusionpolicies",
+    "IPSecSettings": ".policy_services.ipsecsettings",
+    "LoggingSettings": ".policy_services.loggingsettings",
+    "ManualNatRules": ".policy_services.manualnatrules",
+    "NatRules": ".policy_services.natrules",
+    "PreFilterPolicies": ".policy_services.prefilterpolicies",
+    "PreFilterRules": ".policy_services.prefilterrules",
+    "GlobalSearch": ".search.globalsearch",
+    "Object": ".search.object",
+    "Policy": ".search.policy",
+    "TaskStatuses": ".status_services.taskstatuses",
+    "TaskTracker": ".status_services.tasktracker",
+    "ServerVersion": ".system_information",
+    "ListApplicableDevices": ".update_packages.listapplicabledevices",
+    "Upgrades": ".update_packages.upgradepackage",
+    "UpgradePackages": ".update_packages.upgradepackages",
+    "DynamicObject": ".object_services.dynamicobjects",
+    "DynamicObjectMappings": ".object_services.dynamicobjectmappings",
+    "DynamicObjectSync": ".object_services.dynamicobjectsync",
+    "GroupPolicies": ".object_services.grouppolicies",
+    "RAVpn": ".policy_services.ravpns",
+    "ConnectionProfiles": ".policy_services",
+    "DynamicAccessPolicies": ".policy_services",
+    "AccessControlPolicyClone": ".policy_services.operational",
+    "TimeRanges": ".object_services",
+    "TunnelStatuses": ".health",
+    "TunnelDetails": ".health",
+    "TunnelSummaries": ".health",
+    "Metrics": ".health",
+    "Alerts": ".health",
+    "Events": ".health",
+}
+
 __all__ = [
     "AdvancedSettings",
     "IPSecSettings",
@@ -128,6 +131,7 @@ __all__ = [
     "IKESettings",
     "DeploymentRequests",
     "DeployableDevices",
+    "DeploymentPipeline",
     "ServerVersion",
     "AuditRecords",
     "DefaultActions",
@@ -211,6 +215,7 @@ __all__ = [
     "PreFilterRules",
     "HitCounts",
     "TaskStatuses",
+    "TaskTracker",
     "ListApplicableDevices",
     "UpgradePackages",
     "Upgrades",
@@ -219,6 +224,7 @@ __all__ = [
     "Usage",
     "DynamicObject",
     "DynamicObjectMappings",
+    "DynamicObjectSync",
     "TerminateRAVPNSessions",
     "GroupPolicies",
     "RAVpn",
@@ -233,3 +239,5 @@ __all__ = [
     "Events",
     "AccessControlPolicyClone",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -1,13 +1,49 @@
 """Super class(es) that is inherited by all API objects."""
-from .helper_functions import syntax_correcter, bulk_list_splitter, check_uuid
-from packaging.version import Version
+from .helper_functions import invalid_characters, bulk_list_splitter, check_uuid
+from concurrent.futures import ThreadPoolExecutor
+import collections
+import copy
+import functools
 import logging
 import json
+from urllib.parse import quote
 
 
 logging.debug(f"In the {__name__} module.")
 
 
+class ClassSchema(object):
+    """Constants of an APIClassTemplate subclass, precomputed once per class.  See APIClassTemplate.schema()."""
+
+    __slots__ = [
+        "valid_for_kwargs",
+        "kwargs",
+        "get_filters",
+        "json_data",
+        "invalid_name_characters",
+        "records",
+    ]
+
+    def __init__(self, api_class):
+        """
+        Precompute the constants of api_class.
+
+        :param api_class: (class) APIClassTemplate subclass.
+        :return: None
+        """
+        self.valid_for_kwargs = (
+            api_class.VALID_FOR_KWARGS + api_class.GLOBAL_VALID_FOR_KWARGS
+        )
+        self.kwargs = frozenset(self.valid_for_kwargs)
+        self.get_filters = frozenset(api_class.VALID_GET_FILTERS)
+        self.json_data = tuple(api_class.VALID_JSON_DATA)
+        self.invalid_name_characters = invalid_characters(
+            api_class.VALID_CHARACTERS_FOR_NAME
+        )
+        # record_type() namedtuples, keyed by their fields.
+        self.records = {}
+
+
 class APIClassTemplate(object):
     """The base framework for all/(most of) the objects in the FMC."""
 
@@ -26,6 +62,8 @@ class APIClassTemplate(object):
     VALID_JSON_DATA = []
     VALID_GET_FILTERS = []
     GLOBAL_VALID_FOR_KWARGS = ["dry_run"]
+    # Fields the FMC returns for each item of a non-expanded listing.
+    LISTING_FIELDS = ["id", "name", "type", "links"]
     VALID_FOR_KWARGS = VALID_JSON_DATA + []
 
     @property
@@ -46,7 +84,7 @@ class APIClassTemplate(object):
         :return: None
         """
         logging.debug("In __init__() for APIClassTemplate class.")
-        self.VALID_FOR_KWARGS = self.VALID_FOR_KWARGS + self.GLOBAL_VALID_FOR_KWARGS
+        self.VALID_FOR_KWARGS = self.schema().valid_for_kwargs
         self.fmc = fmc
         self.limit = self.fmc.limit
         self.description = "Created by fmcapi."
@@ -55,13 +93,55 @@ class APIClassTemplate(object):
         self.expanded = False
         self.get_filters = {}
         self.URL = f"{self.fmc.configuration_url}{self.URL_SUFFIX}"
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
-            logging.warning(
-                f"This API feature was released in version {self.FIRST_SUPPORTED_FMC_VERSION}.  "
-                f"Your FMC version is {self.fmc.serverVersion}.  Upgrade to use this feature."
+        # Warns, once per class, if this FMC's version lacks the feature.
+        self.fmc.supports(type(self))
+
+    @classmethod
+    def schema(cls):
+        """
+        Get the ClassSchema of this class, built the first time it is needed.
+
+        :return: (ClassSchema)
+        """
+        schema = cls.__dict__.get("_schema")
+        if schema is None:
+            schema = ClassSchema(cls)
+            cls._schema = schema
+        return schema
+
+    @classmethod
+    def record_type(cls, fields=None):
+        """
+        Get a compact, immutable record type (namedtuple) for items of this class.
+
+        Records have no per instance __dict__ so holding a large listing as records takes a fraction of the memory of
+        dicts or APIClassTemplate objects.  Fields that aren't valid identifiers are renamed _0, _1, etc.
+
+        :param fields: (list) Keys of the record.  (Default is None, use VALID_JSON_DATA)
+        :return: (class) namedtuple
+        """
+        schema = cls.schema()
+        fields = schema.json_data if fields is None else tuple(fields)
+        record = schema.records.get(fields)
+        if record is None:
+            record = collections.namedtuple(
+                f"{cls.__name__}Record", fields, rename=True
             )
+            schema.records[fields] = record
+        return record
+
+    @classmethod
+    def to_records(cls, items, fields=None):
+        """
+        Convert items of a listing to records.  Missing keys are None.
+
+        :param items: (list) Items of a listing.
+        :param fields: (list) Keys to keep.  (Default is None, use VALID_JSON_DATA)
+        :return: (list) records, see record_type().
+        """
+        make = cls.record_type(fields)._make
+        keys = cls.schema().json_data if fields is None else tuple(fields)
+        return [make(map(item.get, keys)) for item in items]
 
     def format_data(self, filter_query=""):
         """
@@ -89,16 +169,15 @@ class APIClassTemplate(object):
         :return: None
         """
         logging.debug("In parse_kwargs() for APIClassTemplate class.")
-        for key_value in self.VALID_FOR_KWARGS:
-            if key_value in kwargs:
-                if key_value in self.VALID_GET_FILTERS:
-                    self.get_filters[key_value] = kwargs[key_value]
+        schema = self.schema()
+        for key_value, value in kwargs.items():
+            if key_value in schema.kwargs:
+                if key_value in schema.get_filters:
+                    self.get_filters[key_value] = value
                 else:
-                    self.__dict__[key_value] = kwargs[key_value]
+                    self.__dict__[key_value] = value
         if "name" in kwargs:
-            self.name = syntax_correcter(
-                kwargs["name"], permitted_syntax=self.VALID_CHARACTERS_FOR_NAME
-            )
+            self.name = schema.invalid_name_characters.sub("_", kwargs["name"])
             if self.name != kwargs["name"]:
                 logging.info(
                     f"Adjusting name '{kwargs['name']}' to '{self.name}' due to invalid characters."
@@ -139,13 +218,14 @@ class APIClassTemplate(object):
         :param: expanded=Bool
         :param: unusedOnly=Bool
         :param: nameOrValue=String
+        :param: fields=List of item keys to keep when listing.  Listings only asking for LISTING_FIELDS are fetched
+                without "expanded=true", which is far smaller.
         :return: requests response
         """
         logging.debug("In get() for APIClassTemplate class.")
+        fields = kwargs.pop("fields", None)
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support GET of this feature."
             )
@@ -190,15 +270,26 @@ class APIClassTemplate(object):
                         f'GET success. Object with id: "{self.id}" fetched from FMC.'
                     )
             elif "name" in self.__dict__:
-                if self.FILTER_BY_NAME:
-                    url = f"{self.URL}?name={self.name}&expanded=true"
-                else:
-                    url = f"{self.URL}?expanded=true"
-                    if "limit" in self.__dict__:
-                        url = f"{url}&limit={self.limit}"
-                    if "offset" in self.__dict__:
-                        url = f"{url}&offset={self.offset}"
-                response = self.fmc.send_to_api(method="get", url=url)
+                response = None
+                url = self.name_filter_url()
+                if url is not None:
+                    response = self.fmc.send_to_api(method="get", url=url)
+                    if not response:
+                        logging.info(
+                            f"Filtered GET for {self.name} failed.  Falling back to a full listing."
+                        )
+                if not response:
+                    if self.FILTER_BY_NAME:
+                        url = f"{self.URL}?name={self.name}&expanded=true"
+                    else:
+                        url = f"{self.URL}?expanded=true"
+                        if "limit" in self.__dict__:
+                            url = f"{url}&limit={self.limit}"
+                        if "offset" in self.__dict__:
+                            url = f"{url}&offset={self.offset}"
+                    response = self.fmc.send_to_api(method="get", url=url)
+                if not response:
+                    response = {}
                 if "items" not in response:
                     response["items"] = []
                 for item in response["items"]:
@@ -217,22 +308,16 @@ class APIClassTemplate(object):
                         )
                 if "id" not in self.__dict__:
                     logging.warning(f"\tGET query for {self.name} is not found.")
-                    logging.debug(
-                        f"\tGET query for {self.name} is not found.\n\t\tResponse: {json.dumps(response)}"
-                    )
-            elif len(self.get_filters) > 0:
-                url_filter = ""
-                for key, value in self.get_filters.items():
-                    # Filter value must not be empty otherwise will result in a 400 response
-                    if value != "":
-                        url_filter += f"{key}%3A{value};"
-                    else:
-                        logging.warning(
-                            f"Terminating GET - {self.URL}?expanded={self.expanded}&filter={url_filter}"
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(
+                            "\tGET query for %s is not found.\n\t\tResponse: %s",
+                            self.name,
+                            json.dumps(response),
                         )
-                        logging.warning(f"{key} MUST have a non empty value")
-                        return False
-                url = f"{self.URL}?expanded={self.expanded}&filter={url_filter}"
+            elif len(self.get_filters) > 0:
+                url = self.collection_url(fields=fields)
+                if url is None:
+                    return False
                 if self.dry_run:
                     logging.info(
                         "Dry Run enabled.  Not actually sending to FMC.  Here is what would have been sent:"
@@ -247,6 +332,7 @@ class APIClassTemplate(object):
                     )
                     return response
                 else:
+                    response["items"] = self.project_fields(response["items"], fields)
                     response_count = response.get("paging").get("count")
                     logging.info(
                         f"GET success. {response_count} items found that match query filter: {self.get_filters}"
@@ -257,10 +343,7 @@ class APIClassTemplate(object):
                     "GET query for object with no name or id set.  "
                     "Returning full list of these object types instead."
                 )
-                url_suffix_start = "?"
-                if url_suffix_start in self.URL:
-                    url_suffix_start = "&"
-                url = f"{self.URL}{url_suffix_start}expanded=true&limit={self.limit}"
+                url = self.collection_url(fields=fields)
                 if self.dry_run:
                     logging.info(
                         "Dry Run enabled.  Not actually sending to FMC.  Here is what would have been sent:"
@@ -269,6 +352,8 @@ class APIClassTemplate(object):
                     logging.info(f"\tURL = {self.URL}")
                     return False
                 response = self.fmc.send_to_api(method="get", url=url)
+                if response and "items" in response:
+                    response["items"] = self.project_fields(response["items"], fields)
             if "items" not in response:
                 response["items"] = []
             return response
@@ -278,6 +363,131 @@ class APIClassTemplate(object):
             )
             return False
 
+    def name_filter_url(self):
+        """
+        Build a URL that asks the FMC to return only the objects matching self.name.
+
+        Used by get() when only a name is known so that a single object lookup costs one small request rather than
+        a download of the whole collection.  nameOrValue also matches partial names and values, get() still picks
+        the exact match out of the items returned.
+
+        :return: (str) url or None if this object type can't be filtered by name
+        """
+        logging.debug("In name_filter_url() for APIClassTemplate class.")
+        if self.FILTER_BY_NAME or "nameOrValue" not in self.VALID_GET_FILTERS:
+            return None
+        name = quote(self.name, safe="")
+        return f"{self.URL}?expanded=true&filter=nameOrValue%3A{name}&limit={self.limit}"
+
+    def collection_url(self, fields=None):
+        """
+        Build the URL used to list this object type, honoring any get_filters.
+
+        :param fields: (list) Item keys the caller needs.  If they are all in LISTING_FIELDS the listing is not
+                       expanded.
+        :return: (str) url or None if a get_filter is empty
+        """
+        logging.debug("In collection_url() for APIClassTemplate class.")
+        expanded = "true"
+        if fields is not None and set(fields) <= set(self.LISTING_FIELDS):
+            expanded = "false"
+        if len(self.get_filters) > 0:
+            if fields is None:
+                expanded = self.expanded
+            url_filter = ""
+            for key, value in self.get_filters.items():
+                # Filter value must not be empty otherwise will result in a 400 response
+                if value != "":
+                    url_filter += f"{key}%3A{value};"
+                else:
+                    logging.warning(
+                        f"Terminating GET - {self.URL}?expanded={self.expanded}&filter={url_filter}"
+                    )
+                    logging.warning(f"{key} MUST have a non empty value")
+                    return None
+            return f"{self.URL}?expanded={expanded}&filter={url_filter}"
+        url_suffix_start = "?"
+        if url_suffix_start in self.URL:
+            url_suffix_start = "&"
+        return f"{self.URL}{url_suffix_start}expanded={expanded}&limit={self.limit}"
+
+    @staticmethod
+    def project_fields(items, fields=None):
+        """
+        Trim each item down to the requested keys.
+
+        :param items: (list) Items of a listing.
+        :param fields: (list) Keys to keep.  None keeps everything.
+        :return: (list) items
+        """
+        if fields is None:
+            return items
+        return [{key: item[key] for key in fields if key in item} for item in items]
+
+    def iter_pages(self, **kwargs):
+        """
+        Generator version of a full listing get().  Yield each page of results as soon as the FMC returns it.
+
+        Only one page of items is held in memory at a time so very large collections can be processed
+        with constant memory.  Any get_filters passed in kwargs are honored, as is "fields" (see get()).
+
+        :return: (generator) JSON response of each page
+        """
+        logging.debug("In iter_pages() for APIClassTemplate class.")
+        fields = kwargs.pop("fields", None)
+        self.parse_kwargs(**kwargs)
+        if not self.fmc.supports(type(self)):
+            logging.error(
+                f"Your FMC version, {self.fmc.serverVersion} does not support GET of this feature."
+            )
+            return
+        if not self.valid_for_get():
+            logging.warning(
+                "iter_pages() method failed due to failure to pass valid_for_get() test."
+            )
+            return
+        url = self.collection_url(fields=fields)
+        if url is None:
+            return
+        if self.dry_run:
+            logging.info(
+                "Dry Run enabled.  Not actually sending to FMC.  Here is what would have been sent:"
+            )
+            logging.info("\tMethod = GET")
+            logging.info(f"\tURL = {url}")
+            return
+        for page in self.fmc.iter_pages(url=url):
+            if "items" in page:
+                page["items"] = self.project_fields(page["items"], fields)
+            yield page
+
+    def iter_items(self, **kwargs):
+        """
+        Generator version of a full listing get().  Yield each item of this object type one at a time.
+
+        :return: (generator) items
+        """
+        logging.debug("In iter_items() for APIClassTemplate class.")
+        for page in self.iter_pages(**kwargs):
+            for item in page.get("items", []):
+                yield item
+
+    def iter_records(self, **kwargs):
+        """
+        Generator version of a full listing get() that yields records instead of dicts.
+
+        Takes the same arguments as iter_items().  "fields" picks the fields of the records (Default is
+        VALID_JSON_DATA).
+
+        :return: (generator) records, see record_type().
+        """
+        logging.debug("In iter_records() for APIClassTemplate class.")
+        fields = kwargs.pop("fields", None)
+        keys = self.schema().json_data if fields is None else tuple(fields)
+        make = self.record_type(keys)._make
+        for item in self.iter_items(fields=list(keys), **kwargs):
+            yield make(map(item.get, keys))
+
     def valid_for_post(self):
         """
         Use REQUIRED_FOR_POST to ensure all necessary variables exist prior to submitting to API.
@@ -312,9 +522,7 @@ class APIClassTemplate(object):
         """
         logging.debug("In post() for APIClassTemplate class.")
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support POST of this feature."
             )
@@ -347,6 +555,7 @@ class APIClassTemplate(object):
                         method="post", url=url, json_data=self.format_data()
                     )
                 if response:
+                    self.update_catalog(response)
                     self.parse_kwargs(**response)
                     if "name" in self.__dict__ and "id" in self.__dict__:
                         logging.info(
@@ -370,6 +579,28 @@ class APIClassTemplate(object):
                 )
                 return False
 
+    def update_catalog(self, response, deleted=False):
+        """
+        Keep the FMC's object catalog in step with a successful POST, PUT or DELETE.
+
+        :param response: (dict) FMC response to the request.
+        :param deleted: (bool) True if the object(s) were deleted.
+        :return: None
+        """
+        catalog = getattr(self.fmc, "catalog", None)
+        if catalog is None or not isinstance(response, dict):
+            return
+        if deleted:
+            if "bulk_delete_data" in self.__dict__:
+                ids = list(self.bulk_delete_data)
+            else:
+                ids = [response.get("id", self.__dict__.get("id"))]
+            catalog.discard_many(ids)
+        elif "items" in response and "bulk_post_data" in self.__dict__:
+            catalog.store_many(response["items"])
+        else:
+            catalog.store(response)
+
     def valid_for_put(self):
         """
         Use REQUIRED_FOR_PUT to ensure all necessary variables exist prior to submitting to API.
@@ -391,9 +622,7 @@ class APIClassTemplate(object):
         """
         logging.debug("In put() for APIClassTemplate class.")
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support PUT of this feature."
             )
@@ -411,6 +640,7 @@ class APIClassTemplate(object):
             response = self.fmc.send_to_api(
                 method="put", url=url, json_data=self.format_data()
             )
+            self.update_catalog(response)
             self.parse_kwargs(**response)
             if "name" in self.__dict__:
                 logging.info(
@@ -457,9 +687,7 @@ class APIClassTemplate(object):
         """
         logging.debug("In delete() for APIClassTemplate class.")
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support DELETE of this feature."
             )
@@ -488,6 +716,7 @@ class APIClassTemplate(object):
             )
             if not response:
                 return None
+            self.update_catalog(response, deleted=True)
             self.parse_kwargs(**response)
             if hasattr(self, "name"):
                 logging.info(
@@ -534,28 +763,24 @@ class APIClassTemplate(object):
         """
         This is a shim in front of the normal delete() to handle bulk deletes.
 
+        Pass max_workers to delete that many chunks in parallel (default is fmc.max_workers).  Chunks that fail are
+        listed in self.bulk_errors.
         """
         logging.debug("In bulk_delete() for APIClassTemplate class.")
+        max_workers = kwargs.pop("max_workers", self.fmc.max_workers)
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support bulk DELETE of this feature."
             )
             return False
         if self.valid_for_bulk_delete():
+            self.bulk_errors = []
             if len(self.bulk) > 0:
-                if len(self.bulk) > 49:
-                    self.chunks = bulk_list_splitter(self.bulk)
-                    for chunk in self.chunks:
-                        self.bulk_delete_data = chunk
-                        # self.ids_str = ','.join(map(str,self.ids))
-                        APIClassTemplate.delete(self)
-                else:
-                    self.bulk_delete_data = self.bulk
-                    # self.ids_str = ','.join(map(str,self.ids))
-                    APIClassTemplate.delete(self)
+                self.chunks = bulk_list_splitter(self.bulk)
+                self.dispatch_chunks(
+                    APIClassTemplate.delete, "bulk_delete_data", max_workers
+                )
 
     def valid_for_bulk_post(self):
         """
@@ -575,30 +800,144 @@ class APIClassTemplate(object):
         """
         This is a shim in front of the normal post() to handle bulk posts.
 
+        Pass max_workers to post that many chunks in parallel (default is fmc.max_workers).  The ids created are
+        listed in self.bulk_ids in the order of self.bulk and chunks that fail are listed in self.bulk_errors.
         """
         logging.debug("In bulk_post() for APIClassTemplate class.")
+        max_workers = kwargs.pop("max_workers", self.fmc.max_workers)
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support bulk POST of this feature."
             )
             return False
         if self.valid_for_bulk_post():
             self.bulk_ids = []
+            self.bulk_errors = []
             if len(self.bulk) > 0:
-                if len(self.bulk) > 49:
-                    self.chunks = bulk_list_splitter(self.bulk)
-                    for chunk in self.chunks:
-                        self.bulk_post_data = chunk
-                        response = APIClassTemplate.post(self)
-                        if response is not None:
-                            for i in response["items"]:
-                                self.bulk_ids.append(i["id"])
-                else:
-                    self.bulk_post_data = self.bulk
-                    response = APIClassTemplate.post(self)
-                    if response is not None:
+                self.chunks = bulk_list_splitter(self.bulk)
+                responses = self.dispatch_chunks(
+                    APIClassTemplate.post, "bulk_post_data", max_workers
+                )
+                for response in responses:
+                    if response:
                         for i in response["items"]:
                             self.bulk_ids.append(i["id"])
+
+    def dispatch_chunks(self, method, data_attribute, max_workers=1):
+        """
+        Call method once for each of self.chunks, with up to max_workers calls running at the same time.
+
+        Each call gets its own shallow copy of self with the chunk stored in data_attribute, so parallel calls
+        don't share state.  Requests still go through the FMC rate limiter.  Failed chunks are added to
+        self.bulk_errors.
+
+        :param method: (function) Unbound method taking the object, e.g. APIClassTemplate.post.
+        :param data_attribute: (str) Attribute the chunk is passed in, e.g. "bulk_post_data".
+        :param max_workers: (int) Maximum number of chunks sent in parallel.
+        :return: (list) Response of each chunk, in the order of self.chunks.  None for failed chunks, including
+        chunks that failed validation.
+        """
+        logging.debug("In dispatch_chunks() for APIClassTemplate class.")
+
+        def send(chunk):
+            worker = copy.copy(self)
+            setattr(worker, data_attribute, chunk)
+            try:
+                return method(worker), None
+            except Exception as e:
+                logging.error(f"Sending bulk chunk failed: {e}")
+                return None, str(e)
+
+        max_workers = max(1, min(max_workers or 1, len(self.chunks)))
+        if max_workers == 1:
+            results = [send(chunk) for chunk in self.chunks]
+        else:
+            logging.info(
+                f"Sending {len(self.chunks)} chunks with up to {max_workers} parallel requests."
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(send, self.chunks))
+        responses = []
+        for index, (chunk, (response, error)) in enumerate(zip(self.chunks, results)):
+            # post() and put() return False for chunks that fail validation, send_to_api() None for failed requests.
+            if not isinstance(response, dict) and not self.dry_run:
+                logging.warning(f"Chunk {index} of {len(self.chunks)} failed.")
+                if error is None:
+                    error = f"No data in API response. ({method.__name__}() returned {response!r})"
+                self.bulk_errors.append(
+                    {"chunk": index, "items": chunk, "error": error}
+                )
+                response = None
+            responses.append(response)
+        return responses
+
+    async def _run_async(self, method, **kwargs):
+        """
+        Run one of the (blocking) CRUD methods in a worker thread so it can be awaited.
+
+        With an AsyncFMC the requests themselves are then sent from the event loop.
+
+        :param method: Bound method to run.
+        :return: Return value of method.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.fmc.executor, functools.partial(method, **kwargs)
+        )
+
+    async def aget(self, **kwargs):
+        """
+        Async version of get().
+
+        :return: requests response
+        """
+        logging.debug("In aget() for APIClassTemplate class.")
+        return await self._run_async(self.get, **kwargs)
+
+    async def apost(self, **kwargs):
+        """
+        Async version of post().
+
+        :return: requests response
+        """
+        logging.debug("In apost() for APIClassTemplate class.")
+        return await self._run_async(self.post, **kwargs)
+
+    async def aput(self, **kwargs):
+        """
+        Async version of put().
+
+        :return: requests response
+        """
+        logging.debug("In aput() for APIClassTemplate class.")
+        return await self._run_async(self.put, **kwargs)
+
+    async def adelete(self, **kwargs):
+        """
+        Async version of delete().
+
+        :return: requests response
+        """
+        logging.debug("In adelete() for APIClassTemplate class.")
+        return await self._run_async(self.delete, **kwargs)
+
+    async def abulk_post(self, **kwargs):
+        """
+        Async version of bulk_post().
+
+        :return: None
+        """
+        logging.debug("In abulk_post() for APIClassTemplate class.")
+        return await self._run_async(self.bulk_post, **kwargs)
+
+    async def abulk_delete(self, **kwargs):
+        """
+        Async version of bulk_delete().
+
+        :return: None
+        """
+        logging.debug("In abulk_delete() for APIClassTemplate class.")
+        return await self._run_async(self.bulk_delete, **kwargs)
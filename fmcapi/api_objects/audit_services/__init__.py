@@ -1,8 +1,15 @@
 """Audit Services Classes."""
 
 import logging
-from .audit_records import AuditRecords
+from ..helper_functions import lazy_import
 
 logging.debug("In the audit_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "AuditRecords": ".audit_records",
+}
+
 __all__ = ["AuditRecords"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -1,8 +1,15 @@
 """Backup Services Classes."""
 
 import logging
-from .backup import Backup
+from ..helper_functions import lazy_import
 
 logging.debug("In the backup_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "Backup": ".backup",
+}
+
 __all__ = ["Backup"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -1,9 +1,17 @@
 """Deployment Services Classes."""
 
 import logging
-from .deployabledevices import DeployableDevices
-from .deploymentrequests import DeploymentRequests
+from ..helper_functions import lazy_import
 
 logging.debug("In the deployment_services __init__.py file.")
 
-__all__ = ["DeployableDevices", "DeploymentRequests"]
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "DeployableDevices": ".deployabledevices",
+    "DeploymentRequests": ".deploymentrequests",
+    "DeploymentPipeline": ".deploymentpipeline",
+}
+
+__all__ = ["DeployableDevices", "DeploymentRequests", "DeploymentPipeline"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -18,20 +18,25 @@ class DeployableDevices(
         "/deployment/deployabledevices/{containerUUID}/pendingchanges"
     )
 
-    def __init__(self, fmc):
+    def __init__(self, fmc, wait_time=None):
         """
         Initialize DeployableDevices object.
 
         :param fmc (object): FMC object
+        :param wait_time (int): Seconds to wait for the FMC to update the list of deployable devices.  (Default is
+        None, use fmc.wait_time)
         :return: None
         """
         logging.debug("In __init__ for DeployableDevices() class.")
 
         self.fmc = fmc
-        logging.info(
-            f"Waiting {self.fmc.wait_time} seconds to allow the FMC to update the list of deployable devices."
-        )
-        time.sleep(self.fmc.wait_time)
+        if wait_time is None:
+            wait_time = self.fmc.wait_time
+        if wait_time:
+            logging.info(
+                f"Waiting {wait_time} seconds to allow the FMC to update the list of deployable devices."
+            )
+            time.sleep(wait_time)
         self.URL = f"{self.fmc.configuration_url}{self.URL_SUFFIX}?expanded=true"
 
     def get(self, containerUUID=None):
@@ -40,7 +45,7 @@ class DeployableDevices(
         or for pending changes for a specific device/container.
 
         :param containerUUID (str, optional): UUID of the device/container for pending changes endpoint.
-        :return: (list or dict) uuids or pending changes
+        :return: (list or dict) uuids or pending changes.  None if the request failed.
         """
         if containerUUID:
             url = f"{self.fmc.configuration_url}{self.PENDING_CHANGES_SUFFIX.format(containerUUID=containerUUID)}?expanded=true"
@@ -57,10 +62,11 @@ class DeployableDevices(
             logging.info("Getting a list of deployable devices.")
             response = self.fmc.send_to_api(method="get", url=self.URL)
             # Now to parse the response list to get the UUIDs of each device.
-            if "items" not in response:
+            if response is None:
                 return
             uuids = []
-            for item in response["items"]:
+            # The FMC leaves "items" out when no device needs deployed.
+            for item in response.get("items", []):
                 if not item["canBeDeployed"]:
                     pass
                 else:
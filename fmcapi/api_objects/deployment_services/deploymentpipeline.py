@@ -0,0 +1,209 @@
+"""Deploy pending changes and follow the deployment until the FMC reports it finished."""
+
+import logging
+import time
+from .deployabledevices import DeployableDevices
+from .deploymentrequests import DeploymentRequests
+from fmcapi.api_objects.status_services import TaskTracker
+
+
+class DeploymentPipeline(object):
+    """
+    Wait for the list of deployable devices to settle, deploy to them and track the deployment task to completion.
+
+    Unlike DeploymentRequests.post() this doesn't sleep a fixed time before looking for deployable devices and
+    doesn't return until the FMC has finished the deployment (or timeout is reached).
+    """
+
+    POLL_INTERVAL = 1
+    MAX_POLL_INTERVAL = 15
+    BACKOFF_FACTOR = 2
+
+    def __init__(
+        self,
+        fmc,
+        device_names=None,
+        force_deploy=True,
+        ignore_warning=True,
+        settle_time=None,
+        timeout=1800,
+        settle_timeout=600,
+    ):
+        """
+        Initialize DeploymentPipeline object.
+
+        :param fmc (object): FMC object
+        :param device_names (list): Names of the devices to deploy to.  (Default is None, all deployable devices)
+        :param force_deploy (bool): Deploy even if the FMC thinks nothing changed.  (Default is True)
+        :param ignore_warning (bool): Deploy despite warnings.  (Default is True)
+        :param settle_time (int): Seconds to keep looking for deployable devices while the FMC reports none.
+        (Default is None, use fmc.wait_time)
+        :param timeout (int): Seconds to wait for the deployment to finish.  (Default is 1800)
+        :param settle_timeout (int): Seconds to wait for the list of deployable devices to stop changing.
+        (Default is 600)
+        :return: None
+        """
+        logging.debug("In __init__ for DeploymentPipeline() class.")
+
+        self.fmc = fmc
+        self.device_names = device_names
+        self.force_deploy = force_deploy
+        self.ignore_warning = ignore_warning
+        self.settle_time = fmc.wait_time if settle_time is None else settle_time
+        self.timeout = timeout
+        self.settle_timeout = settle_timeout
+        self.request = None
+        self.task = None
+        self.status = None
+        self.devices = {}
+        self.task_future = None
+
+    def backoff(self):
+        """
+        Generate the seconds to wait between two polls: POLL_INTERVAL growing by BACKOFF_FACTOR up to
+        MAX_POLL_INTERVAL.
+
+        :return: (generator) seconds
+        """
+        delay = self.POLL_INTERVAL
+        while True:
+            yield delay
+            delay = min(delay * self.BACKOFF_FACTOR, self.MAX_POLL_INTERVAL)
+
+    def wait_for_deployable_devices(self):
+        """
+        Poll the list of deployable devices until two polls in a row agree.
+
+        An empty list is only trusted once settle_time has passed, as the FMC takes a few seconds to notice changes.
+        Sets self.status to "FAILED" if the list can't be read and to "TIMEOUT" if it is still changing after
+        settle_timeout.
+
+        :return: (list) Deployable devices, as returned by DeployableDevices.get().  None on failure.
+        """
+        logging.debug("In wait_for_deployable_devices() for DeploymentPipeline class.")
+        deployable = DeployableDevices(fmc=self.fmc, wait_time=0)
+        start = time.monotonic()
+        deadline = start + self.settle_time
+        give_up = start + self.settle_timeout
+        previous = None
+        for delay in self.backoff():
+            devices = deployable.get()
+            now = time.monotonic()
+            if devices is None:
+                logging.error("Getting the list of deployable devices failed.")
+                self.status = "FAILED"
+                return None
+            current = {device["device"]["id"]: device["version"] for device in devices}
+            if current == previous and (current or now >= deadline):
+                return devices
+            if now >= give_up:
+                logging.warning(
+                    f"The list of deployable devices still changed after {self.settle_timeout} seconds."
+                )
+                self.status = "TIMEOUT"
+                return None
+            previous = current
+            logging.info(
+                f"{len(devices)} deployable devices found.  Checking again in {delay} seconds."
+            )
+            time.sleep(min(delay, give_up - now))
+
+    def submit(self, deployable_devices):
+        """
+        Send the deployment request.
+
+        :param deployable_devices (list): Devices returned by wait_for_deployable_devices().
+        :return: (dict) Response from the FMC or None if there was nothing to deploy.
+        """
+        logging.debug("In submit() for DeploymentPipeline class.")
+        request = DeploymentRequests(fmc=self.fmc)
+        request.forceDeploy = self.force_deploy
+        request.ignoreWarning = self.ignore_warning
+        if self.device_names is not None:
+            request.deploy_all = False
+            request.deploy_device_names = self.device_names
+        self.request = request.build_request(deployable_devices)
+        if self.request is None:
+            return
+        self.devices = {
+            device["device"]["id"]: {"name": device["name"], "status": "PENDING"}
+            for device in request.uuids
+        }
+        logging.info(f"Deploying changes to {len(self.devices)} devices.")
+        response = self.fmc.send_to_api(
+            method="post", url=request.URL, json_data=self.request
+        )
+        if response:
+            self.task = response.get("metadata", {}).get("task")
+        return response
+
+    def wait_for_task(self):
+        """
+        Track the deployment task with fmc.task_tracker until it succeeds, fails or timeout is reached.
+
+        :return: (str) Final task status, "TIMEOUT" if it didn't finish in time.
+        """
+        logging.debug("In wait_for_task() for DeploymentPipeline class.")
+        self.task_future = self.fmc.task_tracker.track(self.task, timeout=self.timeout)
+        return self.task_future.result()["status"]
+
+    def update_device_status(self):
+        """
+        Set the status of each device deployed to.  Devices still waiting for the version deployed are not done.
+
+        :return: None
+        """
+        logging.debug("In update_device_status() for DeploymentPipeline class.")
+        devices = DeployableDevices(fmc=self.fmc, wait_time=0).get()
+        failed = self.status.upper() not in TaskTracker.SUCCESS_STATES
+        if devices is None:
+            logging.warning(
+                "Getting the list of deployable devices failed.  Using the task status for every device."
+            )
+            for device in self.devices.values():
+                device["status"] = "FAILED" if failed else "DEPLOYED"
+            return
+        pending = {device["device"]["id"]: int(device["version"]) for device in devices}
+        version = int(self.request["version"])
+        for device_id, device in self.devices.items():
+            if device_id in pending and pending[device_id] <= version:
+                device["status"] = "FAILED" if failed else "PENDING"
+            else:
+                device["status"] = "DEPLOYED"
+
+    def deploy(self):
+        """
+        Run the whole pipeline: wait for deployable devices, deploy and wait for the deployment to finish.
+
+        :return: (dict) {"status": task status, "task": task, "devices": {device id: {"name", "status"}}}
+        """
+        logging.debug("In deploy() for DeploymentPipeline class.")
+        deployable_devices = self.wait_for_deployable_devices()
+        if deployable_devices is None:
+            return {"status": self.status, "task": self.task, "devices": self.devices}
+        response = self.submit(deployable_devices)
+        if self.request is None:
+            self.status = "NOTHING_TO_DEPLOY"
+        elif not response:
+            self.status = "FAILED"
+            for device in self.devices.values():
+                device["status"] = "FAILED"
+        elif not self.task:
+            logging.warning("The FMC didn't return a task to track this deployment.")
+            self.status = "SUBMITTED"
+        else:
+            self.status = self.wait_for_task()
+            self.update_device_status()
+        return {"status": self.status, "task": self.task, "devices": self.devices}
+
+    async def adeploy(self):
+        """
+        Async version of deploy().  The pipeline runs in a worker thread.
+
+        :return: (dict) See deploy().
+        """
+        logging.debug("In adeploy() for DeploymentPipeline class.")
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.fmc.executor, self.deploy)
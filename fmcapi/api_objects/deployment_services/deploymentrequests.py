@@ -45,6 +45,25 @@ class DeploymentRequests(
         """
         logging.debug("In post() method for DeploymentRequests() class.")
 
+        devices = DeployableDevices(fmc=self.fmc)
+        json_data = self.build_request(devices.get())
+        if json_data is None:
+            return
+        logging.info("Deploying changes to devices.")
+        response = self.fmc.send_to_api(
+            method="post", url=self.URL, json_data=json_data
+        )
+        return response
+
+    def build_request(self, deployable_devices):
+        """
+        Build the deployment request for the deployable devices selected by deploy_all/deploy_device_names.
+
+        :param deployable_devices (list): Items returned by DeployableDevices.get().
+        :return: (dict) json_data or None if there is nothing to deploy.
+        """
+        logging.debug("In build_request() method for DeploymentRequests() class.")
+
         json_data = {
             "type": "DeploymentRequest",
             "forceDeploy": self.forceDeploy,
@@ -53,8 +72,7 @@ class DeploymentRequests(
             "deviceList": [],
         }
 
-        devices = DeployableDevices(fmc=self.fmc)
-        self.uuids = devices.get()
+        self.uuids = deployable_devices
         if not self.uuids:
             logging.info("No devices need deployed.")
             return
@@ -86,11 +104,7 @@ class DeploymentRequests(
             if int(json_data["version"]) > int(device["version"]):
                 logging.info(f"Updating version to {device['version']}")
                 json_data["version"] = device["version"]
-        logging.info("Deploying changes to devices.")
-        response = self.fmc.send_to_api(
-            method="post", url=self.URL, json_data=json_data
-        )
-        return response
+        return json_data
 
     def put(self):
         """PUT method for API for DeploymentRequests not supported."""
@@ -1,8 +1,15 @@
 """Device Cluster Classes."""
 
 import logging
-from .ftddevicecluster import FTDDeviceCluster
+from ..helper_functions import lazy_import
 
 logging.debug("In the device_clusters __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "FTDDeviceCluster": ".ftddevicecluster",
+}
+
 __all__ = ["FTDDeviceCluster"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -1,10 +1,17 @@
 """Device Group Services Classes."""
 
 import logging
-from .devicegrouprecords import DeviceGroupRecords
+from ..helper_functions import lazy_import
 
 logging.debug("In the device_group_services __init__.py file.")
 
-__all__: [
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "DeviceGroupRecords": ".devicegrouprecords",
+}
+
+__all__ = [
     "DeviceGroupRecords",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
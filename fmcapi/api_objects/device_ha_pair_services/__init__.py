@@ -1,14 +1,21 @@
 """Device HA Pair Services Classes."""
 
 import logging
-from .ftddevicehapairs import FTDDeviceHAPairs
-from .failoverinterfacemacaddressconfigs import FailoverInterfaceMACAddressConfigs
-from .monitoredinterfaces import MonitoredInterfaces
+from ..helper_functions import lazy_import
 
 logging.debug("In the device_ha_pair_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "FTDDeviceHAPairs": ".ftddevicehapairs",
+    "FailoverInterfaceMACAddressConfigs": ".failoverinterfacemacaddressconfigs",
+    "MonitoredInterfaces": ".monitoredinterfaces",
+}
+
 __all__ = [
     "FTDDeviceHAPairs",
     "FailoverInterfaceMACAddressConfigs",
     "MonitoredInterfaces",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
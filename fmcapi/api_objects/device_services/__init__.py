@@ -1,20 +1,27 @@
 """Device Services Classes."""
 
 import logging
-from .bridgegroupinterfaces import BridgeGroupInterfaces
-from .devicerecords import DeviceRecords
-from .etherchannelinterfaces import EtherchannelInterfaces
-from .ipv4staticroutes import IPv4StaticRoutes
-from .ipv6staticroutes import IPv6StaticRoutes
-from .physicalinterfaces import PhysicalInterfaces
-from .redundantinterfaces import RedundantInterfaces
-from .staticroutes import StaticRoutes
-from .subinterfaces import SubInterfaces
+from ..helper_functions import lazy_import
 
 logging.debug("In the device_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "BridgeGroupInterfaces": ".bridgegroupinterfaces",
+    "DeviceRecords": ".devicerecords",
+    "DeviceOnboarding": ".deviceonboarding",
+    "EtherchannelInterfaces": ".etherchannelinterfaces",
+    "IPv4StaticRoutes": ".ipv4staticroutes",
+    "IPv6StaticRoutes": ".ipv6staticroutes",
+    "PhysicalInterfaces": ".physicalinterfaces",
+    "RedundantInterfaces": ".redundantinterfaces",
+    "StaticRoutes": ".staticroutes",
+    "SubInterfaces": ".subinterfaces",
+}
+
 __all__ = [
     "DeviceRecords",
+    "DeviceOnboarding",
     "StaticRoutes",
     "IPv4StaticRoutes",
     "IPv6StaticRoutes",
@@ -24,3 +31,5 @@ __all__ = [
     "EtherchannelInterfaces",
     "SubInterfaces",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,194 @@
+"""Register many devices at once and configure each one as soon as it is ready."""
+
+from concurrent.futures import ThreadPoolExecutor
+import concurrent.futures
+import logging
+import time
+from .devicerecords import DeviceRecords
+from fmcapi.api_objects.policy_assignment_services import PolicyAssignments
+
+
+class DeviceOnboarding(object):
+    """
+    Onboard several FTDs in parallel.
+
+    Registrations are submitted concurrently and each registration task is tracked by fmc.task_tracker.  As soon as
+    one device is registered, its follow-up steps (policy assignments, interfaces, routes, ...) run in a worker
+    thread, in the order they were given, while the other devices are still registering.
+    """
+
+    POLL_INTERVAL = 5
+    MAX_POLL_INTERVAL = 60
+    BACKOFF_FACTOR = 2
+
+    def __init__(
+        self, fmc, max_workers=4, registration_timeout=1800, ready_timeout=900
+    ):
+        """
+        Initialize DeviceOnboarding object.
+
+        :param fmc (object): FMC object
+        :param max_workers (int): Maximum registrations submitted, or devices configured, at the same time.
+        (Default is 4)
+        :param registration_timeout (int): Seconds to wait for a registration task.  (Default is 1800)
+        :param ready_timeout (int): Seconds to wait for a registered device to show up in the device list.
+        (Default is 900)
+        :return: None
+        """
+        logging.debug("In __init__() for DeviceOnboarding class.")
+        self.fmc = fmc
+        self.max_workers = max_workers
+        self.registration_timeout = registration_timeout
+        self.ready_timeout = ready_timeout
+        self.devices = []
+
+    def add(self, device, steps=None):
+        """
+        Queue a device for onboarding.
+
+        :param device: (DeviceRecords) Device ready to post, i.e. with hostName, regKey, acp() etc. set.
+        :param steps: (list) Functions called with the registered DeviceRecords (id filled in), one after the other.
+        :return: None
+        """
+        logging.debug("In add() for DeviceOnboarding class.")
+        self.devices.append(
+            {
+                "device": device,
+                "steps": steps or [],
+                "status": "QUEUED",
+                "steps_done": 0,
+                "error": None,
+            }
+        )
+
+    @staticmethod
+    def device_name(device):
+        """Name the device is registered under, the FMC uses hostName when no name is given."""
+        return getattr(device, "name", None) or device.hostName
+
+    @staticmethod
+    def policy_step(policy_type, name):
+        """
+        Build a step that assigns a policy to the device.
+
+        :param policy_type: (str) "accesspolicy" or "ftd_natpolicy"
+        :param name: (str) Name of the policy.
+        :return: (function) step
+        """
+
+        def step(device):
+            assignment = PolicyAssignments(fmc=device.fmc)
+            getattr(assignment, policy_type)(
+                name=name, devices=[{"name": device.name, "type": "device"}]
+            )
+            if not assignment.post():
+                raise RuntimeError(f"Assigning {policy_type} {name} failed.")
+
+        return step
+
+    def run(self):
+        """
+        Onboard all queued devices and wait until each one is done or failed.
+
+        :return: (list) One dict per device: {"name", "status", "steps_done", "error"}.  status is "ONBOARDED",
+        "REGISTRATION_FAILED", "NOT_READY" or "STEP_FAILED".
+        """
+        logging.debug("In run() for DeviceOnboarding class.")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            submitted = list(executor.map(self.register, self.devices))
+            registrations = {
+                future: entry
+                for entry, future in zip(self.devices, submitted)
+                if future is not None
+            }
+            # Workers only pick up a device once its registration finished, in whatever order that happens.
+            pipelines = [
+                executor.submit(self.finish, registrations[future], future)
+                for future in concurrent.futures.as_completed(registrations)
+            ]
+            concurrent.futures.wait(pipelines)
+        return [
+            {
+                "name": self.device_name(entry["device"]),
+                "status": entry["status"],
+                "steps_done": entry["steps_done"],
+                "error": entry["error"],
+            }
+            for entry in self.devices
+        ]
+
+    def register(self, entry):
+        """
+        Submit the registration of one device without waiting for it.
+
+        :param entry: (dict) Device entry created by add().
+        :return: (TaskFuture) Registration task or None if the registration was refused.
+        """
+        device = entry["device"]
+        logging.info(f"Registering {self.device_name(device)}.")
+        try:
+            response = device.post(
+                wait=False, post_wait_time=self.registration_timeout
+            )
+        except Exception as e:
+            response = None
+            entry["error"] = str(e)
+        if not response or device.task_future is None:
+            logging.warning(f"Registration of {self.device_name(device)} failed.")
+            entry["status"] = "REGISTRATION_FAILED"
+            return None
+        entry["status"] = "REGISTERING"
+        return device.task_future
+
+    def finish(self, entry, task_future):
+        """
+        Wait for a device's registration, then run its steps.
+
+        :param entry: (dict) Device entry created by add().
+        :param task_future: (TaskFuture) Registration task.
+        :return: None
+        """
+        name = self.device_name(entry["device"])
+        try:
+            task_future.result()
+        except Exception as e:
+            entry["error"] = str(e)
+        if not task_future.succeeded():
+            logging.warning(f"Registration of {name}: {task_future.status}.")
+            entry["status"] = "REGISTRATION_FAILED"
+            return
+        registered = self.wait_until_ready(name)
+        if registered is None:
+            entry["status"] = "NOT_READY"
+            return
+        for step in entry["steps"]:
+            try:
+                step(registered)
+            except Exception as e:
+                logging.error(f"Onboarding step for {name} failed: {e}")
+                entry["status"] = "STEP_FAILED"
+                entry["error"] = str(e)
+                return
+            entry["steps_done"] += 1
+        logging.info(f"{name} onboarded.")
+        entry["status"] = "ONBOARDED"
+
+    def wait_until_ready(self, name):
+        """
+        Poll the device list, with backoff, until the registered device shows up.
+
+        :param name: (str) Name of the device that was posted.
+        :return: (DeviceRecords) Registered device or None if it didn't show up within ready_timeout.
+        """
+        deadline = time.monotonic() + self.ready_timeout
+        delay = self.POLL_INTERVAL
+        while True:
+            registered = DeviceRecords(fmc=self.fmc)
+            registered.get(name=name)
+            if "id" in registered.__dict__:
+                return registered
+            if time.monotonic() + delay > deadline:
+                logging.warning(f"{name} isn't in the device list.")
+                return None
+            time.sleep(delay)
+            delay = min(delay * self.BACKOFF_FACTOR, self.MAX_POLL_INTERVAL)
@@ -2,7 +2,6 @@
 
 from fmcapi.api_objects.apiclasstemplate import APIClassTemplate
 from fmcapi.api_objects.policy_services.accesspolicies import AccessPolicies
-from fmcapi.api_objects.status_services import TaskStatuses
 import time
 import logging
 
@@ -157,7 +156,7 @@ class DeviceRecords(APIClassTemplate):
         :return: None
         """
         logging.debug("In tiering() for DeviceRecords class.")
-        if self.fmc.serverVersion < "7.0":
+        if not self.fmc.version_at_least("7.0"):
             logging.warning(
                 f"FTD performance tier licenses are supported only in FMC version 7.0 and newer."
             )
@@ -217,62 +216,65 @@ class DeviceRecords(APIClassTemplate):
                 f"Access Control Policy {name} not found.  Cannot set up accessPolicy for DeviceRecords."
             )
 
-    def wait_for_task(self, task, wait_time=10):
+    def wait_for_task(self, task, wait_time=10, timeout=None):
         """
         Pause configuration script and wait for device registration to complete.
 
+        Task Status for new device registration behaves differently than other tasks
+        On new device registration, a task is sent for the initial registration. After completion
+        the UUID is deleted without any change in task status. So we check to see if the object no longer exists
+        to assume the registration is complete.  After registration, discovery of the device begins, but there is
+        no way to check for this with a task status.  The device can't be modified during this time, but a new
+        device registration can begin.
+
+        OTOH, a device HA operation will update its status to "Success" on completion.  Hence the task is done
+        either way.
+
         :param task: (dict) task["id": (str)]
-        :param wait_time: (int) Seconds to wait before rechecking.
-        :return: None
+        :param wait_time: (int) Maximum seconds between two checks of the task.
+        :param timeout: (int) Seconds to wait for the task.  (Default is None, wait until it finishes)
+        :return: (dict) Last status of the task.
         """
-        task_completed_states = ["Success", "SUCCESS", "COMPLETED"]
-        try:
-            status = TaskStatuses(fmc=self.fmc, id=task["id"])
-            current_status = status.get()
-            """
-            Task Status for new device registration behaves differently than other tasks
-            On new device registration, a task is sent for the initial registration. After completion
-            the UUID is deleted without any change in task status. So we check to see if the object no longer exists
-            to assume the registration is complete.  After registration, discovery of the device begins, but there is
-            no way to check for this with a task status.  The device can't be modified during this time, but a new
-            device registration can begin.
-
-            OTOH, a device HA operation will update its status to "Success" on completion.  Hence the two different
-            checks.
-            """
-            while (
-                current_status["status"] is not None
-                and current_status["status"] not in task_completed_states
-            ):
-                # Lot of inconsistencies with the type of data a task can return
-                if "taskType" in current_status.keys():
-                    logging.info(
-                        f"Task: {current_status['taskType']} {current_status['status']} {current_status['id']}"
-                    )
-                    time.sleep(wait_time)
-                    current_status = status.get()
-                else:
-                    logging.info(
-                        f"Task: {current_status['status']} {current_status['id']}"
-                    )
-                    time.sleep(wait_time)
-                    current_status = status.get()
-            logging.info(f"Task: {current_status['status']} {current_status['id']}")
-        except Exception as e:
-            logging.info(type(e), e)
+        future = self.fmc.task_tracker.track(
+            task,
+            timeout=timeout,
+            done_when_missing=True,
+            max_poll_interval=wait_time,
+        )
+        return future.result()
 
     def post(self, **kwargs):
-        """POST to FMC API."""
+        """
+        POST to FMC API.
+
+        Waits up to post_wait_time seconds (default 300) for the registration task to finish.  Pass wait=False to
+        return as soon as the registration is submitted; self.task_future then tracks it.
+        """
         logging.debug("In post() for DeviceRecords class.")
+        wait = kwargs.pop("wait", True)
         response = super().post(**kwargs)
-        #  self.wait_for_task(task=response["metadata"]["task"], wait_time=30)  # Doesn't work yet.
         if "post_wait_time" in kwargs:
             self.post_wait_time = kwargs["post_wait_time"]
         else:
             self.post_wait_time = 300
-        logging.info(
-            f"DeviceRecords registration task submitted.  "
-            f"Waiting {self.post_wait_time} seconds for it to complete."
-        )
-        time.sleep(self.post_wait_time)
+        self.task_future = None
+        task = None
+        if isinstance(response, dict):
+            task = response.get("metadata", {}).get("task")
+        if task is not None and "id" in task:
+            self.task_future = self.fmc.task_tracker.track(
+                task, timeout=self.post_wait_time, done_when_missing=True
+            )
+            if wait:
+                logging.info(
+                    f"DeviceRecords registration task submitted.  "
+                    f"Waiting up to {self.post_wait_time} seconds for it to complete."
+                )
+                self.task_future.result()
+        elif wait and response:
+            logging.info(
+                f"DeviceRecords registration task submitted.  "
+                f"Waiting {self.post_wait_time} seconds for it to complete."
+            )
+            time.sleep(self.post_wait_time)
         return response
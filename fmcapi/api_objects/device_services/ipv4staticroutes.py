@@ -4,7 +4,6 @@ from fmcapi.api_objects.apiclasstemplate import APIClassTemplate
 from .devicerecords import DeviceRecords
 from fmcapi.api_objects.object_services.networkaddresses import NetworkAddresses
 from fmcapi.api_objects.object_services.slamonitors import SLAMonitors
-from fmcapi.api_objects.object_services.hosts import Hosts
 from fmcapi.api_objects.object_services.networkgroups import NetworkGroups
 import logging
 
@@ -84,61 +83,35 @@ class IPv4StaticRoutes(APIClassTemplate):
         logging.info("In networks() for IPv4StaticRoute class.")
         if action == "add":
             # Valid objects are IPHost, IPNetwork and NetworkGroup.
-            # Create a dictionary to contain all three object type.
-            ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-            networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-            items = ipaddresses_json.get("items", []) + networkgroup_json.get(
-                "items", []
-            )
             for network in networks:
-                # Find the matching object name in the dictionary if it exists
-                net1 = list(filter(lambda i: i["name"] == network, items))
-                if len(net1) > 0:
+                net1 = self.fmc.catalog.lookup(
+                    network, [NetworkAddresses, NetworkGroups]
+                )
+                if net1 is not None:
                     if "selectedNetworks" in self.__dict__:
                         # Check to see if network already exists
-                        exists = list(
-                            filter(
-                                lambda i: i["id"] == net1[0]["id"],
-                                self.selectedNetworks,
-                            )
-                        )
-                        if "id" in exists:
+                        if any(i["id"] == net1["id"] for i in self.selectedNetworks):
                             logging.warning(
                                 f'Network "{network}" already exists in selectedNetworks.'
                             )
                         else:
-                            self.selectedNetworks.append(
-                                {
-                                    "type": net1[0]["type"],
-                                    "id": net1[0]["id"],
-                                    "name": net1[0]["name"],
-                                }
-                            )
+                            self.selectedNetworks.append(net1)
                     else:
-                        self.selectedNetworks = [
-                            {
-                                "type": net1[0]["type"],
-                                "id": net1[0]["id"],
-                                "name": net1[0]["name"],
-                            }
-                        ]
+                        self.selectedNetworks = [net1]
                 else:
                     logging.warning(
                         f'Network "{network}" not found.  Cannot set up device for IPv4StaticRoute.'
                     )
         elif action == "remove":
-            ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-            networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-            items = ipaddresses_json.get("items", []) + networkgroup_json.get(
-                "items", []
-            )
             for network in networks:
-                net1 = list(filter(lambda i: i["name"] == network, items))
-                if len(net1) > 0:
+                net1 = self.fmc.catalog.lookup(
+                    network, [NetworkAddresses, NetworkGroups]
+                )
+                if net1 is not None:
                     if "selectedNetworks" in self.__dict__:
                         self.selectedNetworks = list(
                             filter(
-                                lambda i: i["id"] != net1[0]["id"],
+                                lambda i: i["id"] != net1["id"],
                                 self.selectedNetworks,
                             )
                         )
@@ -165,12 +138,9 @@ class IPv4StaticRoutes(APIClassTemplate):
         :return: None
         """
         logging.info("In gw() for IPv4StaticRoute class.")
-        gw1 = Hosts(fmc=self.fmc)
-        gw1.get(name=name)
-        if "id" in gw1.__dict__:
-            self.gateway = {
-                "object": {"type": gw1.type, "id": gw1.id, "name": gw1.name}
-            }
+        gw1 = self.fmc.catalog.lookup(name, [NetworkAddresses], types=["Host"])
+        if gw1 is not None:
+            self.gateway = {"object": gw1}
         else:
             logging.warning(
                 f"Network {name} not found.  Cannot set up device for IPv4StaticRoute."
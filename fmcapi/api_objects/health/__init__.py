@@ -1,14 +1,29 @@
 """Health Classes."""
 
 import logging
-from .terminateravpnsessions import TerminateRAVPNSessions
-from .tunnelstatuses import TunnelStatuses
-from .tunneldetails import TunnelDetails
-from .tunnelsummaries import TunnelSummaries
-from .metrics import Metrics
-from .alerts import Alerts
-from .events import Events
+from ..helper_functions import lazy_import
 
 logging.debug("In the health __init__.py file.")
 
-__all__ = ["Health"]
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "TerminateRAVPNSessions": ".terminateravpnsessions",
+    "TunnelStatuses": ".tunnelstatuses",
+    "TunnelDetails": ".tunneldetails",
+    "TunnelSummaries": ".tunnelsummaries",
+    "Metrics": ".metrics",
+    "Alerts": ".alerts",
+    "Events": ".events",
+}
+
+__all__ = [
+    "TerminateRAVPNSessions",
+    "TunnelStatuses",
+    "TunnelDetails",
+    "TunnelSummaries",
+    "Metrics",
+    "Alerts",
+    "Events",
+]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
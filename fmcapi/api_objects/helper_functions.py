@@ -1,9 +1,12 @@
 """Misc methods/functions that are used by the fmcapi package's modules."""
 
 import re
+import functools
+import importlib
 import ipaddress
 import json
 import logging
+import sys
 import uuid
 
 
@@ -182,7 +185,7 @@ def true_false_checker(value):
     return value
 
 
-def syntax_correcter(value, permitted_syntax="""[.\w\d_\-]""", replacer="_"):
+def syntax_correcter(value, permitted_syntax=r"""[.\w\d_\-]""", replacer="_"):
     """
     Check 'value' for invalid characters (identified by 'permitted_syntax') and replace them with 'replacer'.
 
@@ -192,13 +195,35 @@ def syntax_correcter(value, permitted_syntax="""[.\w\d_\-]""", replacer="_"):
     :return: (str) Modified string with "updated" characters.
     """
     logging.debug("In syntax_correcter() helper_function.")
-    new_value = ""
-    for char in range(0, len(value)):
-        if not re.match(permitted_syntax, value[char]):
-            new_value += replacer
-        else:
-            new_value += value[char]
-    return new_value
+    return invalid_characters(permitted_syntax).sub(
+        replacer.replace("\\", "\\\\"), value
+    )
+
+
+def syntax_correcter_batch(values, permitted_syntax=r"""[.\w\d_\-]""", replacer="_"):
+    """
+    syntax_correcter() for a list of strings.
+
+    :param values:  (list) Strings to be checked.
+    :param permitted_syntax: (str) regex of allowed characters.
+    :param replacer: (str) character used to replace invalid characters.
+    :return: (list) Modified strings, in the same order.
+    """
+    logging.debug("In syntax_correcter_batch() helper_function.")
+    sub = invalid_characters(permitted_syntax).sub
+    replacer = replacer.replace("\\", "\\\\")
+    return [sub(replacer, value) for value in values]
+
+
+@functools.lru_cache(maxsize=None)
+def invalid_characters(permitted_syntax):
+    """
+    Compile a regex matching every character that 'permitted_syntax' doesn't match.
+
+    :param permitted_syntax: (str) regex of one allowed character, e.g. a character class.
+    :return: (re.Pattern)
+    """
+    return re.compile(f"(?!{permitted_syntax}).", re.DOTALL)
 
 
 def get_networkaddress_type(value):
@@ -333,6 +358,44 @@ def bulk_list_splitter(ids, chunk_size=49):
     return chunks
 
 
+def json_chunker(items, max_bytes, max_items=None):
+    """
+    Split items into lists whose JSON encoding fits in max_bytes.
+
+    Each item is serialized once and the size of the resulting JSON array is tracked as items are added, so chunking
+    is linear in the number of items.  Chunks are yielded as soon as they are full.  An item that is larger than
+    max_bytes on its own is yielded alone.
+
+    :param items: (iterable) JSON serializable items.
+    :param max_bytes: (int) Maximum size in bytes of the JSON array sent for one chunk.
+    :param max_items: (int) Maximum number of items in one chunk.  None for no limit.
+    :return: (generator) lists of items
+    """
+    logging.debug("In json_chunker() helper_function.")
+    chunk = []
+    # Size of "[]" plus the ", " separating items, matching json.dumps() defaults used by requests.
+    chunk_bytes = 2
+    for item in items:
+        item_bytes = len(json.dumps(item).encode("utf-8"))
+        separator = 2 if chunk else 0
+        if chunk and (
+            chunk_bytes + separator + item_bytes > max_bytes
+            or (max_items is not None and len(chunk) >= max_items)
+        ):
+            yield chunk
+            chunk = []
+            chunk_bytes = 2
+            separator = 0
+        if item_bytes + 2 > max_bytes:
+            logging.warning(
+                f"Item of {item_bytes} bytes is larger than the {max_bytes} bytes allowed per chunk."
+            )
+        chunk.append(item)
+        chunk_bytes += separator + item_bytes
+    if chunk:
+        yield chunk
+
+
 def check_uuid(uuid_input):
     try:
         uuid.UUID(str(uuid_input))
@@ -391,3 +454,28 @@ def validate_port_literal(port, protocol="TCP"):
             raise ValueError(f"Port number out of valid range (0-65535): {port}")
 
     return {"type": "PortLiteral", "port": port, "protocol": protocol_num}
+
+
+def lazy_import(package, imports):
+    """
+    Build the module level __getattr__() and __dir__() of a package whose classes are imported on first use.
+
+    This keeps "import fmcapi" fast as only the classes a program actually uses get imported.
+
+    :param package: (str) __name__ of the package.
+    :param imports: (dict) Class name -> module, relative to package, the class is defined in.
+    :return: (function, function) __getattr__, __dir__
+    """
+
+    def __getattr__(name):
+        if name not in imports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(imports[name], package), name)
+        # Cache it in the package so __getattr__() isn't called for it again.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(imports))
+
+    return __getattr__, __dir__
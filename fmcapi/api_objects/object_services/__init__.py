@@ -1,62 +1,69 @@
 """Object Services Classes."""
 
 import logging
-from .anyprotocolportobjects import AnyProtocolPortObjects
-from .applications import Applications
-from .applicationcategories import ApplicationCategories
-from .applicationfilters import ApplicationFilters
-from .applicationproductivities import ApplicationProductivities
-from .applicationrisks import ApplicationRisks
-from .applicationtags import ApplicationTags
-from .applicationtypes import ApplicationTypes
-from .certenrollments import CertEnrollments
-from .continents import Continents
-from .countries import Countries
-from .dnsservergroups import DNSServerGroups
-from .endpointdevicetypes import EndPointDeviceTypes
-from .extendedaccesslist import ExtendedAccessList, ExtendedAccessListAce
-from .fqdns import FQDNS
-from .geolocation import Geolocation
-from .icmpv4objects import ICMPv4Objects
-from .icmpv6objects import ICMPv6Objects
-from .ikev1ipsecproposals import IKEv1IpsecProposals
-from .ikev1policies import IKEv1Policies
-from .ikev2ipsecproposals import IKEv2IpsecProposals
-from .ikev2policies import IKEv2Policies
-from .interfacegroups import InterfaceGroups
-from .interfaceobjects import InterfaceObjects
-from .networkaddresses import NetworkAddresses
-from .hosts import Hosts
-from .networks import Networks
-from .ranges import Ranges
-from .isesecuritygrouptags import ISESecurityGroupTags
-from .networkgroups import NetworkGroups
-from .portobjectgroups import PortObjectGroups
-from .ports import Ports
-from .protocolportobjects import ProtocolPortObjects
-from .realms import Realms
-from .realmusergroups import RealmUserGroups
-from .realmusers import RealmUsers
-from .securitygrouptags import SecurityGroupTags
-from .securityzones import SecurityZones
-from .siurlfeeds import SIUrlFeeds
-from .siurllists import SIUrlLists
-from .slamonitors import SLAMonitors
-from .tunneltags import TunnelTags
-from .urls import URLs
-from .urlcategories import URLCategories
-from .urlgroups import URLGroups
-from .usage import Usage
-from .variablesets import VariableSets
-from .vlangrouptags import VlanGroupTags
-from .vlantags import VlanTags
-from .dynamicobjects import DynamicObject
-from .dynamicobjectmappings import DynamicObjectMappings
-from .grouppolicies import GroupPolicies
-from .timeranges import TimeRanges
+from ..helper_functions import lazy_import
 
 logging.debug("In the object_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "AnyProtocolPortObjects": ".anyprotocolportobjects",
+    "Applications": ".applications",
+    "ApplicationCategories": ".applicationcategories",
+    "ApplicationFilters": ".applicationfilters",
+    "ApplicationProductivities": ".applicationproductivities",
+    "ApplicationRisks": ".applicationrisks",
+    "ApplicationTags": ".applicationtags",
+    "ApplicationTypes": ".applicationtypes",
+    "CertEnrollments": ".certenrollments",
+    "Continents": ".continents",
+    "Countries": ".countries",
+    "DNSServerGroups": ".dnsservergroups",
+    "EndPointDeviceTypes": ".endpointdevicetypes",
+    "ExtendedAccessList": ".extendedaccesslist",
+    "ExtendedAccessListAce": ".extendedaccesslist",
+    "FQDNS": ".fqdns",
+    "Geolocation": ".geolocation",
+    "ICMPv4Objects": ".icmpv4objects",
+    "ICMPv6Objects": ".icmpv6objects",
+    "IKEv1IpsecProposals": ".ikev1ipsecproposals",
+    "IKEv1Policies": ".ikev1policies",
+    "IKEv2IpsecProposals": ".ikev2ipsecproposals",
+    "IKEv2Policies": ".ikev2policies",
+    "InterfaceGroups": ".interfacegroups",
+    "InterfaceObjects": ".interfaceobjects",
+    "NetworkAddresses": ".networkaddresses",
+    "Hosts": ".hosts",
+    "Networks": ".networks",
+    "Ranges": ".ranges",
+    "ISESecurityGroupTags": ".isesecuritygrouptags",
+    "NetworkGroups": ".networkgroups",
+    "PortObjectGroups": ".portobjectgroups",
+    "Ports": ".ports",
+    "ProtocolPortObjects": ".protocolportobjects",
+    "Realms": ".realms",
+    "RealmUserGroups": ".realmusergroups",
+    "RealmUsers": ".realmusers",
+    "SecurityGroupTags": ".securitygrouptags",
+    "SecurityZones": ".securityzones",
+    "SIUrlFeeds": ".siurlfeeds",
+    "SIUrlLists": ".siurllists",
+    "SLAMonitors": ".slamonitors",
+    "TunnelTags": ".tunneltags",
+    "URLs": ".urls",
+    "URLCategories": ".urlcategories",
+    "URLGroups": ".urlgroups",
+    "Usage": ".usage",
+    "VariableSets": ".variablesets",
+    "VlanGroupTags": ".vlangrouptags",
+    "VlanTags": ".vlantags",
+    "DynamicObject": ".dynamicobjects",
+    "DynamicObjectMappings": ".dynamicobjectmappings",
+    "DynamicObjectSync": ".dynamicobjectsync",
+    "GroupPolicies": ".grouppolicies",
+    "TimeRanges": ".timeranges",
+}
+
 __all__ = [
     "AnyProtocolPortObjects",
     "ApplicationCategories",
@@ -111,5 +118,8 @@ __all__ = [
     "VlanTags",
     "DynamicObjectMappings",
     "DynamicObject",
+    "DynamicObjectSync",
     "TimeRanges",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
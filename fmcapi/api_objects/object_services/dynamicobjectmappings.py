@@ -1,5 +1,4 @@
 from fmcapi.api_objects.apiclasstemplate import APIClassTemplate
-from packaging.version import Version
 from .dynamicobjects import DynamicObject
 import logging
 
@@ -95,9 +94,7 @@ class DynamicObjectMappings(APIClassTemplate):
         """
         logging.debug("In get() for APIClassTemplate class.")
         self.parse_kwargs(**kwargs)
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support GET of this feature."
             )
@@ -221,6 +218,9 @@ class DynamicObjectMappings(APIClassTemplate):
                     logging.info(f"\tURL = {self.URL}")
                     return False
                 response = self.fmc.send_to_api(method="get", url=url)
+            if response is None:
+                logging.warning("GET failure.  No data in API response.")
+                return None
             if "items" not in response:
                 response["items"] = []
             return response
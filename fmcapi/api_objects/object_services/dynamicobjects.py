@@ -43,17 +43,17 @@ class DynamicObject(APIClassTemplate):
         self.parse_kwargs(**kwargs)
         self.type = "DynamicObject"
 
-    def _parse_ip_file(self, filepath):
+    @staticmethod
+    def iter_ip_file(filepath):
         """
-        Read a file and return a list of valid IPv4/IPv6 host addresses.
+        Read a file one line at a time and yield its valid IPv4/IPv6 host addresses.
 
         Lines that are empty, whitespace-only, or not parseable as an IP address
         are silently ignored.
 
         :param filepath: (str) Path to the file to parse.
-        :return: (list) Valid IP address strings.
+        :return: (generator) Valid IP address strings.
         """
-        ips = []
         try:
             with open(filepath, "r") as f:
                 for line in f:
@@ -62,12 +62,22 @@ class DynamicObject(APIClassTemplate):
                         continue
                     try:
                         addr = ipaddress.ip_address(line)
-                        ips.append(str(addr))
                     except ValueError:
                         logging.debug(f"Skipping invalid IP address line: {line!r}")
+                        continue
+                    yield str(addr)
         except OSError as exc:
             logging.warning(f"Cannot read file {filepath}: {exc}")
-        return ips
+
+    @staticmethod
+    def parse_ip_file(filepath):
+        """
+        Read a file and return a list of valid IPv4/IPv6 host addresses.
+
+        :param filepath: (str) Path to the file to parse.
+        :return: (list) Valid IP address strings.
+        """
+        return list(DynamicObject.iter_ip_file(filepath))
 
     def _sync_file(self, filepath, create=False):
         """
@@ -80,67 +90,14 @@ class DynamicObject(APIClassTemplate):
         :param create: (bool) Create the Dynamic Object on the FMC if it does not exist.
         :return: None
         """
-        # Lazy import to avoid circular dependency (dynamicobjectmappings imports DynamicObject)
-        from .dynamicobjectmappings import DynamicObjectMappings
-
-        name = Path(filepath).stem
-        new_ips = set(self._parse_ip_file(filepath))
-
-        if not new_ips:
-            logging.info(f"No valid IPs found in '{filepath}'. Skipping '{name}'.")
-            return
-
-        # Resolve the Dynamic Object on the FMC
-        dyn_obj = DynamicObject(fmc=self.fmc, name=name)
-        response = dyn_obj.get()
-
-        if not response or "id" not in response:
-            if not create:
-                logging.warning(
-                    f"Dynamic Object '{name}' not found on FMC and create=False. Skipping."
-                )
-                return
-            dyn_obj.objectType = "IP"
-            dyn_obj.post()
-            response = dyn_obj.get()
-            if not response or "id" not in response:
-                logging.error(f"Failed to create Dynamic Object '{name}'. Skipping.")
-                return
-            logging.info(f"Created Dynamic Object '{name}'.")
-
-        obj_id = response["id"]
-
-        # Retrieve current IP mappings
-        dom = DynamicObjectMappings(fmc=self.fmc, id=obj_id)
-        current_response = dom.get()
-        current_ips = set()
-        if current_response and "items" in current_response:
-            current_ips = {
-                item["mapping"]
-                for item in current_response["items"]
-                if "mapping" in item
-            }
-
-        to_add = list(new_ips - current_ips)
-        to_remove = list(current_ips - new_ips)
-
-        if not to_add and not to_remove:
-            logging.info(f"Dynamic Object '{name}' is already up to date.")
-            return
-
-        print(f"TO ADD : {to_add}")
-        print(f"TO REMOVE : {to_remove}")
-        mapping = DynamicObjectMappings(fmc=self.fmc)
-        if to_add:
-            mapping.handle_mappings(action="add", value=to_add, name=name)
-        if to_remove:
-            mapping.handle_mappings(action="remove", value=to_remove, name=name)
-        mapping.post()
-        logging.info(
-            f"Synced Dynamic Object '{name}': +{len(to_add)} added, -{len(to_remove)} removed."
-        )
+        # Lazy import to avoid circular dependency (dynamicobjectsync imports DynamicObject)
+        from .dynamicobjectsync import DynamicObjectSync
 
-    def watch_and_sync(self, path=".", create=False, initial_sync=False):
+        DynamicObjectSync(fmc=self.fmc, create=create).sync([filepath])
+
+    def watch_and_sync(
+        self, path=".", create=False, initial_sync=False, debounce=2, snapshot_dir=None
+    ):
         """
         Long-running blocking method that watches a directory for file changes
         and syncs them as Dynamic Objects on the FMC.
@@ -154,6 +111,11 @@ class DynamicObject(APIClassTemplate):
         re-syncs the corresponding Dynamic Object every time a watched file is
         created or modified.
 
+        A file is synced once it stopped changing for ``debounce`` seconds, and
+        files changed together are synced with one mappings POST.  The mappings
+        synced last are remembered, so an unchanged file costs no API call.  See
+        DynamicObjectSync.
+
         Requires the ``watchdog`` package (``pip install watchdog``).
 
         :param path: (str) Directory path or glob pattern (e.g. ``'/path/*.txt'``).
@@ -163,6 +125,13 @@ class DynamicObject(APIClassTemplate):
         :param initial_sync: (bool) Force-sync all matching files immediately on
                              startup before entering the watch loop.
                              Defaults to False.
+        :param debounce: (float) Seconds a file must stay unchanged before it
+                         is synced. Defaults to 2.
+        :param snapshot_dir: (str) Directory keeping a snapshot of each
+                             object's last sync.  When set, files are diffed
+                             against their snapshot instead of the FMC's
+                             mappings and sent in payload sized chunks, for
+                             feeds too large for one request. Defaults to None.
         :return: None
         """
         if not _WATCHDOG_AVAILABLE:
@@ -170,6 +139,11 @@ class DynamicObject(APIClassTemplate):
                 "The 'watchdog' package is required for watch_and_sync(). "
                 "Install it with: pip install watchdog"
             )
+        from .dynamicobjectsync import DynamicObjectSync
+
+        syncer = DynamicObjectSync(
+            fmc=self.fmc, create=create, debounce=debounce, snapshot_dir=snapshot_dir
+        )
 
         glob_pattern = None
         if any(c in path for c in ("*", "?", "[")):
@@ -185,36 +159,33 @@ class DynamicObject(APIClassTemplate):
                 if glob_pattern
                 else glob_module.glob(os.path.join(path, "*"))
             )
-            for filepath in files:
-                if os.path.isfile(filepath):
-                    logging.info(f"Initial sync: {filepath}")
-                    self._sync_file(filepath, create=create)
-
-        sync_file = self._sync_file
+            files = [filepath for filepath in files if os.path.isfile(filepath)]
+            if files:
+                logging.info(f"Initial sync: {', '.join(files)}")
+                syncer.sync(files)
 
         class _DynamicObjectFileHandler(FileSystemEventHandler):
-            """Watchdog handler that syncs changed files to FMC Dynamic Objects."""
+            """Watchdog handler that schedules changed files for a sync to FMC Dynamic Objects."""
 
-            def __init__(self, pattern, create_flag):
+            def __init__(self, pattern):
                 """
                 Initialize the handler.
 
                 :param pattern: (str or None) Glob pattern to restrict which files trigger a sync.
-                :param create_flag: (bool) Passed through to _sync_file.
                 """
                 super().__init__()
                 self._pattern = pattern
-                self._create_flag = create_flag
 
-            def _handle(self, event):
+            def _handle(self, event, filepath=None):
                 """
                 Process a filesystem event.
 
                 :param event: watchdog FileSystemEvent
+                :param filepath: (str) Path of the changed file.  (Default is None, event.src_path)
                 """
                 if event.is_directory:
                     return
-                filepath = event.src_path
+                filepath = filepath or event.src_path
                 filename = Path(filepath).name
                 # Ignore editor temporary/backup files (e.g. file~, .file.swp)
                 if filename.endswith("~") or filename.startswith("."):
@@ -224,7 +195,7 @@ class DynamicObject(APIClassTemplate):
                 if self._pattern and not fnmatch.fnmatch(filename, self._pattern):
                     return
                 logging.info(f"File event detected: {filepath}")
-                sync_file(filepath, create=self._create_flag)
+                syncer.schedule(filepath)
 
             def on_modified(self, event):
                 """Handle file modification events."""
@@ -234,7 +205,11 @@ class DynamicObject(APIClassTemplate):
                 """Handle file creation events."""
                 self._handle(event)
 
-        handler = _DynamicObjectFileHandler(pattern=glob_pattern, create_flag=create)
+            def on_moved(self, event):
+                """Handle files renamed into place, the way many editors save."""
+                self._handle(event, filepath=event.dest_path)
+
+        handler = _DynamicObjectFileHandler(pattern=glob_pattern)
         observer = Observer()
         observer.schedule(handler, watch_dir, recursive=False)
         observer.start()
@@ -248,3 +223,5 @@ class DynamicObject(APIClassTemplate):
             logging.info("Stopping Dynamic Object file watcher.")
             observer.stop()
         observer.join()
+        # Don't drop the changes still waiting for their debounce time.
+        syncer.flush()
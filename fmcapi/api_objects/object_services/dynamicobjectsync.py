@@ -0,0 +1,468 @@
+"""Sync files of IP addresses to Dynamic Objects, batching the mapping updates of many files."""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from .dynamicobjects import DynamicObject
+from .dynamicobjectmappings import DynamicObjectMappings
+from fmcapi.api_objects.helper_functions import json_chunker
+
+
+class DynamicObjectSync(object):
+    """
+    Keep Dynamic Objects in sync with files of IP addresses, one object per file named after the file's stem.
+
+    Changes are debounced per file: a file is only read once no change to it was reported for debounce seconds,
+    however many events saving it produced.  The files due at about the same time are synced together with a single
+    DynamicObjectMappings POST.  The mappings last synced to each object are cached, so a file whose addresses didn't
+    change costs no API call at all.
+
+    Feeds with 100k+ addresses don't fit in one request.  With snapshot_dir set, each file is streamed instead: it is
+    sorted on disk and compared with the sorted snapshot of the object's last sync, rather than with mappings held in
+    memory, and the additions and removals are posted in chunks of at most max_payload bytes.
+    """
+
+    # Files due within BATCH_WINDOW seconds of the first one are synced in the same batch.
+    BATCH_WINDOW = 0.5
+    # Addresses a streamed sync sorts in memory at a time; larger feeds are sorted in runs on disk.
+    SORT_RUN = 100000
+
+    def __init__(
+        self,
+        fmc,
+        create=False,
+        debounce=2,
+        snapshot_dir=None,
+        max_payload=None,
+        progress=None,
+    ):
+        """
+        Initialize DynamicObjectSync object.
+
+        :param fmc (object): FMC object
+        :param create (bool): Create Dynamic Objects that don't exist on the FMC.  (Default is False)
+        :param debounce (float): Seconds a file must stay unchanged before it is synced.  (Default is 2)
+        :param snapshot_dir (str): Directory for the snapshots of streamed syncs.  (Default is None, don't stream)
+        :param max_payload (int): Largest request, in bytes, of a streamed sync.  (Default is None, use
+        fmc.FMC_MAX_PAYLOAD)
+        :param progress (function): Called with (name, added, removed) after each chunk of a streamed sync.
+        :return: None
+        """
+        logging.debug("In __init__() for DynamicObjectSync class.")
+        self.fmc = fmc
+        self.create = create
+        self.debounce = debounce
+        self.snapshot_dir = snapshot_dir
+        self.max_payload = max_payload or fmc.FMC_MAX_PAYLOAD
+        self.progress = progress
+        self.objects = {}
+        self.mappings = {}
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.pending = {}
+        self.thread = None
+
+    def schedule(self, filepath):
+        """
+        Sync a file once it stopped changing for debounce seconds.  Scheduling a file again postpones its sync.
+
+        :param filepath: (str) Path to the IP list file.
+        :return: None
+        """
+        with self.lock:
+            self.pending[filepath] = time.monotonic() + self.debounce
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._sync_loop,
+                    name="fmcapi-dynamic-object-sync",
+                    daemon=True,
+                )
+                self.thread.start()
+        self.wakeup.set()
+
+    def flush(self):
+        """
+        Sync every scheduled file now, without waiting for its debounce time.
+
+        :return: (dict) See sync().
+        """
+        with self.lock:
+            filepaths = list(self.pending)
+            self.pending = {}
+        self.wakeup.set()
+        return self.sync(filepaths) if filepaths else {}
+
+    def invalidate(self, name=None):
+        """
+        Forget the cached id, mappings and snapshot of a Dynamic Object, e.g. after it was changed outside of this
+        sync.
+
+        :param name: (str) Name of the Dynamic Object.  (Default is None, forget all of them)
+        :return: None
+        """
+        names = list(self.objects) if name is None else [name]
+        for object_name in names:
+            dynamic_object = self.objects.pop(object_name, None)
+            if dynamic_object is None:
+                continue
+            self.mappings.pop(dynamic_object["id"], None)
+            if self.snapshot_dir is not None:
+                snapshot = self.snapshot_path(dynamic_object["id"])
+                if os.path.exists(snapshot):
+                    os.remove(snapshot)
+        if name is None:
+            self.mappings = {}
+
+    def sync(self, filepaths):
+        """
+        Sync files now, sending the mapping changes of all of them in one DynamicObjectMappings POST.
+
+        :param filepaths: (list) Paths to IP list files.
+        :return: (dict) {name: (added, removed)} for each Dynamic Object whose mappings changed.
+        """
+        logging.debug("In sync() for DynamicObjectSync class.")
+        # The background thread and flush() may sync at the same time, they'd race on the cache.
+        with self.sync_lock:
+            return self._sync(filepaths)
+
+    def _sync(self, filepaths):
+        """Body of sync(), called with sync_lock held."""
+        if self.snapshot_dir is not None:
+            result = {}
+            for filepath in filepaths:
+                counts = self.stream(filepath)
+                if counts and any(counts):
+                    result[Path(filepath).stem] = counts
+            return result
+        add = []
+        remove = []
+        changes = {}
+        for filepath in filepaths:
+            name = Path(filepath).stem
+            addresses = set(DynamicObject.parse_ip_file(filepath))
+            if not addresses:
+                logging.info(f"No valid IPs found in '{filepath}'. Skipping '{name}'.")
+                continue
+            dynamic_object = self.resolve(name)
+            if dynamic_object is None:
+                continue
+            current = self.current_mappings(dynamic_object["id"])
+            if current is None:
+                logging.error(
+                    f"Reading the mappings of Dynamic Object '{name}' failed.  Skipping it until the next sync."
+                )
+                continue
+            to_add = sorted(addresses - current)
+            to_remove = sorted(current - addresses)
+            if not to_add and not to_remove:
+                logging.info(f"Dynamic Object '{name}' is already up to date.")
+                continue
+            if to_add:
+                add.append({"dynamicObject": dynamic_object, "mappings": to_add})
+            if to_remove:
+                remove.append({"dynamicObject": dynamic_object, "mappings": to_remove})
+            changes[name] = (
+                dynamic_object["id"],
+                addresses,
+                len(to_add),
+                len(to_remove),
+            )
+        if not changes:
+            return {}
+
+        mapping = DynamicObjectMappings(fmc=self.fmc)
+        if add:
+            mapping.add = add
+        if remove:
+            mapping.remove = remove
+        if not mapping.post():
+            logging.error(f"Syncing Dynamic Objects {', '.join(changes)} failed.")
+            # The FMC may have applied part of the changes, read the mappings again next time.
+            for object_id, _, _, _ in changes.values():
+                self.mappings.pop(object_id, None)
+            return {}
+        result = {}
+        for name, (object_id, addresses, added, removed) in changes.items():
+            self.mappings[object_id] = addresses
+            logging.info(
+                f"Synced Dynamic Object '{name}': +{added} added, -{removed} removed."
+            )
+            result[name] = (added, removed)
+        return result
+
+    def stream(self, filepath):
+        """
+        Sync one file in payload sized chunks, comparing it with the snapshot of the object's last sync.
+
+        The file's addresses are sorted into a temporary file, SORT_RUN addresses at a time, and then compared line by
+        line with the snapshot, which is kept sorted, so memory use doesn't grow with the size of the feed.  The first
+        sync of an object takes its current mappings from the FMC as the snapshot.  If a chunk fails, the snapshot is
+        deleted so that the next sync starts again from the FMC's mappings.
+
+        :param filepath: (str) Path to the IP list file.
+        :return: (tuple) (added, removed) or None if the file wasn't synced.
+        """
+        logging.debug("In stream() for DynamicObjectSync class.")
+        name = Path(filepath).stem
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        fd, new = tempfile.mkstemp(suffix=".tmp", dir=self.snapshot_dir)
+        os.close(fd)
+        snapshot = None
+        succeeded = False
+        try:
+            if not self.write_sorted(DynamicObject.iter_ip_file(filepath), new):
+                logging.info(f"No valid IPs found in '{filepath}'. Skipping '{name}'.")
+                return None
+            dynamic_object = self.resolve(name)
+            if dynamic_object is None:
+                return None
+            snapshot = self.snapshot_path(dynamic_object["id"])
+            if not os.path.exists(snapshot) and not self.seed_snapshot(
+                dynamic_object, snapshot
+            ):
+                logging.error(
+                    f"Reading the mappings of Dynamic Object '{name}' failed.  Skipping it until the next sync."
+                )
+                snapshot = None
+                return None
+            counts = {"add": 0, "remove": 0}
+            with open(snapshot) as old, open(new) as current:
+                removed = self.sorted_difference(old, current)
+                if not self.post_chunks(dynamic_object, "remove", removed, counts):
+                    return None
+            with open(new) as current, open(snapshot) as old:
+                added = self.sorted_difference(current, old)
+                if not self.post_chunks(dynamic_object, "add", added, counts):
+                    return None
+            os.replace(new, snapshot)
+            succeeded = True
+        finally:
+            if os.path.exists(new):
+                os.remove(new)
+            if not succeeded and snapshot is not None:
+                logging.error(f"Syncing Dynamic Object '{name}' failed.")
+                if os.path.exists(snapshot):
+                    os.remove(snapshot)
+        if counts["add"] or counts["remove"]:
+            logging.info(
+                f"Synced Dynamic Object '{name}': +{counts['add']} added, -{counts['remove']} removed."
+            )
+        else:
+            logging.info(f"Dynamic Object '{name}' is already up to date.")
+        return counts["add"], counts["remove"]
+
+    def seed_snapshot(self, dynamic_object, snapshot):
+        """
+        Write the addresses mapped to a Dynamic Object on the FMC to its snapshot, a page at a time.
+
+        :param dynamic_object: (dict) {"name", "id", "type"} of the Dynamic Object.
+        :param snapshot: (str) Path of the snapshot.
+        :return: (boolean) False if the mappings couldn't be read completely.
+        """
+        object_id = dynamic_object["id"]
+        if object_id in self.mappings:
+            # Known without asking the FMC, e.g. a Dynamic Object that was just created.
+            self.write_sorted(iter(self.mappings.pop(object_id)), snapshot)
+            return True
+        url = (
+            f"{self.fmc.configuration_url}/object/dynamicobjects/{object_id}/mappings"
+            f"?limit={self.fmc.limit}"
+        )
+        paging = {"pages": 0, "count": None, "items": 0}
+
+        def mappings():
+            for page in self.fmc.iter_pages(url=url):
+                if paging["pages"] == 0:
+                    paging["count"] = page.get("paging", {}).get("count")
+                paging["pages"] += 1
+                items = page.get("items", [])
+                paging["items"] += len(items)
+                for item in items:
+                    if "mapping" in item:
+                        yield item["mapping"]
+
+        self.write_sorted(mappings(), snapshot)
+        # iter_pages() stops early, without an error, when a request fails.  A complete answer has a first page and,
+        # if it tells the count, that many items.
+        if paging["pages"] == 0 or (
+            paging["count"] is not None and paging["items"] < int(paging["count"])
+        ):
+            os.remove(snapshot)
+            return False
+        return True
+
+    def write_sorted(self, addresses, path):
+        """
+        Write addresses to a file, one per line, sorted and without duplicates.
+
+        At most SORT_RUN addresses are held in memory: each run of them is sorted into a temporary file and the runs
+        are merged.
+
+        :param addresses: (iterator) Addresses.
+        :param path: (str) File to write.
+        :return: (int) Number of addresses written.
+        """
+        runs = []
+        try:
+            while True:
+                run = sorted(set(itertools.islice(addresses, self.SORT_RUN)))
+                if not run:
+                    break
+                run_file = tempfile.TemporaryFile("w+", dir=self.snapshot_dir)
+                runs.append(run_file)
+                run_file.writelines(f"{address}\n" for address in run)
+                run_file.seek(0)
+            count = 0
+            previous = None
+            with open(path, "w") as f:
+                for line in heapq.merge(*runs):
+                    if line != previous:
+                        f.write(line)
+                        count += 1
+                        previous = line
+            return count
+        finally:
+            for run_file in runs:
+                run_file.close()
+
+    @staticmethod
+    def sorted_difference(lines, other_lines):
+        """
+        Yield the addresses of a sorted file that aren't in another sorted file, reading both one line at a time.
+
+        :param lines: (iterable) Lines of the first file.
+        :param other_lines: (iterable) Lines of the second file.
+        :return: (generator) Addresses.
+        """
+        other_lines = iter(other_lines)
+        other = next(other_lines, None)
+        for line in lines:
+            while other is not None and other < line:
+                other = next(other_lines, None)
+            if line != other and line.strip():
+                yield line.strip()
+
+    def post_chunks(self, dynamic_object, action, addresses, counts):
+        """
+        Add or remove mappings with as many DynamicObjectMappings POSTs of at most max_payload bytes as needed.
+
+        :param dynamic_object: (dict) {"name", "id", "type"} of the Dynamic Object.
+        :param action: (str) 'add' or 'remove'
+        :param addresses: (iterable) Addresses to add or remove.
+        :param counts: (dict) Number of addresses added and removed so far, updated after each chunk.
+        :return: (boolean) False if a POST failed.
+        """
+        # Bytes of the request around the list of addresses, whose own "[]" json_chunker() counts.
+        envelope = len(
+            json.dumps({action: [{"dynamicObject": dynamic_object, "mappings": []}]})
+        )
+        for chunk in json_chunker(addresses, self.max_payload - envelope + 2):
+            mapping = DynamicObjectMappings(fmc=self.fmc)
+            setattr(
+                mapping, action, [{"dynamicObject": dynamic_object, "mappings": chunk}]
+            )
+            if not mapping.post():
+                return False
+            counts[action] += len(chunk)
+            logging.info(
+                f"Dynamic Object '{dynamic_object['name']}': {counts['add']} added, {counts['remove']} removed so far."
+            )
+            if self.progress is not None:
+                self.progress(dynamic_object["name"], counts["add"], counts["remove"])
+        return True
+
+    def snapshot_path(self, object_id):
+        """
+        File holding the addresses mapped to a Dynamic Object by the last streamed sync, one per line.
+
+        :param object_id: (str) UUID of the Dynamic Object.
+        :return: (str) path
+        """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        return os.path.join(self.snapshot_dir, f"{object_id}.txt")
+
+    def resolve(self, name):
+        """
+        Find, or create, the Dynamic Object a file is synced to.
+
+        :param name: (str) Name of the Dynamic Object.
+        :return: (dict) {"name", "id", "type"} or None if it doesn't exist and can't be created.
+        """
+        if name in self.objects:
+            return self.objects[name]
+        dyn_obj = DynamicObject(fmc=self.fmc, name=name)
+        response = dyn_obj.get()
+        if not response or "id" not in response:
+            if not self.create:
+                logging.warning(
+                    f"Dynamic Object '{name}' not found on FMC and create=False. Skipping."
+                )
+                return None
+            dyn_obj.objectType = "IP"
+            dyn_obj.post()
+            response = dyn_obj.get()
+            if not response or "id" not in response:
+                logging.error(f"Failed to create Dynamic Object '{name}'. Skipping.")
+                return None
+            logging.info(f"Created Dynamic Object '{name}'.")
+            # A new object has no mappings, no need to ask the FMC.
+            self.mappings[response["id"]] = set()
+        self.objects[name] = {
+            "name": response["name"],
+            "id": response["id"],
+            "type": response.get("type", "DynamicObject"),
+        }
+        return self.objects[name]
+
+    def current_mappings(self, object_id):
+        """
+        Addresses mapped to a Dynamic Object, from the cache or else from the FMC.
+
+        :param object_id: (str) UUID of the Dynamic Object.
+        :return: (set) Addresses.  None if the FMC's answer was an error, which isn't cached.
+        """
+        if object_id not in self.mappings:
+            response = DynamicObjectMappings(fmc=self.fmc, id=object_id).get()
+            if not isinstance(response, dict):
+                return None
+            self.mappings[object_id] = {
+                item["mapping"]
+                for item in response.get("items", [])
+                if "mapping" in item
+            }
+        return self.mappings[object_id]
+
+    def _sync_loop(self):
+        """Body of the background thread: sync the files that are due, then sleep until the next one is."""
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.thread = None
+                    return
+                now = time.monotonic()
+                due = []
+                if min(self.pending.values()) <= now:
+                    due = [
+                        filepath
+                        for filepath, deadline in self.pending.items()
+                        if deadline <= now + self.BATCH_WINDOW
+                    ]
+                    for filepath in due:
+                        del self.pending[filepath]
+                else:
+                    delay = min(self.pending.values()) - now
+                    self.wakeup.clear()
+            if not due:
+                self.wakeup.wait(delay)
+                continue
+            try:
+                self.sync(due)
+            except Exception as e:
+                logging.error(f"Syncing {', '.join(due)} failed: {e}")
@@ -1,7 +1,6 @@
 """FQDNs Class."""
 
 from fmcapi.api_objects.apiclasstemplate import APIClassTemplate
-from packaging.version import Version
 import logging
 
 
@@ -43,13 +42,6 @@ class FQDNS(APIClassTemplate):
         logging.debug("In __init__() for FQDNS class.")
         self.parse_kwargs(**kwargs)
         self.type = "FQDN"
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
-            logging.warning(
-                f"The FQDNS API feature was released in version {self.FIRST_SUPPORTED_FMC_VERSION}.  "
-                f"Your FMC version is {self.fmc.serverVersion}.  Upgrade to use this feature."
-            )
 
     def format_data(self):
         """
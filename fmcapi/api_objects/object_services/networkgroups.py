@@ -44,65 +44,43 @@ class NetworkGroups(APIClassTemplate):
         """
         logging.debug("In named_networks() for NetworkGroups class.")
         if action == "add":
-            net1 = NetworkAddresses(fmc=self.fmc)
-            response = net1.get()
-            if "items" in response:
-                new_net = None
-                for item in response["items"]:
-                    if item["name"] == name:
-                        new_net = {
-                            "name": item["name"],
-                            "id": item["id"],
-                            "type": item["type"],
-                        }
-                        break
-                if new_net is None:
-                    logging.warning(
-                        f'Network "{name}" is not found in FMC.  Cannot add to NetworkGroups.'
-                    )
-                else:
-                    if "objects" in self.__dict__:
-                        duplicate = False
-                        for obj in self.objects:
-                            if obj["name"] == new_net["name"]:
-                                duplicate = True
-                                break
-                        if not duplicate:
-                            self.objects.append(new_net)
-                            logging.info(f'Adding "{name}" to NetworkGroups.')
-                    else:
-                        self.objects = [new_net]
+            new_net = self.fmc.catalog.lookup(name, [NetworkAddresses])
+            if new_net is None:
+                logging.warning(
+                    f'Network "{name}" is not found in FMC.  Cannot add to NetworkGroups.'
+                )
+            else:
+                if "objects" in self.__dict__:
+                    duplicate = False
+                    for obj in self.objects:
+                        if obj["name"] == new_net["name"]:
+                            duplicate = True
+                            break
+                    if not duplicate:
+                        self.objects.append(new_net)
                         logging.info(f'Adding "{name}" to NetworkGroups.')
-        if action == "addgroup":
-            netg1 = NetworkGroups(fmc=self.fmc)
-            response = netg1.get()
-            if "items" in response:
-                new_net = None
-                for item in response["items"]:
-                    if item["name"] == name:
-                        new_net = {
-                            "name": item["name"],
-                            "id": item["id"],
-                            "type": item["type"],
-                        }
-                        break
-                if new_net is None:
-                    logging.warning(
-                        f'Network "{name}" is not found in FMC.  Cannot add to NetworkGroups.'
-                    )
                 else:
-                    if "objects" in self.__dict__:
-                        duplicate = False
-                        for obj in self.objects:
-                            if obj["name"] == new_net["name"]:
-                                duplicate = True
-                                break
-                        if not duplicate:
-                            self.objects.append(new_net)
-                            logging.info(f'Adding "{name}" to NetworkGroups.')
-                    else:
-                        self.objects = [new_net]
+                    self.objects = [new_net]
+                    logging.info(f'Adding "{name}" to NetworkGroups.')
+        if action == "addgroup":
+            new_net = self.fmc.catalog.lookup(name, [NetworkGroups])
+            if new_net is None:
+                logging.warning(
+                    f'Network "{name}" is not found in FMC.  Cannot add to NetworkGroups.'
+                )
+            else:
+                if "objects" in self.__dict__:
+                    duplicate = False
+                    for obj in self.objects:
+                        if obj["name"] == new_net["name"]:
+                            duplicate = True
+                            break
+                    if not duplicate:
+                        self.objects.append(new_net)
                         logging.info(f'Adding "{name}" to NetworkGroups.')
+                else:
+                    self.objects = [new_net]
+                    logging.info(f'Adding "{name}" to NetworkGroups.')
         elif action == "remove":
             if "objects" in self.__dict__:
                 objects_list = []
@@ -1,8 +1,15 @@
 """Policy Assignments Services Classes."""
 
 import logging
-from .policyassignments import PolicyAssignments
+from ..helper_functions import lazy_import
 
 logging.debug("In the policy_assignment_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "PolicyAssignments": ".policyassignments",
+}
+
 __all__ = ["PolicyAssignments"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
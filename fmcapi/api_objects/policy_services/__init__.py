@@ -1,31 +1,36 @@
 """Policy Services Classes."""
 
 import logging
-from .accesspolicies import AccessPolicies
-from .accessrules import AccessRules
-from .accessrules import Bulk
-from .advancedsettings import AdvancedSettings
-from .autonatrules import AutoNatRules
-from .defaultactions import DefaultActions
-from .endpoints import Endpoints
-from .filepolicies import FilePolicies
-from .ftdnatpolicies import FTDNatPolicies
-from .ftds2svpns import FTDS2SVPNs
-from .hitcounts import HitCounts
-from .ikesettings import IKESettings
-from .intrusionpolicies import IntrusionPolicies
-from .ipsecsettings import IPSecSettings
-from .manualnatrules import ManualNatRules
-from .natrules import NatRules
-from .prefilterpolicies import PreFilterPolicies
-from .inheritancesettings import InheritanceSettings
-from .ravpns import RAVpn
-from .connectionprofiles import ConnectionProfiles
-from .dynamicaccesspolicies import DynamicAccessPolicies
-from .operational import AccessControlPolicyClone
+from ..helper_functions import lazy_import
 
 logging.debug("In the object_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "AccessPolicies": ".accesspolicies",
+    "AccessRules": ".accessrules",
+    "Bulk": ".accessrules",
+    "AdvancedSettings": ".advancedsettings",
+    "AutoNatRules": ".autonatrules",
+    "DefaultActions": ".defaultactions",
+    "Endpoints": ".endpoints",
+    "FilePolicies": ".filepolicies",
+    "FTDNatPolicies": ".ftdnatpolicies",
+    "FTDS2SVPNs": ".ftds2svpns",
+    "HitCounts": ".hitcounts",
+    "IKESettings": ".ikesettings",
+    "IntrusionPolicies": ".intrusionpolicies",
+    "IPSecSettings": ".ipsecsettings",
+    "ManualNatRules": ".manualnatrules",
+    "NatRules": ".natrules",
+    "PreFilterPolicies": ".prefilterpolicies",
+    "InheritanceSettings": ".inheritancesettings",
+    "RAVpn": ".ravpns",
+    "ConnectionProfiles": ".connectionprofiles",
+    "DynamicAccessPolicies": ".dynamicaccesspolicies",
+    "AccessControlPolicyClone": ".operational",
+}
+
 __all__ = [
     "AdvancedSettings",
     "IPSecSettings",
@@ -50,3 +55,5 @@ __all__ = [
     "DynamicAccessPolicies",
     "AccessControlPolicyClone",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -16,6 +16,7 @@ from fmcapi.api_objects.policy_services.filepolicies import FilePolicies
 from fmcapi.api_objects.object_services.isesecuritygrouptags import ISESecurityGroupTags
 from fmcapi.api_objects.helper_functions import (
     get_networkaddress_type,
+    json_chunker,
     true_false_checker,
     validate_port_literal,
 )
@@ -898,23 +899,9 @@ class AccessRules(APIClassTemplate):
                     f'Adding literal "{literal}" of type "{type_}" to sourceNetworks for this AccessRules.'
                 )
             else:
-                ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-                networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-                fqdns_json = FQDNS(fmc=self.fmc).get()
-                items = (
-                    ipaddresses_json.get("items", [])
-                    + networkgroup_json.get("items", [])
-                    + fqdns_json.get("items", [])
+                new_net = self.fmc.catalog.lookup(
+                    name, [NetworkAddresses, NetworkGroups, FQDNS]
                 )
-                new_net = None
-                for item in items:
-                    if item["name"] == name:
-                        new_net = {
-                            "name": item["name"],
-                            "id": item["id"],
-                            "type": item["type"],
-                        }
-                        break
                 if new_net is None:
                     logging.warning(
                         f'Network "{name}" is not found in FMC.  Cannot add to sourceNetworks.'
@@ -1028,26 +1015,10 @@ class AccessRules(APIClassTemplate):
                     f"to destinationNetworks for this AccessRules."
                 )
             else:
-                ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-                networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-                if self.fmc.serverVersion >= "6.4":
-                    fqdns_json = FQDNS(fmc=self.fmc).get()
-                else:
-                    fqdns_json = {"items": []}
-                items = (
-                    ipaddresses_json.get("items", [])
-                    + networkgroup_json.get("items", [])
-                    + fqdns_json.get("items", [])
-                )
-                new_net = None
-                for item in items:
-                    if item["name"] == name:
-                        new_net = {
-                            "name": item["name"],
-                            "id": item["id"],
-                            "type": item["type"],
-                        }
-                        break
+                api_classes = [NetworkAddresses, NetworkGroups]
+                if self.fmc.version_at_least("6.4"):
+                    api_classes.append(FQDNS)
+                new_net = self.fmc.catalog.lookup(name, api_classes)
                 if new_net is None:
                     logging.warning(
                         f'Network "{name}" is not found in FMC.  Cannot add to destinationNetworks.'
@@ -1682,29 +1653,17 @@ class Bulk(object):
 
         # The FMC has two limitations for bulk operations that can be reached
         # independently. This first is the maximum amount of records. The second
-        # is the maximum size in bytes of a single payload. We need to ensure
-        # that if we hit either, that we post the data before continuing to the
-        # next bulk operation
+        # is the maximum size in bytes of a single payload. json_chunker() posts
+        # a chunk as soon as adding the next item would exceed either one.
 
-        data = []
+        max_bytes = min(self.MAX_SIZE_IN_BYTES, self.fmc.FMC_MAX_PAYLOAD)
         response = None
 
-        for item in items:
-            if (
-                len(str(item)) + len(str(data)) >= self.MAX_SIZE_IN_BYTES
-                or len(data) == self.MAX_SIZE_QTY
-            ):
-                logging.info(f"Posting bulk items.")
-                if not self.fmc.send_to_api(method="post", url=url, json_data=data):
-                    return
-
-                data.clear()
-
-            data.append(item)
-
-        if data:
-            logging.info(f"Posting bulk items.")
+        for data in json_chunker(items, max_bytes, max_items=self.MAX_SIZE_QTY):
+            logging.info(f"Posting {len(data)} bulk items.")
             response = self.fmc.send_to_api(method="post", url=url, json_data=data)
+            if not response:
+                return
 
         return response
 
@@ -98,13 +98,9 @@ class AutoNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In original_network() for AutoNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to originalNetwork.'
@@ -122,13 +118,9 @@ class AutoNatRules(APIClassTemplate):
         """
         # Auto Nat rules can't use network group objects
         logging.debug("In translated_network() for AutoNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to translatedNetwork.'
@@ -209,13 +201,9 @@ class AutoNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In identity_nat() for AutoNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to this AutoNatRule.'
@@ -235,14 +223,7 @@ class AutoNatRules(APIClassTemplate):
         :return: None
         """
         # Network Group Object permitted for patPool
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"name": item["name"], "id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to patPool.'
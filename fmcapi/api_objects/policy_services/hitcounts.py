@@ -5,7 +5,6 @@ from .accesspolicies import AccessPolicies
 from .accessrules import AccessRules
 from fmcapi.api_objects.device_services.devicerecords import DeviceRecords
 from .prefilterpolicies import PreFilterPolicies
-from packaging.version import Version
 import logging
 
 
@@ -270,9 +269,7 @@ class HitCounts(APIClassTemplate):
         logging.debug("In get() for HitCount class.")
         self.parse_kwargs(**kwargs)
 
-        if Version(self.fmc.serverVersion.split(" ")[0]) < Version(
-            self.FIRST_SUPPORTED_FMC_VERSION
-        ):
+        if not self.fmc.supports(type(self)):
             logging.error(
                 f"Your FMC version, {self.fmc.serverVersion} does not support GET of this feature."
             )
@@ -131,14 +131,9 @@ class ManualNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In original_source() for ManualNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to original_source.'
@@ -155,14 +150,9 @@ class ManualNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In translated_source() for ManualNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to translated_source.'
@@ -181,14 +171,9 @@ class ManualNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In original_destination() for ManualNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to original_destination.'
@@ -207,14 +192,9 @@ class ManualNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In translated_destination() for ManualNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to translated_destination.'
@@ -383,14 +363,9 @@ class ManualNatRules(APIClassTemplate):
         :return: None
         """
         logging.debug("In identity_nat() for ManualNatRules class.")
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
+        if new_net is not None:
+            new_net = {"id": new_net["id"], "type": new_net["type"]}
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to this ManualNatRules.'
@@ -409,14 +384,7 @@ class ManualNatRules(APIClassTemplate):
         :param options: (dict) key/value of options.
         :return: None
         """
-        ipaddresses_json = NetworkAddresses(fmc=self.fmc).get()
-        networkgroup_json = NetworkGroups(fmc=self.fmc).get()
-        items = ipaddresses_json.get("items", []) + networkgroup_json.get("items", [])
-        new_net = None
-        for item in items:
-            if item["name"] == name:
-                new_net = {"name": item["name"], "id": item["id"], "type": item["type"]}
-                break
+        new_net = self.fmc.catalog.lookup(name, [NetworkAddresses, NetworkGroups])
         if new_net is None:
             logging.warning(
                 f'Network "{name}" is not found in FMC.  Cannot add to patPool.'
@@ -1,14 +1,21 @@
 """Search Classes."""
 
 import logging
-from .globalsearch import GlobalSearch
-from .object import Object
-from .policy import Policy
+from ..helper_functions import lazy_import
 
 logging.debug("In the object_services __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "GlobalSearch": ".globalsearch",
+    "Object": ".object",
+    "Policy": ".policy",
+}
+
 __all__ = [
     "GlobalSearch",
     "Object",
     "Policy",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
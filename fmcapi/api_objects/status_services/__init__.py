@@ -1,8 +1,17 @@
 """Status Services Classes."""
 
 import logging
-from .taskstatuses import TaskStatuses
+from ..helper_functions import lazy_import
 
 logging.debug("In the status_services __init__.py file.")
 
-__all__ = ["TaskStatuses"]
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "TaskStatuses": ".taskstatuses",
+    "TaskTracker": ".tasktracker",
+    "TaskFuture": ".tasktracker",
+}
+
+__all__ = ["TaskStatuses", "TaskTracker", "TaskFuture"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
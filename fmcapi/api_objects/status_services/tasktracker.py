@@ -0,0 +1,206 @@
+"""Track FMC tasks (metadata.task of a POST response) until they finish."""
+
+from concurrent.futures import Future
+import concurrent.futures
+import logging
+import threading
+import time
+from .taskstatuses import TaskStatuses
+
+
+class TaskFuture(Future):
+    """
+    Handle of a tracked task.
+
+    result() returns the last task status returned by the FMC once the task succeeded, failed or timed out.  Use
+    succeeded() or status to tell which.
+    """
+
+    def __init__(
+        self, task_id, timeout=None, done_when_missing=False, max_poll_interval=None
+    ):
+        """
+        Initialize TaskFuture object.
+
+        :param task_id (str): UUID of the task.
+        :param timeout (int): Seconds to wait for the task to finish.  None waits forever.
+        :param done_when_missing (bool): Consider the task finished once the FMC answers 404 for it.
+        :param max_poll_interval (int): Cap on the seconds between two polls of this task.
+        :return: None
+        """
+        super().__init__()
+        self.task_id = task_id
+        self.done_when_missing = done_when_missing
+        self.max_poll_interval = max_poll_interval
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.next_poll = time.monotonic()
+        self.poll_interval = None
+        self.status = None
+
+    def succeeded(self):
+        """
+        Check whether the task finished successfully.
+
+        :return: (boolean)
+        """
+        return (
+            self.done()
+            and self.status is not None
+            and self.status.upper() in TaskTracker.SUCCESS_STATES
+        )
+
+
+class TaskTracker(object):
+    """
+    Poll the status of many FMC tasks from one background thread.
+
+    Each task is polled with its own exponential backoff, starting at POLL_INTERVAL seconds and growing by
+    BACKOFF_FACTOR up to MAX_POLL_INTERVAL.  The thread only runs while there are tasks to track.
+    """
+
+    SUCCESS_STATES = ["SUCCESS", "COMPLETED", "DEPLOYED"]
+    FAILURE_STATES = ["FAILED", "FAILURE", "ERROR", "DEPLOYMENT_FAILED", "ABORTED"]
+    POLL_INTERVAL = 2
+    MAX_POLL_INTERVAL = 30
+    BACKOFF_FACTOR = 2
+
+    def __init__(self, fmc, timeout=None):
+        """
+        Initialize TaskTracker object.
+
+        :param fmc (object): FMC object
+        :param timeout (int): Default seconds to wait for a task to finish.  (Default is None, wait forever)
+        :return: None
+        """
+        logging.debug("In __init__() for TaskTracker class.")
+        self.fmc = fmc
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.pending = []
+        self.thread = None
+
+    def track(
+        self,
+        task,
+        timeout=None,
+        callback=None,
+        done_when_missing=False,
+        max_poll_interval=None,
+    ):
+        """
+        Start tracking a task.
+
+        :param task: (dict) metadata.task of a response, a whole response with metadata.task, or a task id.
+        :param timeout: (int) Seconds to wait for the task to finish.  (Default is None, use self.timeout)
+        :param callback: (function) Called with the TaskFuture once the task finished.
+        :param done_when_missing: (bool) Some tasks, like device registrations, are deleted by the FMC when they
+        finish.  Consider such a task done once the FMC answers 404 for it; other errors are polled again.
+        (Default is False)
+        :param max_poll_interval: (int) Cap on the seconds between two polls of this task.
+        :return: (TaskFuture)
+        """
+        if isinstance(task, dict):
+            task = task.get("metadata", {}).get("task", task)
+            task = task["id"]
+        future = TaskFuture(
+            task_id=task,
+            timeout=self.timeout if timeout is None else timeout,
+            done_when_missing=done_when_missing,
+            max_poll_interval=max_poll_interval,
+        )
+        # Tracked tasks can't be cancelled, the FMC carries on with them anyway.
+        future.set_running_or_notify_cancel()
+        if callback is not None:
+            future.add_done_callback(callback)
+        logging.info(f"Tracking task {future.task_id}.")
+        with self.lock:
+            self.pending.append(future)
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._poll_loop, name="fmcapi-task-tracker", daemon=True
+                )
+                self.thread.start()
+        self.wakeup.set()
+        return future
+
+    @staticmethod
+    def wait(futures, timeout=None):
+        """
+        Wait for several tasks to finish.
+
+        :param futures: (list) TaskFutures returned by track().
+        :param timeout: (int) Seconds to wait.  (Default is None, wait forever)
+        :return: (list) TaskFutures that finished.
+        """
+        done, _ = concurrent.futures.wait(futures, timeout=timeout)
+        return [future for future in futures if future in done]
+
+    def poll(self, future):
+        """
+        Get the status of one task and finish its future if the task is over.
+
+        :param future: (TaskFuture)
+        :return: None
+        """
+        url = f"{TaskStatuses(fmc=self.fmc).URL}/{future.task_id}"
+        missing = False
+        try:
+            response = self.fmc.send_to_api(method="get", url=url)
+            missing = response is None and self.fmc.last_status_code() == 404
+        except Exception as e:
+            logging.warning(f"Checking task {future.task_id} failed: {e}")
+            response = None
+        if missing and future.done_when_missing:
+            response = {"id": future.task_id, "status": "COMPLETED"}
+        status = (response or {}).get("status")
+        if status is not None:
+            future.status = status
+        if status is not None and status.upper() in (
+            self.SUCCESS_STATES + self.FAILURE_STATES
+        ):
+            logging.info(f"Task {future.task_id}: {status}")
+            future.set_result(response)
+            return
+        now = time.monotonic()
+        if future.deadline is not None and now >= future.deadline:
+            logging.warning(f"Task {future.task_id} didn't finish in time.")
+            future.status = "TIMEOUT"
+            future.set_result(dict(response or {}, id=future.task_id, status="TIMEOUT"))
+            return
+        if future.poll_interval is None:
+            future.poll_interval = self.POLL_INTERVAL
+        else:
+            future.poll_interval *= self.BACKOFF_FACTOR
+        future.poll_interval = min(
+            future.poll_interval, future.max_poll_interval or self.MAX_POLL_INTERVAL
+        )
+        future.next_poll = now + future.poll_interval
+        if future.deadline is not None:
+            future.next_poll = min(future.next_poll, future.deadline)
+        logging.debug(
+            f"Task {future.task_id}: {status}.  Checking again in {future.poll_interval} seconds."
+        )
+
+    def _poll_loop(self):
+        """Body of the background thread: poll every task that is due, then sleep until the next one is."""
+        while True:
+            with self.lock:
+                self.pending = [f for f in self.pending if not f.done()]
+                if not self.pending:
+                    self.thread = None
+                    return
+                now = time.monotonic()
+                due = [f for f in self.pending if f.next_poll <= now]
+                if not due:
+                    delay = min(f.next_poll for f in self.pending) - now
+                    self.wakeup.clear()
+            if not due:
+                self.wakeup.wait(delay)
+                continue
+            for future in due:
+                try:
+                    self.poll(future)
+                except Exception as e:
+                    logging.error(f"Tracking task {future.task_id} failed: {e}")
+                    future.set_exception(e)
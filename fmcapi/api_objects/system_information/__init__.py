@@ -1,8 +1,15 @@
 """System Information Classes."""
 
 import logging
-from .serverversion import ServerVersion
+from ..helper_functions import lazy_import
 
 logging.debug("In the system_information __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "ServerVersion": ".serverversion",
+}
+
 __all__ = ["ServerVersion"]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
@@ -1,14 +1,21 @@
 """Update Packages Classes."""
 
 import logging
-from .listapplicabledevices import ListApplicableDevices
-from .upgradepackages import UpgradePackages
-from .upgradepackage import Upgrades
+from ..helper_functions import lazy_import
 
 logging.debug("In the update_packages __init__.py file.")
 
+# Classes are only imported the first time they are used, see lazy_import().
+_LAZY_IMPORTS = {
+    "ListApplicableDevices": ".listapplicabledevices",
+    "UpgradePackages": ".upgradepackages",
+    "Upgrades": ".upgradepackage",
+}
+
 __all__ = [
     "ListApplicableDevices",
     "UpgradePackages",
     "Upgrades",
 ]
+
+__getattr__, __dir__ = lazy_import(__name__, _LAZY_IMPORTS)
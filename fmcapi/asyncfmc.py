@@ -0,0 +1,448 @@
+"""
+Establish and manage an asynchronous connection to FMC.
+
+This module (asyncfmc.py) provides AsyncFMC, an asyncio flavoured sibling of the FMC class.  Requests are sent with
+httpx so many API calls, across several domains or FMCs, can be in flight from one event loop.  The api_objects
+classes offer async variants of their methods (aget(), apost(), aput(), adelete(), abulk_post(), abulk_delete())
+that work with either FMC or AsyncFMC.
+
+Requires the ``httpx`` package (``pip install fmcapi[async]``).
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sys import exit
+from .fmc import FMC, Token
+from .api_objects import DeploymentRequests
+
+try:
+    import httpx
+
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+
+class AsyncFMC(FMC):
+    """Establish and maintain an asyncio connection to Firepower Management Center."""
+
+    logging.debug("In the AsyncFMC() class.")
+
+    def __init__(self, executor_workers=32, **kwargs):
+        """
+        Instantiate some variables prior to calling the __aenter__() method.
+
+        Accepts the same arguments as FMC.
+
+        :param executor_workers (int): Threads used to run the (blocking) api_objects logic of aget(), apost(),
+        etc. while their requests are sent from the event loop. (Default is 32)
+        :return: None
+        """
+        if not _HTTPX_AVAILABLE:
+            raise ImportError(
+                "The 'httpx' package is required for AsyncFMC. "
+                "Install it with: pip install httpx"
+            )
+        super().__init__(**kwargs)
+        logging.debug("In the AsyncFMC __init__() class method.")
+        self.executor_workers = executor_workers
+        self.client = None
+        self.loop = None
+        self.loop_thread = None
+        self.token_lock = None
+
+    def __enter__(self):
+        """AsyncFMC must be used with "async with"."""
+        raise TypeError('Use "async with AsyncFMC(...)" instead of "with".')
+
+    def __exit__(self, *args):
+        """AsyncFMC must be used with "async with"."""
+        raise TypeError('Use "async with AsyncFMC(...)" instead of "with".')
+
+    async def __aenter__(self):
+        """
+        Get a token from the FMC as well as the Global UUID.  With this information set up the base_url variable.
+
+        :return: self
+        """
+        logging.debug("In the AsyncFMC __aenter__() class method.")
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.token_lock = asyncio.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=self.executor_workers)
+        self.client = self.build_client()
+        if self.api_key is None:
+            # Tokens are only (re)generated every 30 minutes so the synchronous Token is run in a thread.
+            self.session = self.build_session()
+            self.mytoken = await self.loop.run_in_executor(
+                self.executor,
+                lambda: Token(
+                    host=self.host,
+                    username=self.username,
+                    password=self.password,
+                    domain=self.domain,
+                    verify_cert=self.VERIFY_CERT,
+                    timeout=self.timeout,
+                    session=self.session,
+                    cache_file=self.token_cache,
+                    background_refresh=self.token_background_refresh,
+                ),
+            )
+            if not self.mytoken.access_token:
+                logging.info("User authentication failed.")
+                exit(1)
+            self.uuid = self.mytoken.uuid
+        else:
+            if self.cdfmc:
+                logging.debug("cdFMC is True.")
+                logging.debug(f"Fetching cdFMC global domain uuid.")
+                domain_info = await self.send_to_api(
+                    method="get",
+                    url=f"https://{self.host}/api/fmc_platform/v1/info/domain",
+                )
+                if domain_info is not None:
+                    for i in domain_info["items"]:
+                        if i["name"] == "Global":
+                            self.uuid = i["uuid"]
+                            logging.debug(f"cdFMC global uuid found! {self.uuid}")
+                else:
+                    logging.error(f"Unable to retrieve global domain UUID from cdFMC")
+            elif self.uuid is None:
+                logging.error("If using an API_KEY, you must provide a UUID")
+                exit(1)
+
+        self.build_urls()
+        response = await self.send_to_api(
+            method="get", url=f"{self.platform_url}/info/serverversion"
+        )
+        if response and "items" in response:
+            self.vdbVersion = response["items"][0]["vdbVersion"]
+            self.sruVersion = response["items"][0]["sruVersion"]
+            self.serverVersion = response["items"][0]["serverVersion"]
+            self.geoVersion = response["items"][0].get("geoVersion")
+        logging.info(f"This FMC's version is {self.serverVersion}")
+        return self
+
+    async def __aexit__(self, *args):
+        """
+        If autodeploy == True, push changes to FMC upon exit of "async with" contract.
+
+        :param args:
+        :return: None
+        """
+        logging.debug("In the AsyncFMC __aexit__() class method.")
+        if self.autodeploy:
+            await self.loop.run_in_executor(
+                self.executor, DeploymentRequests(fmc=self).post
+            )
+        else:
+            logging.info(
+                "Auto deploy changes set to False.  Use the Deploy button in FMC to push changes to FTDs."
+            )
+        if self.mytoken is not None:
+            await self.loop.run_in_executor(self.executor, self.mytoken.stop)
+        await self.client.aclose()
+        self.client = None
+        self.executor.shutdown(wait=False)
+        self.executor = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def build_client(self):
+        """
+        Build the pooled httpx client used for all API calls made through this AsyncFMC object.
+
+        :return: (httpx.AsyncClient)
+        """
+        logging.debug("In the AsyncFMC build_client() class method.")
+        max_connections = max(self.pool_maxsize, self.max_workers)
+        transport = httpx.AsyncHTTPTransport(
+            verify=self.VERIFY_CERT,
+            retries=self.max_retries,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections if self.keep_alive else 0,
+            ),
+        )
+        return httpx.AsyncClient(timeout=self.timeout, transport=transport)
+
+    def on_loop_thread(self):
+        """
+        Check whether the caller is running on this AsyncFMC's event loop thread.
+
+        :return: (boolean)
+        """
+        return self.loop_thread == threading.get_ident()
+
+    def send_to_api(
+        self, method="", url="", headers="", json_data=None, more_items=None
+    ):
+        """
+        Send API call to FMC.
+
+        From the event loop this returns an awaitable: "response = await fmc.send_to_api(...)".  When called from
+        any other thread (which is how the api_objects classes use it inside aget(), apost(), etc.) the request is
+        scheduled on the event loop and the call blocks until the response is available.
+
+        :param method (str): GET, POST, PUT, or DELETE
+        :param url (str): URL for API call.
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :param more_items (str):  Deprecated.  Paging is handled internally.
+        :return: JSON response from FMC
+        """
+        logging.debug("In the AsyncFMC send_to_api() class method.")
+        coroutine = self.asend_to_api(
+            method=method, url=url, headers=headers, json_data=json_data
+        )
+        if self.on_loop_thread():
+            return coroutine
+        response, self.request_status.code = asyncio.run_coroutine_threadsafe(
+            self._with_status_code(coroutine), self.loop
+        ).result()
+        return response
+
+    async def _with_status_code(self, coroutine):
+        """
+        Await coroutine and pass on the status code it left on the event loop's thread, see last_status_code().
+
+        :param coroutine: asend_to_api() call.
+        :return: (tuple) Response and HTTP status code.
+        """
+        response = await coroutine
+        return response, self.last_status_code()
+
+    async def asend_to_api(self, method="", url="", headers="", json_data=None):
+        """
+        Send API call to FMC and await the response, following paging like FMC.send_to_api().
+
+        :param method (str): GET, POST, PUT, or DELETE
+        :param url (str): URL for API call.
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: JSON response from FMC
+        """
+        json_response = None
+        items = []
+        pages = 0
+        async for page in self._aiter_pages(
+            method=method, url=url, headers=headers, json_data=json_data
+        ):
+            if page is None:
+                return None
+            json_response = page
+            if isinstance(page, dict):
+                items += page.get("items", [])
+            pages += 1
+        if pages > 1:
+            json_response["items"] = items
+        return json_response
+
+    async def aiter_pages(self, url="", method="get", headers="", json_data=None):
+        """
+        Async generator that yields each page of the response as soon as it arrives.
+
+        :param url (str): URL for API call.
+        :param method (str): GET, POST, PUT, or DELETE (Default is get)
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: (async generator) JSON response of each page
+        """
+        async for page in self._aiter_pages(
+            method=method, url=url, headers=headers, json_data=json_data
+        ):
+            if page is None:
+                return
+            yield page
+
+    async def aiter_items(self, url="", method="get", headers="", json_data=None):
+        """
+        Async generator that yields the "items" of a (paged) response one at a time.
+
+        :return: (async generator) items
+        """
+        async for page in self.aiter_pages(
+            url=url, method=method, headers=headers, json_data=json_data
+        ):
+            if isinstance(page, dict):
+                for item in page.get("items", []):
+                    yield item
+
+    async def _aiter_pages(self, method="", url="", headers="", json_data=None):
+        """
+        Loop over the pages of a response, yielding None if a request fails.
+
+        :return: (async generator) JSON response of each page
+        """
+        page_counter = 0
+        while url:
+            json_response = await self._asend_request(
+                method=method, url=url, headers=headers, json_data=json_data
+            )
+            if json_response is None:
+                yield None
+                return
+            yield json_response
+            url = self._next_page_url(json_response, page_counter)
+            page_counter += 1
+            if url and method == "get" and self.max_workers > 1:
+                page_urls = self._remaining_page_urls(json_response, url, page_counter)
+                if page_urls:
+                    semaphore = asyncio.Semaphore(self.max_workers)
+
+                    async def fetch(page_url):
+                        async with semaphore:
+                            return await self._asend_request(
+                                method="get", url=page_url, headers=headers
+                            )
+
+                    tasks = [
+                        asyncio.ensure_future(fetch(page_url)) for page_url in page_urls
+                    ]
+                    try:
+                        for task in tasks:
+                            page = await task
+                            yield page
+                            if page is None:
+                                return
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+                    return
+
+    def _send_request(self, method="", url="", headers="", json_data=None):
+        """
+        Send a single API call from a thread other than the event loop's.
+
+        This lets the synchronous FMC.send_to_api()/iter_pages() logic run in worker threads.
+
+        :return: JSON response from FMC or None on error
+        """
+        if self.on_loop_thread():
+            raise RuntimeError(
+                "Blocking AsyncFMC call made from the event loop.  Use await fmc.send_to_api() instead."
+            )
+        return asyncio.run_coroutine_threadsafe(
+            self._asend_request(
+                method=method, url=url, headers=headers, json_data=json_data
+            ),
+            self.loop,
+        ).result()
+
+    async def _aget_token(self):
+        """
+        Return a valid access token, renewing it in a worker thread when needed.
+
+        :return: (str) access token
+        """
+        if not self.mytoken.expired():
+            return self.mytoken.access_token
+        async with self.token_lock:
+            return await self.loop.run_in_executor(
+                self.executor, self.mytoken.get_token
+            )
+
+    async def _asend_request(self, method="", url="", headers="", json_data=None):
+        """
+        Send a single API call to FMC, handling throttling and token expiry.
+
+        :param method (str): GET, POST, PUT, or DELETE
+        :param url (str): URL for API call.
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: JSON response from FMC or None on error
+        """
+        if method not in ["get", "post", "put", "delete"]:
+            logging.error("No request method given.  Returning nothing.")
+            return None
+        if self.api_key is not None or headers == "":
+            headers = self.build_headers(
+                access_token=None if self.api_key else await self._aget_token()
+            )
+        self.log_sent(method, url, headers, json_data)
+        self.request_status.code = None
+        attempt = 0
+        sent_count = 0
+        token_renewed = False
+        while True:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.before_request_hooks:
+                self.run_hooks(
+                    self.before_request_hooks,
+                    {"method": method.upper(), "url": url, "attempt": sent_count},
+                )
+            sent = time.monotonic()
+            response = await self.client.request(
+                method.upper(),
+                url,
+                json=json_data if method in ["post", "put"] else None,
+                headers=headers,
+            )
+            status_code = self.request_status.code = response.status_code
+            if "Date" in response.headers:
+                self.server_date = (response.headers["Date"], time.time())
+            if self.request_logger is not None or self.after_request_hooks:
+                self.after_request(
+                    {
+                        "method": method.upper(),
+                        "url": url,
+                        "attempt": sent_count,
+                        "status": status_code,
+                        "latency": time.monotonic() - sent,
+                        "wait": delay,
+                        "request_bytes": len(response.request.content),
+                        "response_bytes": len(response.content),
+                    }
+                )
+            sent_count += 1
+            if status_code == 429:
+                delay = self.rate_limiter.throttle(
+                    attempt=attempt, retry_after=response.headers.get("Retry-After")
+                )
+                logging.warning(
+                    f"Too many connections to the FMC.  Waiting {delay:.1f} "
+                    f"seconds and trying again."
+                )
+                attempt += 1
+                continue
+            if status_code == 401 and self.api_key is None and not token_renewed:
+                logging.warning("Token has expired. Trying to refresh.")
+                async with self.token_lock:
+                    access_token = await self.loop.run_in_executor(
+                        self.executor,
+                        self.mytoken.renew,
+                        headers.get("X-auth-access-token"),
+                    )
+                headers = self.build_headers(access_token=access_token)
+                token_renewed = True
+                continue
+            if status_code == 401:
+                logging.warning(
+                    "Received HTTP Code 401 from FMC. Please check that your API key is valid and has the correct permissions in CDO/FMC"
+                )
+            if status_code == 422:
+                logging.warning(
+                    "Either:\n\t1. Payload too large.  FMC can only handle a payload of "
+                    f"{self.FMC_MAX_PAYLOAD} bytes.\n\t2.The payload contains an unprocessable or "
+                    f"unreadable entity such as a invalid attribut name or incorrect JSON syntax "
+                )
+            break
+        try:
+            json_response = json.loads(response.text) if response.text else {}
+        except ValueError:
+            json_response = None
+        if status_code > 301 or json_response is None or "error" in json_response:
+            logging.error(
+                f"Error in {method.upper()} operation --> {status_code} for url {url}"
+            )
+            logging.error(f"json_response -->\t{json_response}")
+            self.error_response = json_response
+            return None
+        return json_response
@@ -0,0 +1,737 @@
+"""
+Cache of FMC objects used to resolve object names to their id/type.
+
+Methods such as AccessRules.source_network() need to turn an object name into a reference ({"name", "id",
+"type"}).  Rather than downloading the whole collection of network objects every time, the FMC object keeps an
+ObjectCatalog that downloads each collection once, keeps it for "ttl" seconds and is updated in place by the
+post(), put() and delete() methods of the api_objects classes.
+
+With FMC(catalog_file=...) the catalog is also kept in an SQLite file, so that the next run starts warm.  The FMC
+can't list just the objects modified since a given time, so a collection restored from the file is brought up to date
+from the FMC's audit log instead: objects changed or deleted since the last sync are downloaded again or dropped one
+by one, and only the collections that got new objects are listed again.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+
+
+class ObjectCatalog(object):
+    """Session scoped name -> object cache, keyed by (type, name)."""
+
+    logging.debug("In the ObjectCatalog class.")
+
+    REFERENCE_KEYS = ["id", "name", "type"]
+    # Keys kept in the catalog file.
+    STORED_KEYS = REFERENCE_KEYS + ["value"]
+    # Audit records of requests and sessions, which don't change objects.
+    READ_ONLY_AUDIT = re.compile(r"^(GET\b|Log(in|out)\b)", re.IGNORECASE)
+    # Audit records of API requests that change objects: the method and the path below the domain.
+    AUDIT_REQUEST = re.compile(
+        r"^(?P<method>POST|PUT|DELETE)\s+(?:\S*?/domain/[^/\s]+/)?(?P<path>[^?\s]+)",
+        re.IGNORECASE,
+    )
+    # Seconds subtracted from the time of the last sync when reading the audit log, so that records written a little
+    # late aren't missed.
+    AUDIT_MARGIN = 60
+    # Object types each collection can hold, so that objects created in this session are found even before the
+    # collection has returned an object of that type.
+    COLLECTION_TYPES = {
+        "NetworkAddresses": ["Host", "Network", "Range", "FQDN"],
+        "Hosts": ["Host"],
+        "Networks": ["Network"],
+        "Ranges": ["Range"],
+        "NetworkGroups": ["NetworkGroup"],
+        "FQDNS": ["FQDN"],
+        "ProtocolPortObjects": ["ProtocolPortObject"],
+        "PortObjectGroups": ["PortObjectGroup"],
+        "SecurityZones": ["SecurityZone"],
+    }
+    # Every type of COLLECTION_TYPES.
+    DEFAULT_TYPES = {t for types in COLLECTION_TYPES.values() for t in types}
+    # The same, by URL path below the domain, to apply the changes recorded in the audit log.
+    PATH_TYPES = {
+        f"object/{name.lower()}": types for name, types in COLLECTION_TYPES.items()
+    }
+
+    def __init__(self, fmc, ttl=300, path=None):
+        """
+        Initialize variables used in the ObjectCatalog class.
+
+        :param fmc (object): FMC object
+        :param ttl (int): Seconds a downloaded collection is trusted.  None or 0 disables caching. (Default is 300)
+        :param path (str): SQLite file keeping the catalog between runs. (Default is None, keep it in memory only)
+        :return: None
+        """
+        logging.debug("In the ObjectCatalog __init__() class method.")
+        self.fmc = fmc
+        self.ttl = ttl
+        self.lock = threading.RLock()
+        # Held while a collection downloads, so that only lookups of that collection wait for it.
+        self.loading = {}
+        # Changes this session made to the objects while their collection downloads.
+        self.downloads = {}
+        self.audit_lock = threading.Lock()
+        self.entries = {}
+        self.ids = {}
+        self.collections = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.restores = 0
+        self.snapshot = None if path is None else CatalogSnapshot(path)
+        # (since, checked, monotonic time) of the last audit log check.
+        self.audit_checked = None
+        # Ids and times of the audit records already applied, read from the catalog file on first use.
+        self.applied_audit = None
+
+    def lookup(self, name, api_classes, types=None):
+        """
+        Find the object called "name" in the collections of api_classes.
+
+        :param name (str): Name of the object.
+        :param api_classes (list): APIClassTemplate classes whose collections may hold the object.
+        :param types (list): Acceptable object "type" values.  None accepts any type. (Default is None)
+        :return: (dict) {"id", "name", "type"} reference or None if not found.
+        """
+        logging.debug("In the ObjectCatalog lookup() class method.")
+        for api_class in api_classes:
+            self.load(api_class)
+        with self.lock:
+            candidates = types
+            if candidates is None:
+                candidates = []
+                for api_class in api_classes:
+                    collection = self.collections.get(self._key(api_class), {})
+                    candidates += sorted(collection.get("types", []))
+            for type_ in candidates:
+                item = self.entries.get((type_, name))
+                if item is not None:
+                    self.hits += 1
+                    return dict(item)
+            self.misses += 1
+            return None
+
+    def load(self, api_class, force=False):
+        """
+        Download the collection of api_class unless a fresh copy is already cached.
+
+        :param api_class (class): APIClassTemplate class to list.
+        :param force (bool): Download even if the cached copy is still fresh. (Default is False)
+        :return: None
+        """
+        key = self._key(api_class)
+        with self.lock:
+            loading = self.loading.setdefault(key, threading.Lock())
+        with loading:
+            with self.lock:
+                collection = self.collections.get(key)
+                if not force and collection is not None and self._fresh(collection):
+                    return
+                if not force and self.snapshot is not None and collection is None:
+                    collection = self.restore(key)
+            if not force and collection is not None and self.snapshot is not None:
+                checked = self.catch_up(collection["synced"])
+                if checked is not None:
+                    with self.lock:
+                        collection["loaded"] = time.monotonic()
+                        collection["synced"] = checked
+                    self.snapshot.touch(self.scope, key, checked)
+                    return
+            logging.info(f"Loading {api_class.__name__} into the object catalog.")
+            synced = self.fmc.server_time()
+            fields = self.REFERENCE_KEYS if self.snapshot is None else self.STORED_KEYS
+            with self.lock:
+                self.downloads[key] = []
+            try:
+                response = api_class(fmc=self.fmc).get(fields=fields)
+            finally:
+                with self.lock:
+                    changes = self.downloads.pop(key)
+            if not response:
+                logging.warning(
+                    f"Unable to load {api_class.__name__} into the object catalog."
+                )
+                return
+            items = response.get("items", [])
+            types = set(self.COLLECTION_TYPES.get(api_class.__name__, []))
+            if collection:
+                types.update(collection["types"])
+            types.update(item["type"] for item in items if "type" in item)
+            # Objects this session changed during the download may be missing from it or outdated.
+            items = {item.get("id"): item for item in items}
+            for change in changes:
+                if isinstance(change, dict):
+                    if change["type"] in types:
+                        items[change["id"]] = change
+                else:
+                    items.pop(change, None)
+            items = list(items.values())
+            with self.lock:
+                # The fresh download is authoritative for every type it covers.
+                for entry_key in [k for k in self.entries if k[0] in types]:
+                    self.ids.pop(self.entries.pop(entry_key)["id"], None)
+                for item in items:
+                    self._add(item)
+                self.collections[key] = {
+                    "loaded": time.monotonic(),
+                    "synced": synced,
+                    "types": types,
+                }
+                if self.snapshot is not None:
+                    self.snapshot.replace(self.scope, key, types, items, synced)
+                self.loads += 1
+
+    def restore(self, key):
+        """
+        Put a collection saved in the catalog file back in memory.
+
+        :param key (str): Cache key of the collection.
+        :return: (dict) The collection's {"loaded", "synced", "types"} or None if the file doesn't have it.
+        """
+        collection = self.snapshot.collection(self.scope, key)
+        if collection is None:
+            return None
+        for item in self.snapshot.items(self.scope, collection["types"]):
+            self._add(item)
+        collection["loaded"] = 0
+        self.collections[key] = collection
+        self.restores += 1
+        return collection
+
+    def catch_up(self, since):
+        """
+        Apply the changes the FMC's audit log records since a collection was synced.
+
+        Objects changed by a PUT are downloaded again and deleted objects are dropped, one by one.  A POST, whose
+        record doesn't name the new object, and bulk requests make the catalog list the objects of that URL again.
+        Changes to collections the catalog doesn't follow are ignored.  A change that can't be attributed, e.g. one
+        made in the web interface, makes the caller load its collection again.
+
+        A check answers for every collection synced later, as long as it is younger than ttl.
+
+        :param since (float): Epoch seconds, on the FMC's clock, of the last sync.
+        :return: (float) Epoch seconds, on the FMC's clock, up to which the catalog is in sync.  None if the collection
+        has to be loaded again.
+        """
+        # One check at a time: collections waiting for it are answered by its result.
+        with self.audit_lock:
+            return self._catch_up(since)
+
+    def _catch_up(self, since):
+        """Read and apply the audit log for catch_up()."""
+        if self.audit_checked is not None:
+            start, checked, when = self.audit_checked
+            if since >= start and self.ttl and time.monotonic() - when < self.ttl:
+                return checked
+        checked = self.fmc.server_time()
+        url = (
+            f"{self.fmc.platform_url}/domain/{self.fmc.uuid}/audit/auditrecords"
+            f"?starttime={int(since) - self.AUDIT_MARGIN}&expanded=true&limit={self.fmc.limit}"
+        )
+        records = []
+        count = None
+        pages = 0
+        for page in self.fmc.iter_pages(url=url):
+            if pages == 0:
+                count = page.get("paging", {}).get("count")
+            pages += 1
+            records += page.get("items", [])
+        # iter_pages() stops early, without an error, when a request fails.
+        if pages == 0 or (count is not None and len(records) < int(count)):
+            logging.warning("Unable to read the FMC's audit log.")
+            return None
+        if self.applied_audit is None:
+            self.applied_audit = self.snapshot.applied_audit(self.scope)
+        relist = set()
+        changed = {}
+        deleted = set()
+        for record in records:
+            message = record.get("message", "")
+            if (
+                record.get("id") in self.applied_audit
+                or self.READ_ONLY_AUDIT.match(message)
+                or self.READ_ONLY_AUDIT.match(record.get("subsystem", ""))
+            ):
+                continue
+            request = self.AUDIT_REQUEST.match(message)
+            if request is None:
+                logging.info(
+                    f"Objects may have changed since the catalog was synced: {message}"
+                )
+                return None
+            path = request.group("path").strip("/")
+            collection, _, object_id = path.rpartition("/")
+            if collection not in self.PATH_TYPES:
+                collection, object_id = path, None
+            if collection not in self.PATH_TYPES:
+                continue
+            if object_id is None:
+                relist.add(collection)
+            elif request.group("method").upper() == "DELETE":
+                deleted.add(object_id)
+            else:
+                changed.setdefault(collection, set()).add(object_id)
+        self.discard_many(sorted(deleted))
+        for collection, object_ids in changed.items():
+            if collection in relist:
+                continue
+            for object_id in object_ids - deleted:
+                if not self.reload_object(collection, object_id):
+                    return None
+        for collection in relist:
+            if not self.relist(collection):
+                return None
+        applied = {
+            record["id"]: record.get("time", checked)
+            for record in records
+            if "id" in record
+        }
+        # Records older than this are never read again.
+        oldest = checked - 2 * self.AUDIT_MARGIN
+        self.applied_audit = {
+            record_id: record_time
+            for record_id, record_time in dict(self.applied_audit, **applied).items()
+            if record_time >= oldest
+        }
+        self.snapshot.add_applied_audit(self.scope, applied, oldest)
+        self.audit_checked = (since, checked, time.monotonic())
+        return checked
+
+    def reload_object(self, collection, object_id):
+        """
+        Download one object again, or drop it if the FMC no longer has it.
+
+        :param collection (str): URL path of its collection below the domain.
+        :param object_id (str): UUID of the object.
+        :return: (boolean) False if the FMC couldn't be asked.
+        """
+        logging.debug(f"Reloading {collection}/{object_id} into the object catalog.")
+        item = self.fmc.send_to_api(
+            method="get", url=f"{self.fmc.configuration_url}/{collection}/{object_id}"
+        )
+        if item is None:
+            if self.fmc.last_status_code() != 404:
+                return False
+            self.discard(object_id)
+            return True
+        self.store(item)
+        return True
+
+    def relist(self, collection):
+        """
+        List the objects of one URL again, in place of the catalogued objects of its types.
+
+        :param collection (str): URL path of the collection below the domain, e.g. "object/hosts".
+        :return: (boolean) False if the listing failed.
+        """
+        logging.info(f"Listing {collection} again for the object catalog.")
+        types = set(self.PATH_TYPES[collection])
+        response = self.fmc.send_to_api(
+            method="get",
+            url=f"{self.fmc.configuration_url}/{collection}?expanded=true&limit={self.fmc.limit}",
+        )
+        if response is None:
+            return False
+        items = [
+            {k: item[k] for k in self.STORED_KEYS if k in item}
+            for item in response.get("items", [])
+            if item.get("type") in types
+        ]
+        with self.lock:
+            for entry_key in [k for k in self.entries if k[0] in types]:
+                self.ids.pop(self.entries.pop(entry_key)["id"], None)
+            for item in items:
+                self._add(item)
+            if self.snapshot is not None:
+                self.snapshot.replace(self.scope, None, types, items)
+        return True
+
+    @property
+    def scope(self):
+        """FMC and domain the catalog file's rows belong to."""
+        return f"{self.fmc.host}/{self.fmc.uuid}"
+
+    def store(self, item):
+        """
+        Add or replace an object created or changed by this session.  See store_many().
+
+        :param item (dict): Object as returned by the FMC.  Needs "id", "name" and "type".
+        :return: None
+        """
+        self.store_many([item])
+
+    def store_many(self, items):
+        """
+        Add or replace objects created or changed by this session, e.g. the items of a bulk POST.
+
+        Objects of types no catalogued collection holds are ignored.  The others are written to the catalog file, if
+        there is one, in one transaction.
+
+        :param items (list): Objects as returned by the FMC.  Need "id", "name" and "type".
+        :return: None
+        """
+        with self.lock:
+            types = self.catalogued_types()
+            items = [
+                item
+                for item in items
+                if isinstance(item, dict)
+                and all(k in item for k in self.REFERENCE_KEYS)
+                and item["type"] in types
+            ]
+            for item in items:
+                self._add(item)
+            for changes in self.downloads.values():
+                changes += items
+            if items and self.snapshot is not None:
+                self.snapshot.store(self.scope, items)
+
+    def discard(self, id):
+        """
+        Remove an object deleted by this session.  See discard_many().
+
+        :param id (str): UUID of the object.
+        :return: None
+        """
+        self.discard_many([id])
+
+    def discard_many(self, ids):
+        """
+        Remove objects deleted by this session, also from the catalog file in one transaction.
+
+        :param ids (list): UUIDs of the objects.
+        :return: None
+        """
+        with self.lock:
+            for id in ids:
+                self._remove(id)
+            for changes in self.downloads.values():
+                changes += ids
+            if ids and self.snapshot is not None:
+                self.snapshot.discard(self.scope, ids)
+
+    def catalogued_types(self):
+        """
+        Object types the catalog keeps: those of COLLECTION_TYPES and those listed by its collections.
+
+        :return: (set)
+        """
+        types = set(self.DEFAULT_TYPES)
+        for collection in self.collections.values():
+            types.update(collection["types"])
+        return types
+
+    def _add(self, item):
+        """Put an object in memory only, if it has an id, name and type."""
+        if not isinstance(item, dict) or not all(
+            k in item for k in self.REFERENCE_KEYS
+        ):
+            return
+        self._remove(item["id"])
+        self.entries[(item["type"], item["name"])] = {
+            k: item[k] for k in self.REFERENCE_KEYS
+        }
+        self.ids[item["id"]] = (item["type"], item["name"])
+
+    def _remove(self, id):
+        """Drop an object from memory only."""
+        entry_key = self.ids.pop(id, None)
+        if entry_key is not None:
+            self.entries.pop(entry_key, None)
+
+    def invalidate(self, api_class=None):
+        """
+        Forget cached collections so that they are downloaded again on next lookup, also from the catalog file.
+
+        :param api_class (class): Only forget this collection.  None forgets everything. (Default is None)
+        :return: None
+        """
+        with self.lock:
+            self.audit_checked = None
+            if api_class is None:
+                self.entries = {}
+                self.ids = {}
+                self.collections = {}
+            else:
+                self.collections.pop(self._key(api_class), None)
+            if self.snapshot is not None:
+                self.snapshot.forget(
+                    self.scope, None if api_class is None else self._key(api_class)
+                )
+
+    def close(self):
+        """
+        Close the catalog file, if there is one.
+
+        :return: None
+        """
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+    def stats(self):
+        """
+        Counters for catalog usage.
+
+        :return: (dict)
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "restores": self.restores,
+                "objects": len(self.entries),
+            }
+
+    def _fresh(self, collection):
+        """Check whether a cached collection is younger than ttl."""
+        if not self.ttl:
+            return False
+        return time.monotonic() - collection["loaded"] < self.ttl
+
+    @staticmethod
+    def _key(api_class):
+        """Cache key of an api_class' collection."""
+        return f"{api_class.__module__}.{api_class.__name__}"
+
+
+class CatalogSnapshot(object):
+    """SQLite file holding the collections of an ObjectCatalog between runs."""
+
+    logging.debug("In the CatalogSnapshot class.")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS objects (
+            scope TEXT NOT NULL,
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            value TEXT,
+            PRIMARY KEY (scope, id)
+        );
+        CREATE INDEX IF NOT EXISTS objects_by_name ON objects (scope, type, name);
+        CREATE TABLE IF NOT EXISTS audit (
+            scope TEXT NOT NULL,
+            id TEXT NOT NULL,
+            time REAL NOT NULL,
+            PRIMARY KEY (scope, id)
+        );
+        CREATE TABLE IF NOT EXISTS collections (
+            scope TEXT NOT NULL,
+            collection TEXT NOT NULL,
+            synced REAL NOT NULL,
+            types TEXT NOT NULL,
+            PRIMARY KEY (scope, collection)
+        );
+    """
+
+    def __init__(self, path):
+        """
+        Initialize variables used in the CatalogSnapshot class.
+
+        :param path (str): SQLite file, created if it doesn't exist.
+        :return: None
+        """
+        logging.debug("In the CatalogSnapshot __init__() class method.")
+        self.path = path
+        self.lock = threading.Lock()
+        self._connection = None
+        with self.lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+
+    @property
+    def connection(self):
+        """SQLite connection, opened again if the snapshot was closed."""
+        if self._connection is None:
+            import sqlite3
+
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        return self._connection
+
+    def collection(self, scope, key):
+        """
+        When a collection was synced and which object types it holds.
+
+        :param scope (str): FMC and domain.
+        :param key (str): Cache key of the collection.
+        :return: (dict) {"synced", "types"} or None if the collection isn't saved.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT synced, types FROM collections WHERE scope = ? AND collection = ?",
+                (scope, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"synced": row[0], "types": set(json.loads(row[1]))}
+
+    def items(self, scope, types):
+        """
+        Saved objects of some types.
+
+        :param scope (str): FMC and domain.
+        :param types (set): Object types.
+        :return: (list) {"id", "name", "type", "value"} dicts.
+        """
+        types = sorted(types)
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id, name, type, value FROM objects WHERE scope = ? "
+                f"AND type IN ({', '.join('?' * len(types))})",
+                [scope] + types,
+            ).fetchall()
+        return [dict(zip(["id", "name", "type", "value"], row)) for row in rows]
+
+    def replace(self, scope, key, types, items, synced=None):
+        """
+        Save a freshly downloaded collection in place of the objects of its types.
+
+        :param scope (str): FMC and domain.
+        :param key (str): Cache key of the collection.  None only replaces the objects.
+        :param types (set): Object types the collection holds.
+        :param items (list): Objects of the collection.
+        :param synced (float): Epoch seconds, on the FMC's clock, the download started.
+        :return: None
+        """
+        types = sorted(types)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM objects WHERE scope = ? "
+                f"AND type IN ({', '.join('?' * len(types))})",
+                [scope] + types,
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)",
+                [row for row in (self.row(scope, item) for item in items) if row],
+            )
+            if key is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO collections VALUES (?, ?, ?, ?)",
+                    (scope, key, synced, json.dumps(types)),
+                )
+
+    def applied_audit(self, scope):
+        """
+        Audit records whose changes the catalog file already holds.
+
+        :param scope (str): FMC and domain.
+        :return: (dict) {record id: record time}
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id, time FROM audit WHERE scope = ?", (scope,)
+            ).fetchall()
+        return dict(rows)
+
+    def add_applied_audit(self, scope, records, oldest):
+        """
+        Remember audit records whose changes were applied, and forget those that are too old to be read again.
+
+        :param scope (str): FMC and domain.
+        :param records (dict): {record id: record time}
+        :param oldest (float): Epoch seconds, on the FMC's clock, of the oldest record to keep.
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO audit VALUES (?, ?, ?)",
+                [
+                    (scope, record_id, record_time)
+                    for record_id, record_time in records.items()
+                ],
+            )
+            self.connection.execute(
+                "DELETE FROM audit WHERE scope = ? AND time < ?", (scope, oldest)
+            )
+
+    def touch(self, scope, key, synced):
+        """
+        Record that a collection was found unchanged.
+
+        :param scope (str): FMC and domain.
+        :param key (str): Cache key of the collection.
+        :param synced (float): Epoch seconds of the check.
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE collections SET synced = ? WHERE scope = ? AND collection = ?",
+                (synced, scope, key),
+            )
+
+    def store(self, scope, items):
+        """
+        Save objects created or changed by this session, in one transaction.
+
+        :param scope (str): FMC and domain.
+        :param items (list): Objects as returned by the FMC.
+        :return: None
+        """
+        rows = [row for row in (self.row(scope, item) for item in items) if row]
+        if not rows:
+            return
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def discard(self, scope, ids):
+        """
+        Remove objects deleted by this session, in one transaction.
+
+        :param scope (str): FMC and domain.
+        :param ids (list): UUIDs of the objects.
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM objects WHERE scope = ? AND id = ?",
+                [(scope, id) for id in ids],
+            )
+
+    def forget(self, scope, key=None):
+        """
+        Drop saved collections so that they are downloaded again.
+
+        :param scope (str): FMC and domain.
+        :param key (str): Cache key of the collection.  None drops every collection and object. (Default is None)
+        :return: None
+        """
+        with self.lock, self.connection:
+            if key is None:
+                self.connection.execute("DELETE FROM objects WHERE scope = ?", (scope,))
+                self.connection.execute(
+                    "DELETE FROM collections WHERE scope = ?", (scope,)
+                )
+            else:
+                self.connection.execute(
+                    "DELETE FROM collections WHERE scope = ? AND collection = ?",
+                    (scope, key),
+                )
+
+    def close(self):
+        """
+        Close the SQLite connection.
+
+        :return: None
+        """
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def row(scope, item):
+        """Row of the objects table for an object, None if it lacks an id, name or type."""
+        if not isinstance(item, dict) or not all(
+            k in item for k in ObjectCatalog.REFERENCE_KEYS
+        ):
+            return None
+        value = item.get("value")
+        if value is not None and not isinstance(value, str):
+            value = json.dumps(value)
+        return (scope, item["id"], item["name"], item["type"], value)
@@ -6,17 +6,39 @@ The "toolbox" is the FMC class and the "tools" are its methods.  Note: There exi
 FMC API too.  Just Google for it as it gets updated with each release of code.
 """
 
+import contextlib
 import datetime
+import email.utils
+import functools
+import os
+import random
 import requests
+import re
+import tempfile
+import threading
 import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from requests.packages.urllib3.util.retry import Retry
 import logging
 from logging.handlers import RotatingFileHandler
+from packaging.version import Version
 from .api_objects import ServerVersion
 from .api_objects import DeploymentRequests
+from .api_objects import TaskTracker
+from .catalog import ObjectCatalog
+from .metrics import MetricsCollector
 from sys import exit
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows.  The token cache file is then shared without locking.
+    fcntl = None
+
 # Disable annoying HTTP warnings
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -27,6 +49,9 @@ default logger.  This reduces the size of our log files.
 """
 logging.getLogger("requests").setLevel(logging.WARNING)
 
+# The FIRST_SUPPORTED_FMC_VERSION of every class is parsed once.
+parse_version = functools.lru_cache(maxsize=None)(Version)
+
 
 class FMC(object):
     """Establish and maintain connection to Firepower Management Center."""
@@ -39,6 +64,8 @@ class FMC(object):
     MAX_PAGING_REQUESTS = 2000
     TOO_MANY_CONNECTIONS_TIMEOUT = 30
     FMC_MAX_PAYLOAD = 2048000
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_CODES = [502, 503, 504]
 
     def __init__(
         self,
@@ -56,6 +83,19 @@ class FMC(object):
         api_key=None,
         cdfmc=False,
         uuid=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=3,
+        keep_alive=True,
+        max_workers=1,
+        rate_limit=110,
+        rate_burst=10,
+        catalog_ttl=300,
+        token_cache=None,
+        token_background_refresh=False,
+        request_log=None,
+        metrics=False,
+        catalog_file=None,
     ):
         """
         Instantiate some variables prior to calling the __enter__() method.
@@ -71,6 +111,26 @@ class FMC(object):
         :param debug (bool): True to enable debug logging. (Default is False)
         :param limit (int): Sets up max data to gather per "page". (Default is 1000)
         :param timeout (int):  Maximum seconds to establish connection (Default is 5)
+        :param pool_connections (int): Number of connection pools to cache in the HTTP session. (Default is 10)
+        :param pool_maxsize (int): Maximum number of connections kept alive per pool. (Default is 10)
+        :param max_retries (int): Retries for failed connections and 502/503/504 responses. (Default is 3)
+        :param keep_alive (bool): Reuse TCP/TLS connections between API calls. (Default is True)
+        :param max_workers (int): Maximum number of pages fetched in parallel for collection GETs. Keep this low
+        as the FMC only allows 120 requests per minute. (Default is 1, fetch pages serially)
+        :param rate_limit (int): Maximum requests per minute sent to the FMC.  None disables pacing. (Default is 110)
+        :param rate_burst (int): Requests that may be sent back to back before pacing kicks in. (Default is 10)
+        :param catalog_ttl (int): Seconds object listings used for name lookups are cached.  None disables
+        the cache. (Default is 300)
+        :param token_cache (str): File used to share the token between processes logging in as the same user, so that
+        a pool of workers doesn't use up the FMC's sessions. (Default is None, don't share)
+        :param token_background_refresh (bool): Renew the token in a background thread before it expires instead of
+        during a request. (Default is False)
+        :param request_log (str): File to write one JSON line per HTTP request to, with its method, URL, status,
+        bytes and latency.  Payloads aren't logged. (Default is None)
+        :param metrics (bool): Collect per endpoint request metrics in self.metrics, see fmcapi.metrics.
+        (Default is False)
+        :param catalog_file (str): SQLite file keeping the object catalog between runs, so that name lookups start
+        warm and collections are only listed again when the FMC's audit log shows changes. (Default is None)
         :return: None
         """
         self.debug = debug
@@ -113,17 +173,94 @@ class FMC(object):
         self.timeout = timeout
         self.vdbVersion = None
         self.sruVersion = None
+        self.version = None
+        self.capabilities = {}
         self.serverVersion = None
         self.geoVersion = None
         self.configuration_url = None
         self.platform_url = None
-        self.page_counter = None
-        self.more_items = []
         self.error_response = None
+        # HTTP status code of the last request of each thread, see last_status_code().
+        self.request_status = threading.local()
+        # Date header of the last response and the local time it arrived, see server_time().
+        self.server_date = None
         self.wait_time = wait_time
         self.api_key = api_key
         self.cdfmc = cdfmc
         self.uuid = uuid
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(
+            rate=rate_limit,
+            burst=rate_burst,
+            max_backoff=self.TOO_MANY_CONNECTIONS_TIMEOUT,
+        )
+        self.catalog = ObjectCatalog(fmc=self, ttl=catalog_ttl, path=catalog_file)
+        self.task_tracker = TaskTracker(fmc=self)
+        self.token_cache = token_cache
+        self.token_background_refresh = token_background_refresh
+        self.mytoken = None
+        self.session = None
+        self.executor = None
+        self.request_logger = self.build_request_logger(request_log)
+        self.before_request_hooks = []
+        self.after_request_hooks = []
+        self.metrics = None
+        if metrics:
+            self.metrics = MetricsCollector()
+            self.add_request_hooks(after=self.metrics.record)
+
+    @property
+    def serverVersion(self):
+        """Version string of the FMC, e.g. "7.2.0 (build 82)"."""
+        return self._server_version
+
+    @serverVersion.setter
+    def serverVersion(self, server_version):
+        """
+        Set the version string, parse it once into self.version and reset the capability table.
+
+        :param server_version (str): Version string returned by the FMC.
+        :return: None
+        """
+        self._server_version = server_version
+        self.version = None
+        if server_version:
+            self.version = Version(server_version.split(" ")[0])
+        self.capabilities = {}
+
+    def supports(self, api_class):
+        """
+        Check whether this FMC's version has the API feature of api_class.
+
+        The verdict is computed once per class and kept in self.capabilities.  An unknown version supports
+        everything.
+
+        :param api_class (class): Class with a FIRST_SUPPORTED_FMC_VERSION attribute.
+        :return: (bool)
+        """
+        supported = self.capabilities.get(api_class)
+        if supported is None:
+            supported = self.version_at_least(api_class.FIRST_SUPPORTED_FMC_VERSION)
+            self.capabilities[api_class] = supported
+            if not supported:
+                logging.warning(
+                    f"{api_class.__name__} was released in FMC version {api_class.FIRST_SUPPORTED_FMC_VERSION}.  "
+                    f"Your FMC version is {self.serverVersion}.  Upgrade to use this feature."
+                )
+        return supported
+
+    def version_at_least(self, version):
+        """
+        Compare this FMC's version to version.
+
+        :param version (str): e.g. "6.4"
+        :return: (bool) True if the FMC runs version or newer, or if its version is unknown.
+        """
+        return self.version is None or self.version >= parse_version(version)
 
     def __enter__(self):
         """
@@ -132,6 +269,7 @@ class FMC(object):
         :return: self
         """
         logging.debug("In the FMC __enter__() class method.")
+        self.session = self.build_session()
         if self.api_key is None:
             self.mytoken = Token(
                 host=self.host,
@@ -140,6 +278,9 @@ class FMC(object):
                 domain=self.domain,
                 verify_cert=self.VERIFY_CERT,
                 timeout=self.timeout,
+                session=self.session,
+                cache_file=self.token_cache,
+                background_refresh=self.token_background_refresh,
             )
             if not self.mytoken.access_token:
                 logging.info("User authentication failed.")
@@ -192,6 +333,140 @@ class FMC(object):
             logging.info(
                 "Auto deploy changes set to False.  Use the Deploy button in FMC to push changes to FTDs."
             )
+        if self.mytoken is not None:
+            self.mytoken.stop()
+        self.catalog.close()
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    @staticmethod
+    def build_request_logger(request_log):
+        """
+        Set up the logger of the structured request log.
+
+        The logger isn't registered with the logging module, so its records don't reach the root logger's handlers.
+
+        :param request_log (str): Filename of the request log.  None disables it.
+        :return: (logging.Logger) or None
+        """
+        if not request_log:
+            return None
+        request_logger = logging.Logger("fmcapi.requests")
+        handler = RotatingFileHandler(request_log, maxBytes=1024000, backupCount=10)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        request_logger.addHandler(handler)
+        return request_logger
+
+    def add_request_hooks(self, before=None, after=None):
+        """
+        Register callbacks run around every HTTP request sent to the FMC, retries included.
+
+        before is called with {"method", "url", "attempt"} right before the request is sent.  after is called with
+        the same keys plus "status", "latency" (seconds), "wait" (seconds the rate limiter held the request back),
+        "request_bytes" and "response_bytes" once the response arrived.  "attempt" is 0 for the first try.
+        Exceptions raised by hooks are logged and otherwise ignored.
+
+        :param before (function): Called before each request. (Default is None)
+        :param after (function): Called after each request. (Default is None)
+        :return: None
+        """
+        if before is not None:
+            self.before_request_hooks.append(before)
+        if after is not None:
+            self.after_request_hooks.append(after)
+
+    @staticmethod
+    def run_hooks(hooks, event):
+        """Call each hook with event, logging rather than raising their errors."""
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logging.warning(f"Request hook {hook} failed: {e}")
+
+    def after_request(self, event):
+        """
+        Pass a finished request to the request log and the after request hooks.
+
+        :param event (dict): See add_request_hooks().
+        :return: None
+        """
+        if self.request_logger is not None:
+            self.log_request(event)
+        self.run_hooks(self.after_request_hooks, event)
+
+    def log_request(self, event):
+        """
+        Write one record to the structured request log.
+
+        :param event (dict): See add_request_hooks().
+        :return: None
+        """
+        self.request_logger.info(
+            json.dumps(
+                {
+                    "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "method": event["method"],
+                    "url": event["url"],
+                    "status": event["status"],
+                    "request_bytes": event["request_bytes"],
+                    "response_bytes": event["response_bytes"],
+                    "latency_ms": round(event["latency"] * 1000, 1),
+                }
+            )
+        )
+
+    @staticmethod
+    def log_sent(method, url, headers, json_data):
+        """Log a request at DEBUG level, only formatting the payload when DEBUG is enabled."""
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Being sent to FMC's API:\n\tHEADERS=%s\n\tURL=%s\n\tMETHOD=%s\n\tJSON_DATA=%s",
+                headers,
+                url,
+                method,
+                json_data,
+            )
+
+    @property
+    def throttle_stats(self):
+        """
+        Counters showing how much time requests spent being paced or throttled by the FMC.
+
+        :return: (dict)
+        """
+        return self.rate_limiter.stats()
+
+    def build_session(self):
+        """
+        Build the pooled HTTP session shared by the Token and all API calls made through this FMC object.
+
+        :return: (requests.Session)
+        """
+        logging.debug("In the FMC build_session() class method.")
+        retries = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,
+            status=self.max_retries,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=["GET", "PUT", "DELETE"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=max(self.pool_maxsize, self.max_workers),
+            max_retries=retries,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.VERIFY_CERT
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
 
     def build_urls(self):
         """
@@ -206,109 +481,339 @@ class FMC(object):
         )
         self.platform_url = f"https://{self.host}/{self.API_PLATFORM_VERSION}"
 
+    def build_headers(self, access_token=None):
+        """
+        Build the headers that work for most API requests.
+
+        :param access_token (str): Token used when not authenticating with an api_key.
+        :return: (dict) headers
+        """
+        if self.api_key is not None:
+            if self.cdfmc:
+                return {
+                    "accept": "application/json",
+                    "Authorization": f"Bearer {self.api_key}",
+                }
+            return {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}",
+            }
+        return {
+            "Content-Type": "application/json",
+            "X-auth-access-token": access_token,
+        }
+
     def send_to_api(
         self, method="", url="", headers="", json_data=None, more_items=None
     ):
         """
         Send API call to FMC.
 
+        Paged responses are followed until the last page and returned as one response whose "items" holds the items
+        of every page.  Use iter_pages() or iter_items() to process large collections a page at a time instead.
+
         :param method (str): GET, POST, PUT, or DELETE
         :param url (str): URL for API call.
         :param headers (str):  String of header variables.
         :param json_data (str):  JSON formatted string as payload. (Default is None)
-        :param more_items (str):  Used for paging in query.
+        :param more_items (str):  Deprecated.  Paging is handled internally.
         :return: JSON response from FMC
         """
         logging.debug("In the FMC send_to_api() class method.")
 
-        if not more_items:
-            self.more_items = []
-            self.page_counter = 0
-        if self.api_key is not None:
-            if self.cdfmc:
-                headers = {
-                    "accept": "application/json",
-                    "Authorization": f"Bearer {self.api_key}",
-                }
-            else:
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}",
-                }
-        else:
-            if headers == "":
-                # These values for headers works for most API requests.
-                headers = {
-                    "Content-Type": "application/json",
-                    "X-auth-access-token": self.mytoken.get_token(),
-                }
+        json_response = None
+        items = []
+        pages = 0
+        for page in self._iter_pages(
+            method=method, url=url, headers=headers, json_data=json_data
+        ):
+            if page is None:
+                return None
+            json_response = page
+            if isinstance(page, dict):
+                items += page.get("items", [])
+            pages += 1
+        if pages > 1:
+            json_response["items"] = items
+        return json_response
+
+    def last_status_code(self):
+        """
+        HTTP status code of the last request sent by the calling thread.
+
+        Lets callers of send_to_api(), which returns None for any error, tell e.g. a 404 from a failed request.
+
+        :return: (int) None if no response was received.
+        """
+        return getattr(self.request_status, "code", None)
+
+    def server_time(self):
+        """
+        Current time on the FMC's clock, from the Date header of the last response.
+
+        Use it instead of time.time() for times sent back to the FMC, e.g. the starttime of audit records, as the
+        clocks of the FMC and this host may differ.
+
+        :return: (float) Epoch seconds.  The local time if no response had a Date header.
+        """
+        if self.server_date is None:
+            return time.time()
+        date, received = self.server_date
+        try:
+            offset = email.utils.parsedate_to_datetime(date).timestamp() - received
+        except (TypeError, ValueError):
+            return time.time()
+        return time.time() + offset
+
+    def iter_pages(self, url="", method="get", headers="", json_data=None):
+        """
+        Generator that sends API call to FMC and yields each page of the response as soon as it arrives.
+
+        Iteration stops early if the FMC returns an error (see self.error_response).
+
+        :param url (str): URL for API call.
+        :param method (str): GET, POST, PUT, or DELETE (Default is get)
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: (generator) JSON response of each page
+        """
+        logging.debug("In the FMC iter_pages() class method.")
+        for page in self._iter_pages(
+            method=method, url=url, headers=headers, json_data=json_data
+        ):
+            if page is None:
+                return
+            yield page
+
+    def iter_items(self, url="", method="get", headers="", json_data=None):
+        """
+        Generator that yields the "items" of a (paged) response one at a time.
+
+        :param url (str): URL for API call.
+        :param method (str): GET, POST, PUT, or DELETE (Default is get)
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: (generator) items
+        """
+        logging.debug("In the FMC iter_items() class method.")
+        for page in self.iter_pages(
+            url=url, method=method, headers=headers, json_data=json_data
+        ):
+            if isinstance(page, dict):
+                for item in page.get("items", []):
+                    yield item
+
+    def _iter_pages(self, method="", url="", headers="", json_data=None):
+        """
+        Loop over the pages of a response by following "paging.next", yielding None if a request fails.
+
+        When max_workers > 1 the remaining pages of a GET are fetched concurrently by offset once the first page
+        reveals how many pages there are.
+
+        :return: (generator) JSON response of each page
+        """
+        page_counter = 0
+        while url:
+            json_response = self._send_request(
+                method=method, url=url, headers=headers, json_data=json_data
+            )
+            if json_response is None:
+                yield None
+                return
+            yield json_response
+            url = self._next_page_url(json_response, page_counter)
+            page_counter += 1
+            if url and method == "get" and self.max_workers > 1:
+                page_urls = self._remaining_page_urls(json_response, url, page_counter)
+                if page_urls:
+                    for page in self._fetch_pages_concurrently(page_urls, headers):
+                        yield page
+                        if page is None:
+                            return
+                    return
+
+    def _remaining_page_urls(self, json_response, next_url, page_counter):
+        """
+        Predict the URLs of all remaining pages of a GET from the first page's paging information.
+
+        :param json_response (dict): First page.
+        :param next_url (str): paging.next URL of the first page.
+        :param page_counter (int): Number of pages already followed.
+        :return: (list) URLs, empty if the paging information is incomplete.
+        """
+        paging = json_response["paging"]
+        try:
+            offset = int(paging.get("offset", 0))
+            limit = int(paging["limit"])
+            count = int(paging["count"])
+        except (KeyError, TypeError, ValueError):
+            return []
+        if limit < 1:
+            return []
+        offsets = list(range(offset + limit, count, limit))
+        offsets = offsets[: max(self.MAX_PAGING_REQUESTS - page_counter + 1, 0)]
+        if re.search(r"[?&]offset=\d+", next_url) is None:
+            return []
+        return [
+            re.sub(r"([?&]offset=)\d+", rf"\g<1>{page_offset}", next_url)
+            for page_offset in offsets
+        ]
+
+    def _fetch_pages_concurrently(self, page_urls, headers=""):
+        """
+        Fetch page URLs with at most max_workers requests in flight, yielding the pages in their original order.
+
+        :param page_urls (list): URLs to GET.
+        :param headers (str):  String of header variables.
+        :return: (generator) JSON response of each page, None if a request fails.
+        """
+        logging.debug(
+            f"Fetching {len(page_urls)} pages with up to {self.max_workers} parallel requests."
+        )
+        remaining = iter(page_urls)
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for page_url in remaining:
+                in_flight.append(
+                    executor.submit(
+                        self._send_request, method="get", url=page_url, headers=headers
+                    )
+                )
+                if len(in_flight) >= self.max_workers:
+                    break
+            while in_flight:
+                json_response = in_flight.popleft().result()
+                if json_response is None:
+                    for future in in_flight:
+                        future.cancel()
+                    yield None
+                    return
+                page_url = next(remaining, None)
+                if page_url is not None:
+                    in_flight.append(
+                        executor.submit(
+                            self._send_request,
+                            method="get",
+                            url=page_url,
+                            headers=headers,
+                        )
+                    )
+                yield json_response
+
+    def _next_page_url(self, json_response, page_counter):
+        """
+        Get the URL of the next page of a response, if any.
+
+        :param json_response (dict): Current page.
+        :param page_counter (int): Number of pages already followed.
+        :return: (str) URL or None
+        """
+        paging = json_response.get("paging") if isinstance(json_response, dict) else None
+        if not paging or "next" not in paging:
+            return None
+        if page_counter > self.MAX_PAGING_REQUESTS:
+            logging.warning(
+                f"Stopped paging after {self.MAX_PAGING_REQUESTS} requests.  Results are incomplete."
+            )
+            return None
+        logging.debug(
+            f"Paging:  Offset:{paging.get('offset')}, "
+            f"Limit:{paging.get('limit')}, "
+            f"Count:{paging.get('count')}."
+        )
+        return paging["next"][0]
+
+    def _send_request(self, method="", url="", headers="", json_data=None):
+        """
+        Send a single API call to FMC, handling throttling and token expiry.
+
+        :param method (str): GET, POST, PUT, or DELETE
+        :param url (str): URL for API call.
+        :param headers (str):  String of header variables.
+        :param json_data (str):  JSON formatted string as payload. (Default is None)
+        :return: JSON response from FMC or None on error
+        """
+        if self.api_key is not None or headers == "":
+            headers = self.build_headers(
+                access_token=None if self.api_key else self.mytoken.get_token()
+            )
 
         status_code = 429
+        attempt = 0
+        sent_count = 0
+        token_renewed = False
         response = None
         json_response = None
-        logging.debug(
-            f"Being sent to FMC's API:\n\tHEADERS={headers}\n\tURL={url}\n\tMETHOD={method}\n\t"
-            f"MORE_ITEMS={more_items}\n\tJSON_DATA={json_data}"
-        )
+        self.request_status.code = None
+        self.log_sent(method, url, headers, json_data)
         try:
             while status_code == 429:
-                if method == "get":
-                    response = requests.get(
-                        url,
-                        headers=headers,
-                        verify=self.VERIFY_CERT,
-                        timeout=self.timeout,
-                    )
-                elif method == "post":
-                    response = requests.post(
-                        url,
-                        json=json_data,
-                        headers=headers,
-                        verify=self.VERIFY_CERT,
-                        timeout=self.timeout,
+                if method not in ["get", "post", "put", "delete"]:
+                    logging.error("No request method given.  Returning nothing.")
+                    return
+                # Fall back to one-off connections if used outside of a "with" contract.
+                http = self.session if self.session is not None else requests
+                wait = self.rate_limiter.acquire()
+                if self.before_request_hooks:
+                    self.run_hooks(
+                        self.before_request_hooks,
+                        {"method": method.upper(), "url": url, "attempt": sent_count},
                     )
-                elif method == "put":
-                    response = requests.put(
-                        url,
-                        json=json_data,
-                        headers=headers,
-                        verify=self.VERIFY_CERT,
-                        timeout=self.timeout,
+                sent = time.monotonic()
+                response = http.request(
+                    method.upper(),
+                    url,
+                    json=json_data if method in ["post", "put"] else None,
+                    headers=headers,
+                    verify=self.VERIFY_CERT,
+                    timeout=self.timeout,
+                )
+                if self.request_logger is not None or self.after_request_hooks:
+                    self.after_request(
+                        {
+                            "method": method.upper(),
+                            "url": url,
+                            "attempt": sent_count,
+                            "status": response.status_code,
+                            "latency": time.monotonic() - sent,
+                            "wait": wait,
+                            "request_bytes": len(response.request.body or b""),
+                            "response_bytes": len(response.content),
+                        }
                     )
-                elif method == "delete":
-                    response = requests.delete(
-                        url,
-                        headers=headers,
-                        verify=self.VERIFY_CERT,
-                        timeout=self.timeout,
+                sent_count += 1
+                if self.debug and logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(
+                        "Response from FMC's API:\n\tstatus_code=%s\n\turl=%s\n\theaders=%s\n\ttext=%s",
+                        response.status_code,
+                        response.url,
+                        response.headers,
+                        response.text,
                     )
-                else:
-                    logging.error("No request method given.  Returning nothing.")
-                    return
-                if self.debug:
-                    debug_msg = ["Response from FMC's API:"]
-                    for response_var in dir(response):
-                        if "__" not in response_var:
-                            tmp_var = getattr(response, response_var)
-                            debug_msg.append(f"\n\t{response_var}={tmp_var}")
-                    logging.debug("".join(debug_msg))
-
-                status_code = response.status_code
+
+                status_code = self.request_status.code = response.status_code
+                if "Date" in response.headers:
+                    self.server_date = (response.headers["Date"], time.time())
                 if status_code == 429:
+                    delay = self.rate_limiter.throttle(
+                        attempt=attempt,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+                    # The rate limiter holds this and every other request back for "delay" seconds.
                     logging.warning(
-                        f"Too many connections to the FMC.  Waiting {self.TOO_MANY_CONNECTIONS_TIMEOUT} "
+                        f"Too many connections to the FMC.  Waiting {delay:.1f} "
                         f"seconds and trying again."
                     )
-                    time.sleep(self.TOO_MANY_CONNECTIONS_TIMEOUT)
+                    attempt += 1
                 if status_code == 401:
-                    if self.api_key is not None:
+                    if self.api_key is None and not token_renewed:
                         logging.warning("Token has expired. Trying to refresh.")
-                        self.mytoken.access_token = None
-                        self.mytoken.access_token = self.mytoken.get_token()
-                        headers = {
-                            "Content-Type": "application/json",
-                            "X-auth-access-token": self.mytoken.access_token,
-                        }
+                        headers = self.build_headers(
+                            access_token=self.mytoken.renew(
+                                headers.get("X-auth-access-token")
+                            )
+                        )
+                        token_renewed = True
                         status_code = 429
                     else:
                         logging.warning(
@@ -332,32 +837,133 @@ class FMC(object):
             return None
         if response:
             response.close()
+        return json_response
+
+
+class RateLimiter(object):
+    """Token bucket used to pace requests to the FMC and to back off when the FMC throttles us."""
+
+    logging.debug("In the RateLimiter class.")
+
+    BACKOFF_BASE = 1
+
+    def __init__(self, rate=110, period=60, burst=10, max_backoff=30):
+        """
+        Initialize variables used in the RateLimiter class.
+
+        :param rate (int): Requests allowed per period.  None disables pacing. (Default is 110)
+        :param period (int): Length of the period in seconds. (Default is 60)
+        :param burst (int): Size of the bucket, i.e. requests that can be sent back to back. (Default is 10)
+        :param max_backoff (int): Upper bound in seconds of the exponential backoff after a 429. (Default is 30)
+        :return: None
+        """
+        logging.debug("In the RateLimiter __init__() class method.")
+        self.rate = rate
+        self.period = period
+        self.burst = max(burst, 1)
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0
+        self.requests = 0
+        self.paced_requests = 0
+        self.paced_time = 0.0
+        self.throttle_events = 0
+        self.throttled_time = 0.0
+
+    def reserve(self):
+        """
+        Take a token from the bucket and return how long the caller must wait before sending its request.
+
+        :return: (float) seconds to wait
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.requests += 1
+            delay = max(self.blocked_until - now, 0)
+            if self.rate:
+                refill = (now - self.updated) * self.rate / self.period
+                self.tokens = min(self.tokens + refill, self.burst)
+                self.updated = now
+                self.tokens -= 1
+                if self.tokens < 0:
+                    delay = max(delay, -self.tokens * self.period / self.rate)
+            if delay > 0:
+                self.paced_requests += 1
+                self.paced_time += delay
+            return delay
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        :return: (float) seconds waited
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def throttle(self, attempt=0, retry_after=None):
+        """
+        Record a 429 from the FMC and compute how long to wait before retrying.
+
+        Honor the Retry-After header when present, otherwise use jittered exponential backoff.  Other requests
+        sharing this RateLimiter are held back for the same amount of time.
+
+        :param attempt (int): Number of 429s already received for this request.
+        :param retry_after (str): Value of the Retry-After response header.  (Default is None)
+        :return: (float) seconds to wait
+        """
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_backoff, self.BACKOFF_BASE * 2 ** attempt)
+            delay = delay * random.uniform(0.5, 1)
+        with self.lock:
+            self.throttle_events += 1
+            self.throttled_time += delay
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            self.tokens = min(self.tokens, 0)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(retry_after):
+        """
+        Convert a Retry-After header (seconds or HTTP date) to seconds.
+
+        :param retry_after (str): Header value.
+        :return: (float) seconds or None
+        """
+        if retry_after is None:
+            return None
         try:
-            if (
-                "next" in json_response["paging"]
-                and self.page_counter <= self.MAX_PAGING_REQUESTS
-            ):
-                self.more_items += json_response["items"]
-                logging.debug(
-                    f"Paging:  Offset:{json_response['paging']['offset']}, "
-                    f"Limit:{json_response['paging']['limit']}, "
-                    f"Count:{json_response['paging']['count']}, "
-                    f"Gathered_Items:{len(self.more_items)}."
-                )
-                self.page_counter += 1
-                return self.send_to_api(
-                    method=method,
-                    url=json_response["paging"]["next"][0],
-                    json_data=json_data,
-                    more_items=self.more_items,
-                )
-            else:
-                json_response["items"] = self.more_items + json_response["items"]
-                self.more_items = []
-                return json_response
-        except KeyError:
-            # Used only when the response only has "one page" of results.
-            return json_response
+            return max(float(retry_after), 0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        now = datetime.datetime.now(retry_at.tzinfo)
+        return max((retry_at - now).total_seconds(), 0)
+
+    def stats(self):
+        """
+        Counters for requests sent and time spent waiting.
+
+        :return: (dict)
+        """
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "paced_requests": self.paced_requests,
+                "paced_time": self.paced_time,
+                "throttle_events": self.throttle_events,
+                "throttled_time": self.throttled_time,
+            }
 
 
 class Token(object):
@@ -370,6 +976,10 @@ class Token(object):
     TOKEN_REFRESH_TIME = int(
         TOKEN_LIFETIME * 0.95
     )  # Refresh token at 95% refresh time.
+    BACKGROUND_REFRESH_TIME = int(
+        TOKEN_LIFETIME * 0.85
+    )  # The background thread refreshes early so requests never wait on a refresh.
+    BACKGROUND_RETRY_TIME = 30
     API_PLATFORM_VERSION = "api/fmc_platform/v1"
 
     def __init__(
@@ -380,6 +990,9 @@ class Token(object):
         domain=None,
         verify_cert=False,
         timeout=5,
+        session=None,
+        cache_file=None,
+        background_refresh=False,
     ):
         """
         Initialize variables used in the Token class.
@@ -390,6 +1003,10 @@ class Token(object):
         :param domain (str):  UUID of domain.  Default is None which implies Global domain.
         :param verify_cert (bool):  Validate cert  (Default is False)
         :param timeout (int):  Maximum seconds to establish connection (Default is 5)
+        :param session (requests.Session): Pooled HTTP session to send token requests through.  (Default is None)
+        :param cache_file (str): File used to share tokens with other processes using the same FMC user.  Tokens are
+        only requested when no valid token is found in the file.  (Default is None, don't share tokens)
+        :param background_refresh (bool): Refresh tokens ahead of expiry in a background thread.  (Default is False)
         :return: None
         """
         logging.debug("In the Token __init__() class method.")
@@ -401,21 +1018,53 @@ class Token(object):
         self.uuid = None
         self.verify_cert = verify_cert
         self.timeout = timeout
+        self.session = session if session is not None else requests
+        self.cache_file = cache_file
+        self.lock = threading.RLock()
         self.token_refreshes = 0
         self.access_token = None
         self.refresh_token = None
+        self.rejected_token = None
         self.token_creation_time = None
+        self.refresh_thread = None
+        self.stop_refresh = threading.Event()
         self.generate_tokens()
+        if background_refresh:
+            self.start_background_refresh()
 
     def generate_tokens(self):
         """
         Create new or refresh expired tokens.
 
+        With a cache_file, a valid token saved by another process is used instead and any new token is saved for the
+        other processes.
+
         :return: None
         """
         logging.debug("In the Token generate_tokens() class method.")
+        with self.lock:
+            if self.cache_file is None:
+                self.request_tokens()
+                return
+            with self._cache_file_lock():
+                if self.load_cache():
+                    return
+                self.request_tokens()
+                if self.access_token:
+                    self.save_cache()
 
-        if self.token_refreshes <= self.MAX_REFRESHES and self.access_token is not None:
+    def request_tokens(self):
+        """
+        Ask the FMC for tokens.  Use the refresh token up to MAX_REFRESHES times before generating new ones.
+
+        :return: None
+        """
+        logging.debug("In the Token request_tokens() class method.")
+        if (
+            self.token_refreshes < self.MAX_REFRESHES
+            and self.access_token is not None
+            and self.refresh_token is not None
+        ):
             headers = {
                 "Content-Type": "application/json",
                 "X-auth-access-token": self.access_token,
@@ -423,10 +1072,10 @@ class Token(object):
             }
             url = f"https://{self.__host}/{self.API_PLATFORM_VERSION}/auth/refreshtoken"
             logging.info(
-                f"Refreshing tokens, {self.token_refreshes} out of {self.MAX_REFRESHES} refreshes, "
+                f"Refreshing tokens, {self.token_refreshes + 1} out of {self.MAX_REFRESHES} refreshes, "
                 f"from {url}."
             )
-            response = requests.post(
+            response = self.session.post(
                 url, headers=headers, verify=self.verify_cert, timeout=self.timeout
             )
             logging.debug(
@@ -435,30 +1084,34 @@ class Token(object):
                 f"\theaders: {dict(response.headers)}\n"
                 f"\tresponse: {response}"
             )
-            self.token_refreshes += 1
-        else:
-            self.token_refreshes = 0
-            self.token_creation_time = (
-                datetime.datetime.now()
-            )  # Can't trust that your clock is in sync with FMC's.
-            headers = {"Content-Type": "application/json"}
-            url = (
-                f"https://{self.__host}/{self.API_PLATFORM_VERSION}/auth/generatetoken"
-            )
-            logging.info(f"Requesting new tokens from {url}.")
-            response = requests.post(
-                url,
-                headers=headers,
-                auth=requests.auth.HTTPBasicAuth(self.__username, self.__password),
-                verify=self.verify_cert,
-                timeout=self.timeout,
-            )
-            logging.debug(
-                "Response from generatetoken() post:\n"
-                f"\turl: {url}\n"
-                f"\theaders: {dict(response.headers)}\n"
-                f"\tresponse: {response}"
-            )
+            if response.headers.get("X-auth-access-token"):
+                self.access_token = response.headers.get("X-auth-access-token")
+                self.refresh_token = response.headers.get("X-auth-refresh-token")
+                self.token_creation_time = datetime.datetime.now()
+                self.token_refreshes += 1
+                return
+            logging.warning("Refreshing tokens failed.  Requesting new tokens instead.")
+
+        self.token_refreshes = 0
+        self.token_creation_time = (
+            datetime.datetime.now()
+        )  # Can't trust that your clock is in sync with FMC's.
+        headers = {"Content-Type": "application/json"}
+        url = f"https://{self.__host}/{self.API_PLATFORM_VERSION}/auth/generatetoken"
+        logging.info(f"Requesting new tokens from {url}.")
+        response = self.session.post(
+            url,
+            headers=headers,
+            auth=requests.auth.HTTPBasicAuth(self.__username, self.__password),
+            verify=self.verify_cert,
+            timeout=self.timeout,
+        )
+        logging.debug(
+            "Response from generatetoken() post:\n"
+            f"\turl: {url}\n"
+            f"\theaders: {dict(response.headers)}\n"
+            f"\tresponse: {response}"
+        )
         self.access_token = response.headers.get("X-auth-access-token")
         self.refresh_token = response.headers.get("X-auth-refresh-token")
         self.uuid = response.headers.get("DOMAIN_UUID")
@@ -479,6 +1132,17 @@ class Token(object):
                             "Domain name entered not found in FMC, falling back to Global"
                         )
 
+    def expired(self):
+        """
+        Check whether the access token is missing or due to be renewed.
+
+        :return: (boolean)
+        """
+        return self.access_token is None or datetime.datetime.now() > (
+            self.token_creation_time
+            + datetime.timedelta(seconds=self.TOKEN_REFRESH_TIME)
+        )
+
     def get_token(self):
         """
         Check validity of current token.  If needed make a new or refresh.  Then return access_token.
@@ -486,18 +1150,163 @@ class Token(object):
         :return self.access_token
         """
         logging.debug("In the Token get_token() class method.")
-        if (
-            datetime.datetime.now()
-            > (
-                self.token_creation_time
-                + datetime.timedelta(seconds=self.TOKEN_REFRESH_TIME)
-            )
-            or self.access_token == None
-        ):
-            logging.info("Token expired.  Generating a new token.")
-            self.token_refreshes = 0
+        if not self.expired():
+            return self.access_token
+        with self.lock:
+            # Another thread may have renewed the token while this one waited for the lock.
+            if self.expired():
+                logging.info("Token expired.  Renewing the token.")
+                self.generate_tokens()
+            return self.access_token
+
+    def invalidate(self):
+        """
+        Forget an access token the FMC no longer accepts so that the next get_token() renews it.
+
+        :return: None
+        """
+        logging.debug("In the Token invalidate() class method.")
+        with self.lock:
+            if self.access_token is not None:
+                self.rejected_token = self.access_token
             self.access_token = None
             self.refresh_token = None
-            self.generate_tokens()
 
-        return self.access_token
+    def renew(self, rejected_token):
+        """
+        Renew the access token after the FMC rejected rejected_token, unless another thread already did.
+
+        Requests that were sent with the same token and fail together only log in once; the others retry with the
+        token that replaced it.
+
+        :param rejected_token (str): Access token the rejected request was sent with.
+        :return: (str) access token
+        """
+        logging.debug("In the Token renew() class method.")
+        with self.lock:
+            if self.access_token == rejected_token:
+                self.invalidate()
+            return self.get_token()
+
+    def load_cache(self):
+        """
+        Use the token saved in cache_file if it belongs to this FMC user and is newer than the current one.
+
+        :return: (boolean) True if the cached token was loaded.
+        """
+        logging.debug("In the Token load_cache() class method.")
+        try:
+            with open(self.cache_file) as f:
+                cache = json.load(f)
+            created = datetime.datetime.fromtimestamp(cache["token_creation_time"])
+            if (
+                cache["host"] != self.__host
+                or cache["username"] != self.__username
+                or cache["domain"] != self.__domain
+                or cache["access_token"] in [self.access_token, self.rejected_token]
+                or datetime.datetime.now()
+                > created + datetime.timedelta(seconds=self.TOKEN_REFRESH_TIME)
+            ):
+                return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        logging.info(f"Using token shared in {self.cache_file}.")
+        self.access_token = cache["access_token"]
+        self.refresh_token = cache["refresh_token"]
+        self.uuid = cache["uuid"]
+        self.token_refreshes = cache["token_refreshes"]
+        self.token_creation_time = created
+        return True
+
+    def save_cache(self):
+        """
+        Atomically write the current token to cache_file so other processes can use it.
+
+        :return: None
+        """
+        logging.debug("In the Token save_cache() class method.")
+        cache = {
+            "host": self.__host,
+            "username": self.__username,
+            "domain": self.__domain,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "uuid": self.uuid,
+            "token_refreshes": self.token_refreshes,
+            "token_creation_time": self.token_creation_time.timestamp(),
+        }
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        try:
+            # mkstemp() creates the file readable by this user only.
+            fd, tmp_file = tempfile.mkstemp(dir=directory, prefix=".fmcapi-token-")
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logging.warning(f"Unable to save token to {self.cache_file}: {e}")
+
+    @contextlib.contextmanager
+    def _cache_file_lock(self):
+        """Hold an exclusive lock on cache_file across processes, where the platform supports it."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.cache_file}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def start_background_refresh(self):
+        """
+        Start a daemon thread that renews the token at BACKGROUND_REFRESH_TIME, before requests see it expire.
+
+        :return: None
+        """
+        logging.debug("In the Token start_background_refresh() class method.")
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():
+            return
+        self.stop_refresh.clear()
+        self.refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="fmcapi-token-refresh", daemon=True
+        )
+        self.refresh_thread.start()
+
+    def stop(self):
+        """
+        Stop the background refresh thread, if any.
+
+        :return: None
+        """
+        logging.debug("In the Token stop() class method.")
+        self.stop_refresh.set()
+        if self.refresh_thread is not None:
+            self.refresh_thread.join(timeout=self.timeout)
+            self.refresh_thread = None
+
+    def _refresh_due_in(self):
+        """Seconds until the background thread should renew the token."""
+        with self.lock:
+            if self.access_token is None:
+                return 0
+            due = self.token_creation_time + datetime.timedelta(
+                seconds=self.BACKGROUND_REFRESH_TIME
+            )
+            return max((due - datetime.datetime.now()).total_seconds(), 0)
+
+    def _refresh_loop(self):
+        """Body of the background refresh thread."""
+        delay = self._refresh_due_in()
+        while not self.stop_refresh.wait(delay):
+            try:
+                with self.lock:
+                    if self._refresh_due_in() <= 0:
+                        logging.info("Renewing the token in the background.")
+                        self.generate_tokens()
+            except Exception as e:
+                logging.error(f"Background token refresh failed: {e}")
+            delay = self._refresh_due_in()
+            if delay <= 0:
+                # Renewing failed, don't hammer the FMC.
+                delay = self.BACKGROUND_RETRY_TIME
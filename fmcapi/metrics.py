@@ -0,0 +1,202 @@
+"""
+Request metrics for the FMC object.
+
+FMC(metrics=True) registers a MetricsCollector as an after_request hook.  It counts every HTTP exchange with the FMC
+per endpoint (method + URL path with ids replaced by "{id}"), so that fmc.metrics.top() shows which api_objects
+classes a job spends its time on.  fmc.metrics.to_dict() and fmc.metrics.to_prometheus() export the counters.
+"""
+
+import logging
+import re
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+
+class MetricsCollector(object):
+    """Per endpoint request counts, latency histograms, retries, throttle time and payload sizes."""
+
+    logging.debug("In the MetricsCollector class.")
+
+    # Upper bounds, in seconds, of the latency histogram buckets.
+    LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+    ID_PATTERN = re.compile(
+        r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)"
+    )
+    API_PREFIX = re.compile(r"^/api/fmc_[a-z]+/v\d+/(domain/[^/]+/)?")
+
+    def __init__(self):
+        """
+        Initialize variables used in the MetricsCollector class.
+
+        :return: None
+        """
+        logging.debug("In the MetricsCollector __init__() class method.")
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    @classmethod
+    def endpoint(cls, url):
+        """
+        Name of the endpoint a URL belongs to, e.g. "object/hosts/{id}".
+
+        :param url (str): URL of the request.
+        :return: (str)
+        """
+        path = cls.ID_PATTERN.sub("/{id}", urlsplit(url).path)
+        return cls.API_PREFIX.sub("", path).strip("/")
+
+    def record(self, event):
+        """
+        Count one HTTP exchange.  Use as an FMC after_request hook.
+
+        :param event (dict): Request event, see FMC.add_request_hooks().
+        :return: None
+        """
+        query = parse_qs(urlsplit(event["url"]).query)
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+        except ValueError:
+            offset = 0
+        latency = event["latency"]
+        key = (event["method"], self.endpoint(event["url"]))
+        with self.lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = {
+                    "requests": 0,
+                    "errors": 0,
+                    "status": {},
+                    "retries": 0,
+                    "pages": 0,
+                    "throttle_seconds": 0.0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                    "latency_sum": 0.0,
+                    "latency_max": 0.0,
+                    "latency_buckets": [0] * len(self.LATENCY_BUCKETS),
+                }
+            stats["requests"] += 1
+            status = event["status"]
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+            if status is None or status >= 400:
+                stats["errors"] += 1
+            if event.get("attempt", 0) > 0:
+                stats["retries"] += 1
+            if offset > 0:
+                stats["pages"] += 1
+            stats["throttle_seconds"] += event.get("wait", 0)
+            stats["request_bytes"] += event.get("request_bytes", 0)
+            stats["response_bytes"] += event.get("response_bytes", 0)
+            stats["latency_sum"] += latency
+            stats["latency_max"] = max(stats["latency_max"], latency)
+            for i, bound in enumerate(self.LATENCY_BUCKETS):
+                if latency <= bound:
+                    stats["latency_buckets"][i] += 1
+                    break
+
+    def reset(self):
+        """
+        Forget all counters.
+
+        :return: None
+        """
+        with self.lock:
+            self.endpoints = {}
+
+    def to_dict(self):
+        """
+        Export the counters.
+
+        :return: (dict) {"METHOD endpoint": {counters}, ...}.  latency_buckets maps each bucket's upper bound to the
+        number of requests that took at most that long (cumulative, like Prometheus).
+        """
+        with self.lock:
+            result = {}
+            for (method, endpoint), stats in sorted(self.endpoints.items()):
+                exported = dict(stats, status=dict(stats["status"]))
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(self.LATENCY_BUCKETS, stats["latency_buckets"]):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                buckets["+Inf"] = stats["requests"]
+                exported["latency_buckets"] = buckets
+                exported["latency_avg"] = stats["latency_sum"] / stats["requests"]
+                result[f"{method} {endpoint}"] = exported
+            return result
+
+    def top(self, n=10, by="latency_sum"):
+        """
+        Busiest endpoints.
+
+        :param n (int): Number of endpoints to return. (Default is 10)
+        :param by (str): Counter to sort by, e.g. "requests" or "response_bytes". (Default is latency_sum)
+        :return: (list) (endpoint, counters) tuples, busiest first.
+        """
+        metrics = self.to_dict()
+        return sorted(metrics.items(), key=lambda item: item[1][by], reverse=True)[:n]
+
+    def to_prometheus(self, prefix="fmcapi"):
+        """
+        Export the counters in the Prometheus text exposition format.
+
+        :param prefix (str): Prefix of the metric names. (Default is fmcapi)
+        :return: (str)
+        """
+        metrics = self.to_dict()
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def labels(key, **extra):
+            method, endpoint = key.split(" ", 1)
+            pairs = [("method", method), ("endpoint", endpoint)] + list(extra.items())
+            return ",".join(f'{k}="{v}"' for k, v in pairs)
+
+        family("requests_total", "counter", "HTTP requests sent to the FMC.")
+        for key, stats in metrics.items():
+            for status, count in sorted(stats["status"].items(), key=str):
+                lines.append(
+                    f"{prefix}_requests_total{{{labels(key, status=status)}}} {count}"
+                )
+        for name, counter, help_text in [
+            (
+                "request_retries_total",
+                "retries",
+                "Requests sent again after a 429 or 401.",
+            ),
+            ("pages_total", "pages", "Additional pages fetched for paged GETs."),
+            (
+                "throttle_seconds_total",
+                "throttle_seconds",
+                "Seconds requests were held back by the rate limiter.",
+            ),
+            ("request_bytes_total", "request_bytes", "Bytes sent in request bodies."),
+            (
+                "response_bytes_total",
+                "response_bytes",
+                "Bytes received in response bodies.",
+            ),
+        ]:
+            family(name, "counter", help_text)
+            for key, stats in metrics.items():
+                lines.append(f"{prefix}_{name}{{{labels(key)}}} {stats[counter]}")
+        family(
+            "request_duration_seconds",
+            "histogram",
+            "Latency of HTTP requests to the FMC.",
+        )
+        for key, stats in metrics.items():
+            for bound, count in stats["latency_buckets"].items():
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket{{{labels(key, le=bound)}}} {count}"
+                )
+            lines.append(
+                f"{prefix}_request_duration_seconds_sum{{{labels(key)}}} {stats['latency_sum']}"
+            )
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{{{labels(key)}}} {stats['requests']}"
+            )
+        return "\n".join(lines) + "\n"
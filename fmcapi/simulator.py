@@ -0,0 +1,700 @@
+"""
+In-process simulator of the FMC REST API.
+
+FMCSimulator keeps objects in memory and answers the requests fmcapi sends, so that paging, bulk operations,
+throttling and concurrency can be exercised and benchmarked without an FMC.  It implements:
+
+- token generation and refresh (auth/generatetoken, auth/refreshtoken) with the DOMAIN_UUID/DOMAINS headers,
+- info/serverversion and info/domain,
+- audit/auditrecords, with a record for every POST, PUT and DELETE answered and the starttime parameter,
+- create, read, update and delete of any collection under /api/fmc_config/v1/domain/{uuid}/, including nested
+  collections such as policy/accesspolicies/{id}/accessrules,
+- paging (offset, limit, paging.next), expanded, the "name" parameter and the nameOrValue filter,
+- bulk POST (?bulk=true with a list) and bulk DELETE (?bulk=true&filter=ids:...),
+- dynamic object mappings: the add and remove lists of a POST to object/dynamicobjectmappings are applied to
+  object/dynamicobjects/{id}/mappings,
+- deployments: a POST to deployment/deploymentrequests starts a job/taskstatuses task that reports "Deployed"
+  task_time seconds later and then removes the devices deployed to from deployment/deployabledevices,
+- 429 throttling at a configurable rate and injectable latency,
+- a Date header on every answer, from a clock that can be set apart from the client's (clock_offset).
+
+Use it with FMC or AsyncFMC by attaching it before entering the "with" block:
+
+    simulator = FMCSimulator(latency=0.05, rate_limit=120)
+    with simulator.attach(FMC(host="fmc.example.com", autodeploy=False)) as fmc:
+        Hosts(fmc=fmc, name="web", value="10.0.0.1").post()
+"""
+
+import asyncio
+import datetime
+import email.utils
+import http.client
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+from base64 import b64decode
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+
+class FMCSimulator(object):
+    """In-memory FMC answering requests through a requests adapter or an httpx transport."""
+
+    logging.debug("In the FMCSimulator class.")
+
+    PLATFORM_PREFIX = "/api/fmc_platform/v1/"
+    CONFIG_PREFIX = "/api/fmc_config/v1/domain/"
+    DEFAULT_LIMIT = 25
+    MAX_LIMIT = 1000
+    MAX_REFRESHES = 3
+    # Fields of the items of a listing that isn't expanded.
+    LISTING_FIELDS = ["id", "name", "type", "links"]
+    # Collections whose POST starts a task, and the taskType of that task.
+    TASK_COLLECTIONS = {"deployment/deploymentrequests": "DEVICE_DEPLOYMENT"}
+
+    def __init__(
+        self,
+        username="admin",
+        password="Admin123",
+        api_key=None,
+        domains=None,
+        server_version="7.2.0 (build 82)",
+        latency=0,
+        rate_limit=None,
+        period=60,
+        token_lifetime=1800,
+        max_payload=2048000,
+        task_time=0,
+        clock_offset=0,
+    ):
+        """
+        Initialize variables used in the FMCSimulator class.
+
+        :param username (str): User allowed to generate tokens. (Default is admin)
+        :param password (str): Password of username. (Default is Admin123)
+        :param api_key (str): Bearer token accepted instead of an access token.  (Default is None)
+        :param domains (list): Names of subdomains to create under Global. (Default is None)
+        :param server_version (str): Version reported by info/serverversion. (Default is 7.2.0 (build 82))
+        :param latency (float or function): Seconds each request takes, or a function of (method, path) returning
+        them. (Default is 0)
+        :param rate_limit (int): Requests allowed per period before answering 429.  None never throttles.
+        (Default is None)
+        :param period (int): Length of the rate limiting period in seconds. (Default is 60)
+        :param token_lifetime (int): Seconds an access token is valid. (Default is 1800)
+        :param max_payload (int): Largest request body, in bytes, accepted before answering 422.
+        (Default is 2048000)
+        :param task_time (float): Seconds a task, e.g. a deployment, runs before it is done. (Default is 0)
+        :param clock_offset (float): Seconds the simulated FMC's clock is ahead of the local clock, negative if it
+        is behind. (Default is 0)
+        :return: None
+        """
+        logging.debug("In the FMCSimulator __init__() class method.")
+        self.username = username
+        self.password = password
+        self.api_key = api_key
+        self.server_version = server_version
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.period = period
+        self.token_lifetime = token_lifetime
+        self.max_payload = max_payload
+        self.task_time = task_time
+        self.clock_offset = clock_offset
+        self.lock = threading.RLock()
+        self.domains = {"Global": str(uuid.uuid4())}
+        for name in domains or []:
+            self.domains[f"Global/{name}"] = str(uuid.uuid4())
+        self.collections = {}
+        self.audit = []
+        self.tasks = {}
+        self.tokens = {}
+        self.tokens_issued = 0
+        self.rate_tokens = rate_limit
+        self.rate_updated = time.monotonic()
+        self.requests = 0
+        self.throttled = 0
+
+    @property
+    def domain_uuid(self):
+        """UUID of the Global domain."""
+        return self.domains["Global"]
+
+    def attach(self, fmc):
+        """
+        Route the requests of an FMC or AsyncFMC object to this simulator.  Call before entering its "with" block.
+
+        :param fmc (object): FMC or AsyncFMC object.
+        :return: fmc
+        """
+        build_session = fmc.build_session
+
+        def build_simulated_session():
+            session = build_session()
+            adapter = self.adapter()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+
+        fmc.build_session = build_simulated_session
+        if hasattr(fmc, "build_client"):
+            fmc.build_client = lambda: httpx.AsyncClient(
+                timeout=fmc.timeout, transport=self.httpx_transport()
+            )
+        return fmc
+
+    def adapter(self):
+        """
+        Build a requests transport adapter answering from this simulator.
+
+        :return: (SimulatorAdapter)
+        """
+        return SimulatorAdapter(self)
+
+    def httpx_transport(self):
+        """
+        Build an httpx transport answering from this simulator.  Works with httpx.Client and httpx.AsyncClient.
+
+        :return: (httpx.MockTransport)
+        """
+        if not _HTTPX_AVAILABLE:
+            raise ImportError(
+                "The 'httpx' package is required for FMCSimulator.httpx_transport(). "
+                "Install it with: pip install httpx"
+            )
+
+        async def handle(request):
+            await asyncio.sleep(self.delay(request.method, request.url.path))
+            status, headers, body = self.handle(
+                request.method, str(request.url), request.headers, request.content
+            )
+            headers = dict(headers, Date=self.date_header())
+            return httpx.Response(status, headers=headers, content=body)
+
+        return httpx.MockTransport(handle)
+
+    def now(self):
+        """
+        Time on the simulated FMC's clock.
+
+        :return: (float) Epoch seconds.
+        """
+        return time.time() + self.clock_offset
+
+    def date_header(self):
+        """
+        Date header of an answer.
+
+        :return: (str) HTTP date of now() on the simulated FMC's clock.
+        """
+        return email.utils.formatdate(self.now(), usegmt=True)
+
+    def delay(self, method, path):
+        """
+        Latency to inject for a request.
+
+        :param method (str): HTTP method.
+        :param path (str): URL path.
+        :return: (float) seconds
+        """
+        if callable(self.latency):
+            return self.latency(method, path)
+        return self.latency
+
+    def load(self, collection, items, domain_uuid=None):
+        """
+        Add objects to a collection, e.g. to prepare a benchmark, without going through the API.
+
+        :param collection (str): Path of the collection below the domain, e.g. "object/hosts".
+        :param items (list): Objects to add.  id and type are filled in when missing.
+        :param domain_uuid (str): Domain of the collection. (Default is None, the Global domain)
+        :return: (list) Objects as stored.
+        """
+        base = self.domain_url(domain_uuid or self.domain_uuid)
+        with self.lock:
+            return [
+                self.create(base, collection.strip("/"), dict(item)) for item in items
+            ]
+
+    def objects(self, collection, domain_uuid=None):
+        """
+        Objects currently in a collection.
+
+        :param collection (str): Path of the collection below the domain, e.g. "object/hosts".
+        :param domain_uuid (str): Domain of the collection. (Default is None, the Global domain)
+        :return: (list) Objects.
+        """
+        key = (domain_uuid or self.domain_uuid, collection.strip("/"))
+        with self.lock:
+            return [dict(item) for item in self.collections.get(key, {}).values()]
+
+    def stats(self):
+        """
+        Counters for requests answered.
+
+        :return: (dict)
+        """
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "tokens_issued": self.tokens_issued,
+                "objects": sum(len(c) for c in self.collections.values()),
+            }
+
+    def handle(self, method, url, headers, body):
+        """
+        Answer one request.
+
+        :param method (str): HTTP method.
+        :param url (str): Full URL of the request.
+        :param headers (dict): Request headers.
+        :param body (bytes): Request body.
+        :return: (int, dict, bytes) status code, response headers, response body
+        """
+        method = method.upper()
+        parts = urlsplit(url)
+        path = parts.path
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        headers = CaseInsensitiveDict(headers or {})
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        with self.lock:
+            self.requests += 1
+            retry_after = self.throttle()
+            if retry_after is not None:
+                self.throttled += 1
+                return self.error(
+                    429,
+                    "Too many requests.",
+                    {"Retry-After": f"{retry_after:.3f}"},
+                )
+            if len(body or b"") > self.max_payload:
+                return self.error(422, "Payload too large.")
+            try:
+                data = json.loads(body) if body else None
+            except ValueError:
+                return self.error(400, "Invalid JSON in request body.")
+            if path.startswith(self.PLATFORM_PREFIX):
+                return self.platform(
+                    method,
+                    f"{parts.scheme}://{parts.netloc}",
+                    path[len(self.PLATFORM_PREFIX) :].strip("/"),
+                    query,
+                    headers,
+                )
+            if path.startswith(self.CONFIG_PREFIX):
+                if not self.authorized(headers):
+                    return self.error(401, "Access token invalid.")
+                domain, _, rest = path[len(self.CONFIG_PREFIX) :].partition("/")
+                if domain not in self.domains.values():
+                    return self.error(404, f"Domain {domain} not found.")
+                status, response_headers, response_body = self.config(
+                    method,
+                    f"{parts.scheme}://{parts.netloc}",
+                    domain,
+                    rest,
+                    query,
+                    data,
+                )
+                if method != "GET" and status < 400:
+                    self.audit.append(
+                        {
+                            "id": str(uuid.uuid4()),
+                            "type": "AuditRecord",
+                            "time": int(self.now()),
+                            "domain": domain,
+                            "username": self.username,
+                            "subsystem": "API",
+                            "source": "REST API",
+                            "message": f"{method} {rest.strip('/')}",
+                        }
+                    )
+                return status, response_headers, response_body
+            return self.error(404, f"{path} not found.")
+
+    def throttle(self):
+        """
+        Take a request from the rate limiting bucket.
+
+        :return: (float) Seconds to wait before retrying if the request is throttled, None otherwise.
+        """
+        if not self.rate_limit:
+            return None
+        now = time.monotonic()
+        refill = (now - self.rate_updated) * self.rate_limit / self.period
+        self.rate_tokens = min(self.rate_tokens + refill, self.rate_limit)
+        self.rate_updated = now
+        if self.rate_tokens < 1:
+            return (1 - self.rate_tokens) * self.period / self.rate_limit
+        self.rate_tokens -= 1
+        return None
+
+    def authorized(self, headers):
+        """Check the access token, or api_key, of a request."""
+        if self.api_key is not None and headers.get("Authorization") == (
+            f"Bearer {self.api_key}"
+        ):
+            return True
+        token = self.tokens.get(headers.get("X-auth-access-token"))
+        return token is not None and token["expires"] > time.monotonic()
+
+    def platform(self, method, host, path, query, headers):
+        """Answer requests to /api/fmc_platform/v1/."""
+        if path == "auth/generatetoken" and method == "POST":
+            credentials = headers.get("Authorization", "")
+            try:
+                username, _, password = (
+                    b64decode(credentials.split(" ", 1)[1]).decode().partition(":")
+                )
+            except (IndexError, ValueError):
+                username = password = None
+            if (username, password) != (self.username, self.password):
+                return self.error(401, "Invalid username or password.")
+            return self.issue_token(refreshes=0)
+        if path == "auth/refreshtoken" and method == "POST":
+            token = self.tokens.get(headers.get("X-auth-access-token"))
+            if (
+                token is None
+                or token["refresh"] != headers.get("X-auth-refresh-token")
+                or token["refreshes"] >= self.MAX_REFRESHES
+            ):
+                return self.error(401, "Refresh token invalid.")
+            del self.tokens[headers.get("X-auth-access-token")]
+            return self.issue_token(refreshes=token["refreshes"] + 1)
+        if not self.authorized(headers):
+            return self.error(401, "Access token invalid.")
+        if path == "info/serverversion" and method == "GET":
+            return self.response(
+                200,
+                {
+                    "items": [
+                        {
+                            "serverVersion": self.server_version,
+                            "vdbVersion": "build 353",
+                            "sruVersion": "2022-05-11-001-vrt",
+                            "geoVersion": "2022-05-11-101",
+                            "type": "ServerVersion",
+                        }
+                    ]
+                },
+            )
+        if path == "info/domain" and method == "GET":
+            return self.response(200, {"items": self.domain_list()})
+        domain, _, rest = path[len("domain/") :].partition("/")
+        if rest == "audit/auditrecords" and method == "GET":
+            try:
+                start = int(query.get("starttime", 0))
+            except ValueError:
+                return self.error(400, "starttime must be an integer.")
+            records = {
+                record["id"]: record
+                for record in self.audit
+                if record["domain"] == domain and record["time"] >= start
+            }
+            return self.listing(
+                f"{host}{self.PLATFORM_PREFIX}domain/{domain}",
+                domain,
+                rest,
+                records,
+                query,
+            )
+        return self.error(404, f"{path} not found.")
+
+    def issue_token(self, refreshes):
+        """Create an access/refresh token pair and answer with the FMC's token headers."""
+        access_token = str(uuid.uuid4())
+        refresh_token = str(uuid.uuid4())
+        self.tokens[access_token] = {
+            "refresh": refresh_token,
+            "refreshes": refreshes,
+            "expires": time.monotonic() + self.token_lifetime,
+        }
+        self.tokens_issued += 1
+        headers = {
+            "X-auth-access-token": access_token,
+            "X-auth-refresh-token": refresh_token,
+            "DOMAIN_UUID": self.domain_uuid,
+            "DOMAINS": json.dumps(self.domain_list()),
+        }
+        return 204, headers, b""
+
+    def domain_list(self):
+        """Domains as listed in the DOMAINS header."""
+        return [
+            {"name": name, "uuid": domain_uuid, "type": "Domain"}
+            for name, domain_uuid in self.domains.items()
+        ]
+
+    def domain_url(self, domain_uuid, host="https://fmc.simulator"):
+        """Base URL of a domain's configuration API."""
+        return f"{host}{self.CONFIG_PREFIX}{domain_uuid}"
+
+    def config(self, method, host, domain, path, query, data):
+        """Answer requests to /api/fmc_config/v1/domain/{uuid}/."""
+        base = self.domain_url(domain, host)
+        path = path.strip("/")
+        collection, _, object_id = path.rpartition("/")
+        objects = self.collections.get((domain, collection))
+        if objects is None or object_id not in objects:
+            if self.is_uuid(object_id) and method in ["GET", "PUT", "DELETE"]:
+                return self.error(404, f"{object_id} not found in {collection}.")
+            collection, object_id = path, None
+            objects = self.collections.get((domain, collection), {})
+        bulk = query.get("bulk") == "true"
+        if object_id is not None:
+            if method == "GET":
+                if collection == "job/taskstatuses":
+                    self.advance_task(domain, object_id)
+                return self.response(200, objects[object_id])
+            if method == "PUT":
+                if not isinstance(data, dict):
+                    return self.error(400, "PUT needs an object.")
+                item = dict(data, id=object_id)
+                item.setdefault("type", objects[object_id].get("type"))
+                item["links"] = objects[object_id]["links"]
+                item["metadata"] = self.metadata(domain)
+                objects[object_id] = item
+                return self.response(200, item)
+            if method == "DELETE":
+                return self.response(200, objects.pop(object_id))
+            return self.error(405, f"{method} not allowed on {path}.")
+        if method == "GET":
+            return self.listing(base, domain, collection, objects, query)
+        if method == "POST" and collection == "object/dynamicobjectmappings":
+            return self.map_dynamic_objects(domain, data)
+        if method == "POST":
+            if bulk != isinstance(data, list):
+                return self.error(400, "Bulk POST needs ?bulk=true and a list.")
+            items = data if bulk else [data]
+            if not all(isinstance(item, dict) for item in items):
+                return self.error(400, "POST needs an object.")
+            names = [item["name"] for item in items if "name" in item]
+            taken = {item.get("name") for item in objects.values()}
+            duplicates = sorted(
+                set(n for n in names if n in taken or names.count(n) > 1)
+            )
+            if duplicates:
+                return self.error(400, f"Duplicate name(s): {', '.join(duplicates)}.")
+            created = [self.create(base, collection, dict(item)) for item in items]
+            if collection in self.TASK_COLLECTIONS:
+                for item in created:
+                    item["metadata"]["task"] = self.start_task(base, collection, item)
+            return self.response(201, {"items": created} if bulk else created[0])
+        if method == "DELETE" and bulk:
+            filter_ = query.get("filter", "")
+            if not filter_.startswith("ids:"):
+                return self.error(400, "Bulk DELETE needs filter=ids:...")
+            ids = [i for i in filter_[len("ids:") :].split(",") if i in objects]
+            return self.response(200, {"items": [objects.pop(i) for i in ids]})
+        return self.error(405, f"{method} not allowed on {path}.")
+
+    @staticmethod
+    def is_uuid(value):
+        """Check whether a path segment is an object id."""
+        try:
+            uuid.UUID(value)
+        except ValueError:
+            return False
+        return True
+
+    def create(self, base, collection, item):
+        """Store a new object in a collection."""
+        domain = base.rsplit("/", 1)[1]
+        item.setdefault("id", str(uuid.uuid4()))
+        item.setdefault("type", collection.rsplit("/", 1)[-1].rstrip("s").title())
+        item["links"] = {"self": f"{base}/{collection}/{item['id']}"}
+        item["metadata"] = self.metadata(domain)
+        self.collections.setdefault((domain, collection), {})[item["id"]] = item
+        return item
+
+    def map_dynamic_objects(self, domain, data):
+        """Apply the add and remove lists of a POST to object/dynamicobjectmappings."""
+        if not isinstance(data, dict):
+            return self.error(400, "POST needs an object.")
+        dynamic_objects = self.collections.get((domain, "object/dynamicobjects"), {})
+        entries = [
+            (action, entry)
+            for action in ["add", "remove"]
+            for entry in data.get(action, [])
+        ]
+        for _, entry in entries:
+            object_id = entry.get("dynamicObject", {}).get("id")
+            if object_id not in dynamic_objects:
+                return self.error(404, f"Dynamic object {object_id} not found.")
+        for action, entry in entries:
+            collection = (
+                f"object/dynamicobjects/{entry['dynamicObject']['id']}/mappings"
+            )
+            mappings = self.collections.setdefault((domain, collection), {})
+            for value in entry.get("mappings", []):
+                if action == "add":
+                    mappings[value] = {"mapping": value}
+                else:
+                    mappings.pop(value, None)
+        return self.response(201, data)
+
+    def start_task(self, base, collection, item):
+        """Create the task of an object posted to one of TASK_COLLECTIONS."""
+        task = self.create(
+            base,
+            "job/taskstatuses",
+            {
+                "type": "TaskStatus",
+                "taskType": self.TASK_COLLECTIONS[collection],
+                "status": "Deploying",
+                "message": f"{collection} {item['id']}",
+            },
+        )
+        self.tasks[task["id"]] = (
+            time.monotonic() + self.task_time,
+            set(item.get("deviceList", [])),
+        )
+        return {k: task[k] for k in ["id", "taskType", "links"]}
+
+    def advance_task(self, domain, task_id):
+        """Finish a task whose task_time has passed."""
+        done_at, devices = self.tasks.get(task_id, (None, None))
+        if done_at is None or time.monotonic() < done_at:
+            return
+        del self.tasks[task_id]
+        self.collections[(domain, "job/taskstatuses")][task_id]["status"] = "Deployed"
+        deployable = self.collections.get((domain, "deployment/deployabledevices"), {})
+        for object_id, item in list(deployable.items()):
+            if item.get("device", {}).get("id") in devices:
+                del deployable[object_id]
+
+    def metadata(self, domain):
+        """Metadata of a new or updated object."""
+        name = next(n for n, u in self.domains.items() if u == domain)
+        return {
+            "timestamp": int(datetime.datetime.now().timestamp() * 1000),
+            "lastUser": {"name": self.username},
+            "domain": {"name": name, "id": domain, "type": "Domain"},
+        }
+
+    def listing(self, base, domain, collection, objects, query):
+        """Answer a GET of a collection, with paging and filters."""
+        items = list(objects.values())
+        if "name" in query:
+            items = [item for item in items if item.get("name") == query["name"]]
+        filter_ = query.get("filter", "")
+        if filter_.startswith("nameOrValue:"):
+            needle = filter_[len("nameOrValue:") :].lower()
+            items = [
+                item
+                for item in items
+                if needle in str(item.get("name", "")).lower()
+                or needle in str(item.get("value", "")).lower()
+            ]
+        try:
+            offset = max(int(query.get("offset", 0)), 0)
+            limit = min(
+                max(int(query.get("limit", self.DEFAULT_LIMIT)), 1), self.MAX_LIMIT
+            )
+        except ValueError:
+            return self.error(400, "offset and limit must be integers.")
+        url = f"{base}/{collection}"
+        self_query = {k: v for k, v in query.items() if k not in ["offset", "limit"]}
+        response = {
+            "links": {
+                "self": f"{url}?{urlencode(dict(self_query, offset=offset, limit=limit))}"
+            },
+            "paging": {
+                "offset": offset,
+                "limit": limit,
+                "count": len(items),
+                "pages": math.ceil(len(items) / limit),
+            },
+        }
+        page = items[offset : offset + limit]
+        # Dynamic object mappings are plain {"mapping": ...} entries, always listed in full.
+        if query.get("expanded") != "true" and not collection.endswith("/mappings"):
+            page = [
+                {k: item[k] for k in self.LISTING_FIELDS if k in item} for item in page
+            ]
+        if page:
+            response["items"] = page
+        if offset + limit < len(items):
+            next_query = urlencode(dict(self_query, offset=offset + limit, limit=limit))
+            response["paging"]["next"] = [
+                urlunsplit(urlsplit(url)._replace(query=next_query))
+            ]
+        return self.response(200, response)
+
+    @staticmethod
+    def response(status, payload):
+        """Encode a JSON answer."""
+        return (
+            status,
+            {"Content-Type": "application/json"},
+            json.dumps(payload).encode("utf-8"),
+        )
+
+    @classmethod
+    def error(cls, status, description, headers=None):
+        """Encode an error answer the way the FMC does."""
+        status, response_headers, body = cls.response(
+            status,
+            {
+                "error": {
+                    "category": "FRAMEWORK",
+                    "messages": [{"description": description}],
+                    "severity": "ERROR",
+                }
+            },
+        )
+        response_headers.update(headers or {})
+        return status, response_headers, body
+
+
+class SimulatorAdapter(BaseAdapter):
+    """requests transport adapter that answers from an FMCSimulator instead of the network."""
+
+    def __init__(self, simulator):
+        """
+        Initialize SimulatorAdapter object.
+
+        :param simulator (FMCSimulator): Simulator answering the requests.
+        :return: None
+        """
+        super().__init__()
+        self.simulator = simulator
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        """
+        Answer a prepared request.
+
+        :param request (requests.PreparedRequest): Request to answer.
+        :return: (requests.Response)
+        """
+        time.sleep(self.simulator.delay(request.method, urlsplit(request.url).path))
+        status, headers, body = self.simulator.handle(
+            request.method, request.url, request.headers, request.body
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, "")
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers["Date"] = self.simulator.date_header()
+        response._content = body
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        """Nothing to release."""
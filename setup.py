@@ -38,8 +38,18 @@ setup(
     ],
     keywords="fmcapi fmc ftd security cisco ngfw api firepower",
     packages=find_packages(exclude=["docs", "tests*"]),
-    install_requires=["requests", "datetime", "ipaddress", "xmltodict", "packaging"],
-    extras_require={"watchdog": ["watchdog"]},  # optional: required for DynamicObject.watch_and_sync()
+    install_requires=[
+        "requests",
+        "urllib3>=1.26",
+        "datetime",
+        "ipaddress",
+        "xmltodict",
+        "packaging",
+    ],
+    extras_require={
+        "watchdog": ["watchdog"],  # optional: required for DynamicObject.watch_and_sync()
+        "async": ["httpx"],  # optional: required for AsyncFMC
+    },
     python_requires=">=3.6",
     package_data={},
     data_files=None,
@@ -0,0 +1,204 @@
+"""
+Test apiclasstemplate.py
+"""
+import mock
+import unittest
+import uuid
+
+from fmcapi.api_objects.apiclasstemplate import APIClassTemplate
+
+
+def mock_fmc(server_version="7.2.0 (build 82)"):
+    fmc = mock.Mock()
+    fmc.serverVersion = server_version
+    fmc.configuration_url = "https://fmc/api/fmc_config/v1/domain/uuid"
+    fmc.limit = 1000
+    fmc.max_workers = 1
+    return fmc
+
+
+class Objects(APIClassTemplate):
+    VALID_JSON_DATA = ["id", "name", "type"]
+    VALID_FOR_KWARGS = VALID_JSON_DATA + []
+    URL_SUFFIX = "/object/things"
+
+
+class TestIterItems(unittest.TestCase):
+    def test_iter_items_streams_pages(self):
+        fmc = mock_fmc()
+        fmc.iter_pages.return_value = iter(
+            [{"items": [{"id": "1"}, {"id": "2"}]}, {"items": [{"id": "3"}]}]
+        )
+        items = Objects(fmc=fmc).iter_items()
+        self.assertEqual([i["id"] for i in items], ["1", "2", "3"])
+        fmc.iter_pages.assert_called_once_with(
+            url=f"{fmc.configuration_url}/object/things?expanded=true&limit=1000"
+        )
+
+    def test_iter_items_dry_run(self):
+        fmc = mock_fmc()
+        self.assertEqual(list(Objects(fmc=fmc).iter_items(dry_run=True)), [])
+        fmc.iter_pages.assert_not_called()
+
+
+class FilterableObjects(Objects):
+    VALID_GET_FILTERS = ["nameOrValue"]
+    VALID_FOR_KWARGS = Objects.VALID_FOR_KWARGS + VALID_GET_FILTERS
+
+
+class TestGetByName(unittest.TestCase):
+    def test_get_by_name_uses_server_side_filter(self):
+        fmc = mock_fmc()
+        fmc.send_to_api.return_value = {
+            "items": [
+                {"id": "1", "name": "web-1", "type": "Host"},
+                {"id": "2", "name": "web", "type": "Host"},
+            ]
+        }
+        obj = FilterableObjects(fmc=fmc, name="web")
+        obj.get(name="web")
+        self.assertEqual(obj.id, "2")
+        fmc.send_to_api.assert_called_once_with(
+            method="get",
+            url=f"{fmc.configuration_url}/object/things?expanded=true"
+            f"&filter=nameOrValue%3Aweb&limit=1000",
+        )
+
+    def test_get_by_name_falls_back_to_full_listing(self):
+        fmc = mock_fmc()
+        fmc.send_to_api.side_effect = [
+            None,
+            {"items": [{"id": "2", "name": "web", "type": "Host"}]},
+        ]
+        obj = FilterableObjects(fmc=fmc)
+        obj.get(name="web")
+        self.assertEqual(obj.id, "2")
+        self.assertEqual(
+            fmc.send_to_api.call_args[1]["url"],
+            f"{fmc.configuration_url}/object/things?expanded=true&limit=1000",
+        )
+
+    def test_get_by_name_without_filter_support(self):
+        fmc = mock_fmc()
+        fmc.send_to_api.return_value = {"items": []}
+        Objects(fmc=fmc).get(name="web")
+        fmc.send_to_api.assert_called_once_with(
+            method="get",
+            url=f"{fmc.configuration_url}/object/things?expanded=true&limit=1000",
+        )
+
+
+class TestFieldProjection(unittest.TestCase):
+    def test_listing_fields_are_not_expanded(self):
+        fmc = mock_fmc()
+        fmc.send_to_api.return_value = {
+            "items": [{"id": "1", "name": "web", "type": "Host", "links": {}}]
+        }
+        response = Objects(fmc=fmc).get(fields=["id", "name"])
+        self.assertEqual(response["items"], [{"id": "1", "name": "web"}])
+        fmc.send_to_api.assert_called_once_with(
+            method="get",
+            url=f"{fmc.configuration_url}/object/things?expanded=false&limit=1000",
+        )
+
+    def test_other_fields_are_expanded(self):
+        fmc = mock_fmc()
+        fmc.iter_pages.return_value = iter(
+            [{"items": [{"id": "1", "name": "web", "value": "10.0.0.1"}]}]
+        )
+        items = list(Objects(fmc=fmc).iter_items(fields=["name", "value"]))
+        self.assertEqual(items, [{"name": "web", "value": "10.0.0.1"}])
+        fmc.iter_pages.assert_called_once_with(
+            url=f"{fmc.configuration_url}/object/things?expanded=true&limit=1000"
+        )
+
+
+class TestBulkDispatch(unittest.TestCase):
+    def setUp(self):
+        self.fmc = mock_fmc()
+
+        def send_to_api(method, url, json_data=None, **kwargs):
+            if json_data and json_data[0]["name"] == "host-98":
+                return None
+            return {"items": [{"id": item["name"][5:]} for item in json_data]}
+
+        self.fmc.send_to_api.side_effect = send_to_api
+        self.bulk = [{"name": f"host-{i}"} for i in range(200)]
+
+    def test_bulk_post_in_parallel_keeps_order(self):
+        del self.bulk[98:147]
+        obj = Objects(fmc=self.fmc)
+        obj.bulk = self.bulk
+        obj.bulk_post(max_workers=4)
+        self.assertEqual(obj.bulk_ids, [item["name"][5:] for item in self.bulk])
+        self.assertEqual(obj.bulk_errors, [])
+        self.assertEqual(self.fmc.send_to_api.call_count, 4)
+
+    def test_bulk_post_reports_failed_chunks(self):
+        obj = Objects(fmc=self.fmc)
+        obj.bulk = self.bulk
+        obj.bulk_post(max_workers=4)
+        self.assertEqual(len(obj.bulk_ids), 151)
+        self.assertEqual(len(obj.bulk_errors), 1)
+        self.assertEqual(obj.bulk_errors[0]["chunk"], 2)
+        self.assertEqual(obj.bulk_errors[0]["items"][0]["name"], "host-98")
+
+    def test_bulk_post_reports_chunks_failing_validation(self):
+        del self.bulk[60:]
+        del self.bulk[55]["name"]
+        obj = Objects(fmc=self.fmc)
+        obj.bulk = self.bulk
+        obj.bulk_post(max_workers=4)
+        self.assertEqual(len(obj.bulk_ids), 49)
+        self.assertEqual(len(obj.bulk_errors), 1)
+        self.assertEqual(obj.bulk_errors[0]["chunk"], 1)
+        self.assertEqual(len(obj.bulk_errors[0]["items"]), 11)
+        self.assertEqual(self.fmc.send_to_api.call_count, 1)
+
+    def test_bulk_delete_in_parallel(self):
+        self.fmc.send_to_api.side_effect = None
+        self.fmc.send_to_api.return_value = {"items": []}
+        obj = Objects(fmc=self.fmc)
+        obj.bulk = [str(uuid.uuid4()) for _ in range(100)]
+        obj.bulk_delete(max_workers=3)
+        urls = sorted(c[1]["url"] for c in self.fmc.send_to_api.call_args_list)
+        self.assertEqual(len(urls), 3)
+        self.assertTrue(all("bulk=true" in url for url in urls))
+        self.assertEqual(obj.bulk_errors, [])
+
+
+class TestSchema(unittest.TestCase):
+    def test_schema_is_built_once_per_class(self):
+        self.assertIs(Objects.schema(), Objects.schema())
+        self.assertIsNot(Objects.schema(), FilterableObjects.schema())
+        self.assertIn("nameOrValue", FilterableObjects.schema().get_filters)
+        self.assertEqual(Objects.schema().kwargs, {"id", "name", "type", "dry_run"})
+
+    def test_parse_kwargs(self):
+        obj = FilterableObjects(fmc=mock_fmc())
+        obj.parse_kwargs(name="web server/1", id="1", nameOrValue="web", links={})
+        self.assertEqual(obj.name, "web_server_1")
+        self.assertEqual(obj.id, "1")
+        self.assertEqual(obj.get_filters, {"nameOrValue": "web"})
+        self.assertNotIn("links", obj.__dict__)
+        self.assertIn("dry_run", obj.VALID_FOR_KWARGS)
+
+
+class TestRecords(unittest.TestCase):
+    def test_to_records(self):
+        records = Objects.to_records([{"id": "1", "name": "a", "links": {}}])
+        self.assertEqual(records[0], ("1", "a", None))
+        self.assertEqual(records[0].name, "a")
+        self.assertIs(type(records[0]), Objects.record_type())
+        self.assertFalse(hasattr(records[0], "__dict__"))
+
+    def test_iter_records(self):
+        fmc = mock_fmc()
+        fmc.iter_pages.return_value = iter(
+            [{"items": [{"id": "1", "name": "a", "type": "Thing", "links": {}}]}]
+        )
+        records = list(Objects(fmc=fmc).iter_records(fields=["id", "name"]))
+        self.assertEqual(records, [("1", "a")])
+        self.assertEqual(records[0]._fields, ("id", "name"))
+        # Only listing fields were asked for, so the listing isn't expanded.
+        self.assertIn("expanded=false", fmc.iter_pages.call_args[1]["url"])
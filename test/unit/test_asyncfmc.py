@@ -0,0 +1,81 @@
+"""
+Test asyncfmc.py
+"""
+import asyncio
+import httpx
+import json
+import mock
+import unittest
+
+from fmcapi.asyncfmc import AsyncFMC
+from fmcapi.api_objects.object_services.hosts import Hosts
+
+SERVER_VERSION = {
+    "items": [
+        {
+            "serverVersion": "7.2.0 (build 82)",
+            "vdbVersion": "build 353",
+            "sruVersion": "2022-05-11-001-vrt",
+        }
+    ]
+}
+
+
+def handler(request):
+    path = request.url.path
+    if path.endswith("/info/serverversion"):
+        return httpx.Response(200, json=SERVER_VERSION)
+    if path.endswith("/object/hosts") and request.method == "POST":
+        return httpx.Response(201, json=dict(id="1", **json.loads(request.content)))
+    if path.endswith("/object/hosts"):
+        offset = int(request.url.params.get("offset", 0))
+        paging = {"offset": offset, "limit": 2, "count": 5, "pages": 3}
+        if offset + 2 < 5:
+            paging["next"] = [f"{request.url.copy_with(query=None)}?offset={offset + 2}&limit=2"]
+        items = [{"id": str(i), "name": f"h{i}"} for i in range(offset, min(offset + 2, 5))]
+        return httpx.Response(200, json={"items": items, "paging": paging})
+    return httpx.Response(404, json={"error": "not found"})
+
+
+def async_fmc(**kwargs):
+    fmc = AsyncFMC(api_key="key", uuid="uuid", autodeploy=False, rate_limit=None, **kwargs)
+    fmc.build_client = mock.Mock(
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return fmc
+
+
+class TestAsyncFMC(unittest.TestCase):
+    def test_sync_context_manager_is_rejected(self):
+        with self.assertRaises(TypeError):
+            with async_fmc():
+                pass
+
+    def test_send_to_api_follows_paging(self):
+        async def run():
+            async with async_fmc() as fmc:
+                self.assertEqual(fmc.serverVersion, "7.2.0 (build 82)")
+                return await fmc.send_to_api(method="get", url=f"{fmc.configuration_url}/object/hosts")
+
+        response = asyncio.run(run())
+        self.assertEqual([i["id"] for i in response["items"]], ["0", "1", "2", "3", "4"])
+
+    def test_parallel_pages_in_order(self):
+        async def run():
+            async with async_fmc(max_workers=3) as fmc:
+                url = f"{fmc.configuration_url}/object/hosts"
+                return [i["id"] async for i in fmc.aiter_items(url=url)]
+
+        self.assertEqual(asyncio.run(run()), ["0", "1", "2", "3", "4"])
+
+    def test_api_object_async_crud(self):
+        async def run():
+            async with async_fmc() as fmc:
+                hosts = [Hosts(fmc=fmc, name=f"h{i}", value=f"10.0.0.{i}") for i in range(3)]
+                posted = await asyncio.gather(*[h.apost() for h in hosts])
+                found = await Hosts(fmc=fmc).aget(name="h3")
+                return posted, found
+
+        posted, found = asyncio.run(run())
+        self.assertEqual([p["name"] for p in posted], ["h0", "h1", "h2"])
+        self.assertEqual(found["id"], "3")
@@ -0,0 +1,311 @@
+"""
+Test catalog.py
+"""
+
+import logging
+import mock
+import os
+import tempfile
+import threading
+import unittest
+
+from fmcapi.catalog import ObjectCatalog
+from fmcapi.fmc import FMC
+from fmcapi.api_objects.device_services.ipv4staticroutes import IPv4StaticRoutes
+from fmcapi.api_objects.object_services.networkaddresses import (
+    NetworkAddresses as NetworkAddressesClass,
+)
+from fmcapi.api_objects.object_services.networkgroups import NetworkGroups
+from fmcapi.simulator import FMCSimulator
+
+
+class NetworkAddresses(object):
+    responses = []
+
+    def __init__(self, fmc):
+        self.fmc = fmc
+
+    def get(self, fields=None):
+        return self.responses.pop(0)
+
+
+class SlowNetworkGroups(object):
+    started = None
+    release = None
+
+    def __init__(self, fmc):
+        self.fmc = fmc
+
+    def get(self, fields=None):
+        self.started.set()
+        self.release.wait(5)
+        return {"items": [{"id": "g", "name": "servers", "type": "NetworkGroup"}]}
+
+
+class TestObjectCatalog(unittest.TestCase):
+    def setUp(self):
+        NetworkAddresses.responses = [
+            {"items": [{"id": "1", "name": "web", "type": "Host"}]},
+            {"items": [{"id": "2", "name": "web", "type": "Host"}]},
+        ]
+        self.catalog = ObjectCatalog(fmc=mock.Mock(), ttl=300)
+
+    def test_lookup_loads_collection_once(self):
+        for _ in range(3):
+            self.assertEqual(
+                self.catalog.lookup("web", [NetworkAddresses]),
+                {"id": "1", "name": "web", "type": "Host"},
+            )
+        self.assertEqual(self.catalog.stats()["loads"], 1)
+        self.assertEqual(self.catalog.stats()["hits"], 3)
+
+    def test_lookup_missing_name(self):
+        self.assertIsNone(self.catalog.lookup("db", [NetworkAddresses]))
+        self.assertEqual(self.catalog.stats()["misses"], 1)
+
+    @mock.patch("fmcapi.catalog.time.monotonic")
+    def test_expired_collection_is_reloaded(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        self.catalog.lookup("web", [NetworkAddresses])
+        mock_monotonic.return_value = 301
+        self.assertEqual(self.catalog.lookup("web", [NetworkAddresses])["id"], "2")
+
+    def test_store_and_discard_write_through(self):
+        self.catalog.lookup("web", [NetworkAddresses])
+        self.catalog.store({"id": "3", "name": "db", "type": "Network"})
+        self.assertEqual(self.catalog.lookup("db", [NetworkAddresses])["id"], "3")
+        self.catalog.discard("3")
+        self.assertIsNone(self.catalog.lookup("db", [NetworkAddresses]))
+        self.assertEqual(self.catalog.stats()["loads"], 1)
+
+    def test_bulk_changes_are_written_in_one_call(self):
+        self.catalog.lookup("web", [NetworkAddresses])
+        self.catalog.snapshot = mock.Mock()
+        hosts = [{"id": str(n), "name": f"host-{n}", "type": "Host"} for n in range(3)]
+        self.catalog.store_many(
+            hosts + [{"id": "9", "name": "acp", "type": "AccessPolicy"}]
+        )
+        self.catalog.snapshot.store.assert_called_once_with(self.catalog.scope, hosts)
+        self.assertNotIn(("AccessPolicy", "acp"), self.catalog.entries)
+        self.catalog.discard_many(["0", "1"])
+        self.catalog.snapshot.discard.assert_called_once_with(
+            self.catalog.scope, ["0", "1"]
+        )
+
+    def slow_lookup(self, name):
+        SlowNetworkGroups.started = threading.Event()
+        SlowNetworkGroups.release = threading.Event()
+        self.addCleanup(SlowNetworkGroups.release.set)
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                self.catalog.lookup(name, [SlowNetworkGroups])
+            )
+        )
+        thread.start()
+        self.assertTrue(SlowNetworkGroups.started.wait(5))
+        return thread, results
+
+    def test_download_does_not_block_other_collections(self):
+        self.catalog.lookup("web", [NetworkAddresses])
+        thread, results = self.slow_lookup("servers")
+        self.assertEqual(self.catalog.lookup("web", [NetworkAddresses])["id"], "1")
+        self.catalog.store({"id": "3", "name": "db", "type": "Host"})
+        self.assertTrue(thread.is_alive())
+        SlowNetworkGroups.release.set()
+        thread.join(5)
+        self.assertEqual(
+            results, [{"id": "g", "name": "servers", "type": "NetworkGroup"}]
+        )
+
+    def test_changes_made_during_a_download_are_kept(self):
+        thread, results = self.slow_lookup("servers")
+        self.catalog.store({"id": "h", "name": "dmz", "type": "NetworkGroup"})
+        self.catalog.discard("g")
+        SlowNetworkGroups.release.set()
+        thread.join(5)
+        self.assertEqual(results, [None])
+        self.assertEqual(self.catalog.lookup("dmz", [SlowNetworkGroups])["id"], "h")
+
+    def test_failed_load_is_not_cached(self):
+        NetworkAddresses.responses.insert(0, None)
+        self.assertIsNone(self.catalog.lookup("web", [NetworkAddresses]))
+        self.assertEqual(self.catalog.lookup("web", [NetworkAddresses])["id"], "1")
+
+
+class TestCatalogFile(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "catalog.db")
+        self.simulator = FMCSimulator()
+        self.simulator.load(
+            "object/networkaddresses",
+            [
+                {"name": f"net-{i}", "value": f"10.0.{i}.0/24", "type": "Network"}
+                for i in range(3)
+            ]
+            + [{"name": "gw", "value": "10.0.0.1", "type": "Host"}],
+        )
+        self.simulator.load(
+            "object/networkgroups", [{"name": "group-0", "type": "NetworkGroup"}]
+        )
+        self.gets = []
+        handle = self.simulator.handle
+
+        def record(method, url, headers, body):
+            if method == "GET":
+                self.gets.append(url.split("?")[0].rsplit("/", 2)[-2:])
+            return handle(method, url, headers, body)
+
+        self.simulator.handle = record
+
+    def run_session(self, function, catalog_file=None):
+        fmc = FMC(
+            host="fmc",
+            autodeploy=False,
+            rate_limit=None,
+            catalog_file=self.path if catalog_file is None else catalog_file,
+        )
+        with self.simulator.attach(fmc):
+            del self.gets[:]
+            return function(fmc)
+
+    @staticmethod
+    def lookup(name):
+        return lambda fmc: fmc.catalog.lookup(
+            name, [NetworkAddressesClass, NetworkGroups]
+        )
+
+    def test_next_run_starts_warm(self):
+        first = self.run_session(self.lookup("net-1"))
+        self.assertIn(["object", "networkaddresses"], self.gets)
+        second = self.run_session(self.lookup("net-1"))
+        self.assertEqual(first, second)
+        # Only the audit log is read, no collection is listed again.
+        self.assertEqual(self.gets, [["audit", "auditrecords"]])
+
+    def network(self, name):
+        return next(
+            item
+            for item in self.simulator.objects("object/networkaddresses")
+            if item["name"] == name
+        )
+
+    def send(self, method, path, json_data=None):
+        """Change an object from another client."""
+        return self.run_session(
+            lambda fmc: fmc.send_to_api(
+                method=method,
+                url=f"{fmc.configuration_url}/{path}",
+                json_data=json_data,
+            )
+        )
+
+    def test_changes_are_applied_one_by_one(self):
+        self.run_session(self.lookup("net-2"))
+        network = self.network("net-2")
+        self.send(
+            "put",
+            f"object/networkaddresses/{network['id']}",
+            dict(network, name="net-9"),
+        )
+        self.send("delete", f"object/networkaddresses/{self.network('net-0')['id']}")
+        self.assertEqual(self.run_session(self.lookup("net-9"))["id"], network["id"])
+        # The changed object is read again, the deleted one dropped and no collection listed.
+        self.assertEqual(
+            self.gets,
+            [["audit", "auditrecords"], ["networkaddresses", network["id"]]],
+        )
+        self.assertIsNone(self.run_session(self.lookup("net-2")))
+        self.assertIsNone(self.run_session(self.lookup("net-0")))
+        self.assertEqual(self.gets, [["audit", "auditrecords"]])
+
+    def test_new_objects_list_only_their_collection(self):
+        self.run_session(self.lookup("net-1"))
+        self.send(
+            "post",
+            "object/networkaddresses",
+            {"name": "net-5", "value": "10.0.5.0/24", "type": "Network"},
+        )
+        self.assertIsNotNone(self.run_session(self.lookup("net-5")))
+        self.assertEqual(
+            self.gets, [["audit", "auditrecords"], ["object", "networkaddresses"]]
+        )
+
+    def test_unattributable_change_loads_again(self):
+        self.run_session(self.lookup("net-1"))
+        self.simulator.audit.append(
+            {
+                "id": "ui-change",
+                "time": int(self.simulator.now()),
+                "domain": self.simulator.domain_uuid,
+                "subsystem": "Object Manager",
+                "message": "Network object changed",
+            }
+        )
+        self.run_session(self.lookup("net-1"))
+        self.assertIn(["object", "networkaddresses"], self.gets)
+
+    def test_fmc_clock_is_used_for_the_audit_log(self):
+        # The FMC's clock is an hour behind: starttime taken from the local clock would skip the change.
+        self.simulator.clock_offset = -3600
+        self.run_session(self.lookup("net-2"))
+        network = self.network("net-2")
+        self.send(
+            "put",
+            f"object/networkaddresses/{network['id']}",
+            dict(network, name="net-9"),
+        )
+        self.assertEqual(self.run_session(self.lookup("net-9"))["id"], network["id"])
+
+    def test_own_changes_are_written_through(self):
+        def create(fmc):
+            fmc.catalog.lookup("net-1", [NetworkAddressesClass])
+            fmc.catalog.store({"id": "1", "name": "db", "type": "Host"})
+            fmc.catalog.store({"id": "2", "name": "acp", "type": "AccessPolicy"})
+
+        self.run_session(create)
+        snapshot = ObjectCatalog(fmc=mock.Mock(host="fmc"), path=self.path).snapshot
+        scopes = {
+            row[0] for row in snapshot.connection.execute("SELECT scope FROM objects")
+        }
+        self.assertNotIn(
+            ("AccessPolicy",),
+            snapshot.connection.execute("SELECT type FROM objects").fetchall(),
+        )
+        self.assertEqual(
+            sorted(
+                snapshot.items(scopes.pop(), ["Host"]), key=lambda item: item["name"]
+            ),
+            [
+                {"id": "1", "name": "db", "type": "Host", "value": None},
+                {"id": mock.ANY, "name": "gw", "type": "Host", "value": "10.0.0.1"},
+            ],
+        )
+        snapshot.close()
+
+    def test_routes_and_groups_resolve_through_the_catalog(self):
+        def build(fmc):
+            route = IPv4StaticRoutes(fmc=fmc)
+            route.networks(action="add", networks=["net-0", "group-0", "missing"])
+            route.gw(name="gw")
+            group = NetworkGroups(fmc=fmc, name="servers")
+            group.named_networks(action="add", name="net-1")
+            group.named_networks(action="addgroup", name="group-0")
+            return route, group
+
+        route, group = self.run_session(build)
+        self.assertEqual(
+            [network["name"] for network in route.selectedNetworks],
+            ["net-0", "group-0"],
+        )
+        self.assertEqual(route.gateway["object"]["name"], "gw")
+        self.assertEqual([obj["name"] for obj in group.objects], ["net-1", "group-0"])
+        # Each collection is listed once, however many names are resolved.
+        self.assertEqual(
+            sorted(self.gets),
+            [["object", "networkaddresses"], ["object", "networkgroups"]],
+        )
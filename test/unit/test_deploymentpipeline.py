@@ -0,0 +1,125 @@
+"""
+Test deploymentpipeline.py
+"""
+
+import mock
+import unittest
+
+from fmcapi.api_objects.deployment_services import DeploymentPipeline
+from fmcapi.api_objects.status_services import TaskTracker
+
+
+def deployable(*names, version="100"):
+    return {
+        "items": [
+            {
+                "name": name,
+                "canBeDeployed": True,
+                "version": version,
+                "device": {"id": f"{name}-id"},
+            }
+            for name in names
+        ]
+    }
+
+
+class FakeFMC(object):
+    def __init__(self, deployable_responses, task_statuses):
+        self.configuration_url = "https://fmc/api/fmc_config/v1/domain/uuid"
+        self.serverVersion = "7.2.0"
+        self.limit = 1000
+        self.wait_time = 15
+        self.deployable_responses = deployable_responses
+        self.task_statuses = task_statuses
+        self.posted = []
+        self.task_tracker = TaskTracker(fmc=self)
+
+    def supports(self, api_class):
+        return True
+
+    def send_to_api(self, method, url, json_data=None, **kwargs):
+        if "deployabledevices" in url:
+            return self.deployable_responses.pop(0)
+        if "deploymentrequests" in url:
+            self.posted.append(json_data)
+            return dict(json_data, metadata={"task": {"id": "task-1"}})
+        if "taskstatuses" in url:
+            return {"id": "task-1", "status": self.task_statuses.pop(0)}
+
+
+@mock.patch.object(TaskTracker, "POLL_INTERVAL", 0.001)
+@mock.patch("fmcapi.api_objects.deployment_services.deploymentpipeline.time.sleep")
+class TestDeploymentPipeline(unittest.TestCase):
+    def test_deploy_tracks_task_to_completion(self, mock_sleep):
+        fmc = FakeFMC(
+            deployable_responses=[
+                deployable("ftd1"),
+                deployable("ftd1", "ftd2"),
+                deployable("ftd1", "ftd2"),
+                deployable(),
+            ],
+            task_statuses=["Deploying", "Deploying", "Deployed"],
+        )
+        result = DeploymentPipeline(fmc=fmc).deploy()
+        self.assertEqual(result["status"], "Deployed")
+        self.assertEqual(fmc.posted[0]["deviceList"], ["ftd1-id", "ftd2-id"])
+        self.assertEqual(
+            {d["name"]: d["status"] for d in result["devices"].values()},
+            {"ftd1": "DEPLOYED", "ftd2": "DEPLOYED"},
+        )
+        # Backoff between polls rather than one fixed wait.
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1, 2])
+
+    def test_failed_device_is_reported(self, mock_sleep):
+        fmc = FakeFMC(
+            deployable_responses=[
+                deployable("ftd1", "ftd2"),
+                deployable("ftd1", "ftd2"),
+                deployable("ftd2"),
+            ],
+            task_statuses=["FAILED"],
+        )
+        result = DeploymentPipeline(fmc=fmc).deploy()
+        self.assertEqual(result["devices"]["ftd1-id"]["status"], "DEPLOYED")
+        self.assertEqual(result["devices"]["ftd2-id"]["status"], "FAILED")
+
+    def test_nothing_to_deploy_waits_for_settle_time(self, mock_sleep):
+        fmc = FakeFMC(deployable_responses=[deployable()] * 10, task_statuses=[])
+        with mock.patch(
+            "fmcapi.api_objects.deployment_services.deploymentpipeline.time.monotonic",
+            side_effect=[0, 0, 1, 3, 7, 15],
+        ):
+            result = DeploymentPipeline(fmc=fmc, settle_time=10).deploy()
+        self.assertEqual(result["status"], "NOTHING_TO_DEPLOY")
+        self.assertEqual(fmc.posted, [])
+
+    def test_failed_get_is_not_an_empty_list(self, mock_sleep):
+        fmc = FakeFMC(deployable_responses=[deployable(), None], task_statuses=[])
+        result = DeploymentPipeline(fmc=fmc, settle_time=0).deploy()
+        self.assertEqual(result["status"], "FAILED")
+        self.assertEqual(fmc.posted, [])
+
+    def test_changing_list_times_out(self, mock_sleep):
+        fmc = FakeFMC(
+            deployable_responses=[
+                deployable("ftd1", version=str(i)) for i in range(10)
+            ],
+            task_statuses=[],
+        )
+        with mock.patch(
+            "fmcapi.api_objects.deployment_services.deploymentpipeline.time.monotonic",
+            side_effect=[0, 0, 1, 3, 7],
+        ):
+            result = DeploymentPipeline(fmc=fmc, settle_timeout=5).deploy()
+        self.assertEqual(result["status"], "TIMEOUT")
+        self.assertEqual(fmc.posted, [])
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1, 2, 2])
+
+    def test_timeout(self, mock_sleep):
+        fmc = FakeFMC(
+            deployable_responses=[deployable("ftd1")] * 3,
+            task_statuses=["Deploying"] * 1000,
+        )
+        result = DeploymentPipeline(fmc=fmc, timeout=0.05).deploy()
+        self.assertEqual(result["status"], "TIMEOUT")
+        self.assertEqual(result["devices"]["ftd1-id"]["status"], "FAILED")
@@ -0,0 +1,82 @@
+"""
+Test deviceonboarding.py
+"""
+import mock
+import unittest
+
+from fmcapi.api_objects.device_services import DeviceOnboarding
+from fmcapi.api_objects.status_services import TaskFuture
+
+
+class FakeDevice(object):
+    def __init__(self, name, accepted=True):
+        self.name = name
+        self.accepted = accepted
+        self.task_future = None
+
+    def post(self, **kwargs):
+        if not self.accepted:
+            return None
+        self.task_future = TaskFuture(task_id=f"{self.name}-task")
+        self.task_future.set_running_or_notify_cancel()
+        return {"metadata": {"task": {"id": f"{self.name}-task"}}}
+
+
+class TestDeviceOnboarding(unittest.TestCase):
+    def setUp(self):
+        self.onboarding = DeviceOnboarding(fmc=mock.Mock(), max_workers=3)
+        self.steps_run = []
+
+    def step(self, label, fail=False):
+        def run(device):
+            self.steps_run.append((device.name, label))
+            if fail:
+                raise RuntimeError(f"{label} failed")
+
+        return run
+
+    def finish_registrations(self, devices, status="COMPLETED"):
+        for device in devices:
+            if device.task_future is not None:
+                device.task_future.status = status
+                device.task_future.set_result({"status": status})
+
+    def test_onboarding(self):
+        devices = [FakeDevice("ftd1"), FakeDevice("ftd2"), FakeDevice("ftd3", False)]
+        self.onboarding.add(devices[0], steps=[self.step("nat"), self.step("intf")])
+        self.onboarding.add(devices[1], steps=[self.step("nat", fail=True)])
+        self.onboarding.add(devices[2], steps=[self.step("nat")])
+        register = self.onboarding.register
+
+        def register_and_finish(entry):
+            future = register(entry)
+            self.finish_registrations([entry["device"]])
+            return future
+
+        with mock.patch.object(
+            self.onboarding, "register", side_effect=register_and_finish
+        ), mock.patch.object(
+            self.onboarding, "wait_until_ready", side_effect=lambda name: FakeDevice(name)
+        ):
+            results = self.onboarding.run()
+        self.assertEqual(
+            [(r["name"], r["status"], r["steps_done"]) for r in results],
+            [
+                ("ftd1", "ONBOARDED", 2),
+                ("ftd2", "STEP_FAILED", 0),
+                ("ftd3", "REGISTRATION_FAILED", 0),
+            ],
+        )
+        self.assertEqual(
+            [s for s in self.steps_run if s[0] == "ftd1"],
+            [("ftd1", "nat"), ("ftd1", "intf")],
+        )
+
+    def test_failed_registration_task_skips_steps(self):
+        device = FakeDevice("ftd1")
+        self.onboarding.add(device, steps=[self.step("nat")])
+        future = self.onboarding.register(self.onboarding.devices[0])
+        self.finish_registrations([device], status="FAILED")
+        self.onboarding.finish(self.onboarding.devices[0], future)
+        self.assertEqual(self.onboarding.devices[0]["status"], "REGISTRATION_FAILED")
+        self.assertEqual(self.steps_run, [])
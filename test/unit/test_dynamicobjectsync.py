@@ -0,0 +1,237 @@
+"""
+Test dynamicobjectsync.py
+"""
+
+import logging
+import os
+import random
+import tempfile
+import time
+import unittest
+
+from fmcapi.fmc import FMC
+from fmcapi.api_objects.object_services.dynamicobjectsync import DynamicObjectSync
+from fmcapi.simulator import FMCSimulator
+
+
+class TestDynamicObjectSync(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.simulator = FMCSimulator()
+        self.sent = []
+        handle = self.simulator.handle
+
+        def record(method, url, headers, body):
+            self.sent.append((method, len(body or b"")))
+            return handle(method, url, headers, body)
+
+        self.simulator.handle = record
+        self.fmc = self.simulator.attach(
+            FMC(host="fmc", autodeploy=False, rate_limit=None)
+        )
+        self.fmc.__enter__()
+        self.addCleanup(self.fmc.__exit__)
+
+    def write(self, name, addresses):
+        filepath = os.path.join(self.directory.name, f"{name}.txt")
+        with open(filepath, "w") as f:
+            f.write("\n".join(addresses + ["not an address", ""]))
+        return filepath
+
+    def mappings(self, name):
+        dynamic_object = next(
+            item
+            for item in self.simulator.objects("object/dynamicobjects")
+            if item["name"] == name
+        )
+        collection = f"object/dynamicobjects/{dynamic_object['id']}/mappings"
+        return {item["mapping"] for item in self.simulator.objects(collection)}
+
+    def test_batches_files_into_one_post(self):
+        self.simulator.load(
+            "object/dynamicobjects",
+            [
+                {"name": "feed-a", "objectType": "IP"},
+                {"name": "feed-b", "objectType": "IP"},
+            ],
+        )
+        syncer = DynamicObjectSync(fmc=self.fmc)
+        files = [
+            self.write("feed-a", ["10.0.0.1", "10.0.0.2"]),
+            self.write("feed-b", ["2001:db8::1"]),
+        ]
+        requests = self.simulator.requests
+        self.assertEqual(syncer.sync(files), {"feed-a": (2, 0), "feed-b": (1, 0)})
+        # Two object lookups, two mapping reads and a single POST.
+        self.assertEqual(self.simulator.requests - requests, 5)
+        self.assertEqual(self.mappings("feed-a"), {"10.0.0.1", "10.0.0.2"})
+        self.assertEqual(self.mappings("feed-b"), {"2001:db8::1"})
+
+        # Unchanged files cost no API call, changed ones only the POST.
+        requests = self.simulator.requests
+        self.assertEqual(syncer.sync(files), {})
+        self.assertEqual(self.simulator.requests, requests)
+        self.write("feed-a", ["10.0.0.2", "10.0.0.3"])
+        self.assertEqual(syncer.sync(files), {"feed-a": (1, 1)})
+        self.assertEqual(self.simulator.requests - requests, 1)
+        self.assertEqual(self.mappings("feed-a"), {"10.0.0.2", "10.0.0.3"})
+
+    def test_creates_missing_objects(self):
+        filepath = self.write("feed-c", ["10.0.0.1"])
+        self.assertEqual(DynamicObjectSync(fmc=self.fmc).sync([filepath]), {})
+        self.assertEqual(self.simulator.objects("object/dynamicobjects"), [])
+        syncer = DynamicObjectSync(fmc=self.fmc, create=True)
+        self.assertEqual(syncer.sync([filepath]), {"feed-c": (1, 0)})
+        self.assertEqual(self.mappings("feed-c"), {"10.0.0.1"})
+
+    def test_debounce_coalesces_events(self):
+        self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-d", "objectType": "IP"}]
+        )
+        syncer = DynamicObjectSync(fmc=self.fmc, debounce=0.1)
+        synced = []
+        sync = syncer.sync
+        syncer.sync = lambda filepaths: synced.append(filepaths) or sync(filepaths)
+        filepath = self.write("feed-d", ["10.0.0.1"])
+        for _ in range(5):
+            syncer.schedule(filepath)
+            time.sleep(0.02)
+        deadline = time.monotonic() + 5
+        while syncer.thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(synced, [[filepath]])
+        self.assertEqual(self.mappings("feed-d"), {"10.0.0.1"})
+
+    def test_flush(self):
+        self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-e", "objectType": "IP"}]
+        )
+        syncer = DynamicObjectSync(fmc=self.fmc, debounce=60)
+        syncer.schedule(self.write("feed-e", ["10.0.0.1"]))
+        self.assertEqual(syncer.flush(), {"feed-e": (1, 0)})
+        self.assertEqual(syncer.pending, {})
+
+    def test_failed_mappings_read_is_not_cached(self):
+        dynamic_object = self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-i", "objectType": "IP"}]
+        )[0]
+        self.simulator.load(
+            f"object/dynamicobjects/{dynamic_object['id']}/mappings",
+            [{"id": "10.0.0.1", "mapping": "10.0.0.1"}],
+        )
+        syncer = DynamicObjectSync(fmc=self.fmc)
+        filepath = self.write("feed-i", ["10.0.0.2"])
+        handle = self.simulator.handle
+        self.simulator.handle = lambda method, url, headers, body: (
+            (500, {}, b'{"error": {}}')
+            if method == "GET" and url.split("?")[0].endswith("/mappings")
+            else handle(method, url, headers, body)
+        )
+        self.assertEqual(syncer.sync([filepath]), {})
+        self.assertEqual(syncer.mappings, {})
+        self.assertEqual(self.mappings("feed-i"), {"10.0.0.1"})
+        self.simulator.handle = handle
+        self.assertEqual(syncer.sync([filepath]), {"feed-i": (1, 1)})
+        self.assertEqual(self.mappings("feed-i"), {"10.0.0.2"})
+
+    def test_stream_in_chunks(self):
+        self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-f", "objectType": "IP"}]
+        )
+        progress = []
+        syncer = DynamicObjectSync(
+            fmc=self.fmc,
+            snapshot_dir=os.path.join(self.directory.name, "snapshots"),
+            max_payload=1000,
+            progress=lambda *args: progress.append(args),
+        )
+        addresses = [f"10.0.{i // 256}.{i % 256}" for i in range(300)]
+        filepath = self.write("feed-f", addresses)
+        del self.sent[:]
+        self.assertEqual(syncer.sync([filepath]), {"feed-f": (300, 0)})
+        self.assertEqual(self.mappings("feed-f"), set(addresses))
+        posts = [size for method, size in self.sent if method == "POST"]
+        self.assertGreater(len(posts), 1)
+        self.assertLessEqual(max(posts), 1000)
+        self.assertEqual(len(progress), len(posts))
+        self.assertEqual(progress[-1], ("feed-f", 300, 0))
+
+        # Later syncs compare with the snapshot instead of reading the FMC's mappings.
+        del self.sent[:]
+        self.write("feed-f", addresses[100:] + ["10.1.0.1"])
+        self.assertEqual(syncer.sync([filepath]), {"feed-f": (1, 100)})
+        self.assertEqual(self.mappings("feed-f"), set(addresses[100:] + ["10.1.0.1"]))
+        self.assertEqual(syncer.sync([filepath]), {})
+        self.assertEqual({method for method, _ in self.sent}, {"POST"})
+
+    def test_stream_starts_from_fmc_mappings(self):
+        dynamic_object = self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-g", "objectType": "IP"}]
+        )[0]
+        self.simulator.load(
+            f"object/dynamicobjects/{dynamic_object['id']}/mappings",
+            [{"id": "10.0.0.1", "mapping": "10.0.0.1"}],
+        )
+        snapshots = os.path.join(self.directory.name, "snapshots")
+        syncer = DynamicObjectSync(fmc=self.fmc, snapshot_dir=snapshots)
+        filepath = self.write("feed-g", ["10.0.0.2"])
+        self.assertEqual(syncer.sync([filepath]), {"feed-g": (1, 1)})
+        with open(os.path.join(snapshots, f"{dynamic_object['id']}.txt")) as f:
+            self.assertEqual(f.read(), "10.0.0.2\n")
+
+    def test_stream_sorts_large_feeds_in_runs(self):
+        self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-j", "objectType": "IP"}]
+        )
+        snapshots = os.path.join(self.directory.name, "snapshots")
+        syncer = DynamicObjectSync(fmc=self.fmc, snapshot_dir=snapshots)
+        syncer.SORT_RUN = 50
+        addresses = [f"10.0.{i // 256}.{i % 256}" for i in range(500)]
+        random.Random(1).shuffle(addresses)
+        filepath = self.write("feed-j", addresses + addresses[:100])
+        self.assertEqual(syncer.sync([filepath]), {"feed-j": (500, 0)})
+        self.assertEqual(self.mappings("feed-j"), set(addresses))
+        self.write("feed-j", addresses[200:] + ["10.1.0.1"])
+        self.assertEqual(syncer.sync([filepath]), {"feed-j": (1, 200)})
+        self.assertEqual(self.mappings("feed-j"), set(addresses[200:] + ["10.1.0.1"]))
+        self.assertEqual(len(os.listdir(snapshots)), 1)
+
+    def test_stream_does_not_seed_from_a_failed_read(self):
+        dynamic_object = self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-k", "objectType": "IP"}]
+        )[0]
+        self.simulator.load(
+            f"object/dynamicobjects/{dynamic_object['id']}/mappings",
+            [{"id": "10.0.0.1", "mapping": "10.0.0.1"}],
+        )
+        snapshots = os.path.join(self.directory.name, "snapshots")
+        syncer = DynamicObjectSync(fmc=self.fmc, snapshot_dir=snapshots)
+        filepath = self.write("feed-k", ["10.0.0.2"])
+        handle = self.simulator.handle
+        self.simulator.handle = lambda method, url, headers, body: (
+            (500, {}, b'{"error": {}}')
+            if method == "GET" and url.split("?")[0].endswith("/mappings")
+            else handle(method, url, headers, body)
+        )
+        del self.sent[:]
+        self.assertEqual(syncer.sync([filepath]), {})
+        self.assertEqual(os.listdir(snapshots), [])
+        self.assertNotIn("POST", {method for method, _ in self.sent})
+        self.simulator.handle = handle
+        self.assertEqual(syncer.sync([filepath]), {"feed-k": (1, 1)})
+
+    def test_stream_failure_drops_snapshot(self):
+        self.simulator.load(
+            "object/dynamicobjects", [{"name": "feed-h", "objectType": "IP"}]
+        )
+        snapshots = os.path.join(self.directory.name, "snapshots")
+        syncer = DynamicObjectSync(fmc=self.fmc, snapshot_dir=snapshots)
+        filepath = self.write("feed-h", ["10.0.0.1"])
+        self.simulator.max_payload = 10
+        self.assertEqual(syncer.sync([filepath]), {})
+        self.assertEqual(os.listdir(snapshots), [])
+        self.simulator.max_payload = 2048000
+        self.assertEqual(syncer.sync([filepath]), {"feed-h": (1, 0)})
@@ -0,0 +1,343 @@
+"""
+Test fmc.py
+"""
+import datetime
+import json
+import mock
+import os
+import requests
+import tempfile
+import time
+import unittest
+
+from fmcapi import fmc
+
+
+def mock_response(payload, status_code=200, headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.text = json.dumps(payload)
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            str(status_code)
+        )
+    return response
+
+
+class TestFMCSession(unittest.TestCase):
+    def test_build_session_uses_pool_settings(self):
+        f = fmc.FMC(pool_connections=4, pool_maxsize=20, max_retries=2)
+        session = f.build_session()
+        adapter = session.get_adapter("https://192.168.45.45/")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(adapter.max_retries.total, 2)
+        session.close()
+
+    def test_build_session_without_keep_alive(self):
+        f = fmc.FMC(keep_alive=False)
+        session = f.build_session()
+        self.assertEqual(session.headers["Connection"], "close")
+        session.close()
+
+    def test_send_to_api_uses_session(self):
+        f = fmc.FMC(api_key="key", uuid="uuid")
+        f.session = mock.Mock()
+        f.session.request.return_value = mock_response({"id": "1"})
+        self.assertEqual(f.send_to_api(method="get", url="https://fmc/x"), {"id": "1"})
+        f.session.request.assert_called_once()
+        self.assertEqual(f.session.request.call_args[0], ("GET", "https://fmc/x"))
+
+    def test_exit_closes_session(self):
+        f = fmc.FMC(autodeploy=False)
+        session = mock.Mock()
+        f.session = session
+        f.__exit__()
+        session.close.assert_called_once()
+        self.assertIsNone(f.session)
+
+
+def paged_responses(total, limit):
+    responses = []
+    for offset in range(0, total, limit):
+        paging = {"offset": offset, "limit": limit, "count": total}
+        paging["pages"] = (total + limit - 1) // limit
+        if offset + limit < total:
+            paging["next"] = [
+                f"https://fmc/x?offset={offset + limit}&limit={limit}&expanded=true"
+            ]
+        items = [{"id": str(i)} for i in range(offset, min(offset + limit, total))]
+        responses.append(mock_response({"items": items, "paging": paging}))
+    return responses
+
+
+class TestCapabilities(unittest.TestCase):
+    def test_version_is_parsed_once(self):
+        f = fmc.FMC()
+        f.serverVersion = "10.0.0 (build 12)"
+        self.assertEqual(str(f.version), "10.0.0")
+        self.assertTrue(f.version_at_least("7.0"))
+        self.assertFalse(f.version_at_least("10.1"))
+
+    def test_supports_is_computed_once_per_class(self):
+        class Old(object):
+            FIRST_SUPPORTED_FMC_VERSION = "6.1"
+
+        class New(object):
+            FIRST_SUPPORTED_FMC_VERSION = "7.4"
+
+        f = fmc.FMC()
+        f.serverVersion = "7.2.0 (build 82)"
+        with mock.patch.object(
+            f, "version_at_least", wraps=f.version_at_least
+        ) as m:
+            self.assertTrue(f.supports(Old))
+            self.assertFalse(f.supports(New))
+            self.assertTrue(f.supports(Old))
+            self.assertEqual(m.call_count, 2)
+        self.assertEqual(f.capabilities, {Old: True, New: False})
+        f.serverVersion = "7.4.1"
+        self.assertEqual(f.capabilities, {})
+        self.assertTrue(f.supports(New))
+
+
+class TestFMCPaging(unittest.TestCase):
+    def setUp(self):
+        self.fmc = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None)
+        self.fmc.session = mock.Mock()
+
+    def test_send_to_api_gathers_all_pages(self):
+        self.fmc.session.request.side_effect = paged_responses(total=25, limit=10)
+        response = self.fmc.send_to_api(method="get", url="https://fmc/x")
+        self.assertEqual([i["id"] for i in response["items"]], [str(i) for i in range(25)])
+        self.assertEqual(self.fmc.session.request.call_count, 3)
+
+    def test_send_to_api_many_pages_does_not_recurse(self):
+        self.fmc.session.request.side_effect = paged_responses(total=1500, limit=1)
+        response = self.fmc.send_to_api(method="get", url="https://fmc/x")
+        self.assertEqual(len(response["items"]), 1500)
+
+    def test_send_to_api_returns_none_when_a_page_fails(self):
+        responses = paged_responses(total=25, limit=10)
+        responses[1] = mock_response({"error": "bad"}, status_code=500)
+        self.fmc.session.request.side_effect = responses
+        self.assertIsNone(self.fmc.send_to_api(method="get", url="https://fmc/x"))
+
+    def test_iter_pages_is_lazy(self):
+        self.fmc.session.request.side_effect = paged_responses(total=25, limit=10)
+        pages = self.fmc.iter_pages(url="https://fmc/x")
+        self.assertEqual(len(next(pages)["items"]), 10)
+        self.assertEqual(self.fmc.session.request.call_count, 1)
+
+    def test_iter_items(self):
+        self.fmc.session.request.side_effect = paged_responses(total=25, limit=10)
+        self.assertEqual(len(list(self.fmc.iter_items(url="https://fmc/x"))), 25)
+
+    def test_parallel_paging_keeps_order(self):
+        self.fmc.max_workers = 4
+        responses = paged_responses(total=95, limit=10)
+
+        def request(method, url, **kwargs):
+            offset = 0
+            if "offset=" in url:
+                offset = int(url.split("offset=")[1].split("&")[0])
+            return responses[offset // 10]
+
+        self.fmc.session.request.side_effect = request
+        response = self.fmc.send_to_api(method="get", url="https://fmc/x")
+        self.assertEqual([i["id"] for i in response["items"]], [str(i) for i in range(95)])
+        self.assertEqual(self.fmc.session.request.call_count, 10)
+
+    def test_parallel_paging_stops_on_failure(self):
+        self.fmc.max_workers = 3
+        responses = paged_responses(total=50, limit=10)
+        responses[2] = mock_response({"error": "bad"}, status_code=500)
+
+        def request(method, url, **kwargs):
+            offset = 0
+            if "offset=" in url:
+                offset = int(url.split("offset=")[1].split("&")[0])
+            return responses[offset // 10]
+
+        self.fmc.session.request.side_effect = request
+        self.assertIsNone(self.fmc.send_to_api(method="get", url="https://fmc/x"))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_is_not_paced(self):
+        limiter = fmc.RateLimiter(rate=60, burst=5)
+        self.assertEqual([limiter.reserve() for _ in range(5)], [0] * 5)
+
+    def test_requests_beyond_burst_are_paced(self):
+        limiter = fmc.RateLimiter(rate=60, burst=1)
+        limiter.reserve()
+        self.assertAlmostEqual(limiter.reserve(), 1, places=1)
+        self.assertAlmostEqual(limiter.reserve(), 2, places=1)
+        self.assertEqual(limiter.stats()["paced_requests"], 2)
+
+    def test_disabled(self):
+        limiter = fmc.RateLimiter(rate=None, burst=1)
+        self.assertEqual([limiter.reserve() for _ in range(100)], [0] * 100)
+
+    def test_throttle_honors_retry_after(self):
+        limiter = fmc.RateLimiter()
+        self.assertEqual(limiter.throttle(retry_after="7"), 7)
+        self.assertEqual(limiter.stats()["throttle_events"], 1)
+        self.assertEqual(limiter.stats()["throttled_time"], 7)
+
+    def test_throttle_jittered_exponential_backoff(self):
+        limiter = fmc.RateLimiter(max_backoff=30)
+        for attempt, ceiling in [(0, 1), (2, 4), (10, 30)]:
+            delay = limiter.throttle(attempt=attempt)
+            self.assertGreaterEqual(delay, ceiling / 2)
+            self.assertLessEqual(delay, ceiling)
+
+    @mock.patch("fmcapi.fmc.time.sleep")
+    def test_send_to_api_retries_after_429(self, mock_sleep):
+        f = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None)
+        f.session = mock.Mock()
+        f.session.request.side_effect = [
+            mock_response({}, status_code=429, headers={"Retry-After": "2"}),
+            mock_response({"id": "1"}),
+        ]
+        self.assertEqual(f.send_to_api(method="get", url="https://fmc/x"), {"id": "1"})
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 2, places=1)
+        self.assertEqual(f.throttle_stats["throttle_events"], 1)
+
+
+class Unformattable(object):
+    def __str__(self):
+        raise AssertionError("The payload was formatted.")
+
+    __repr__ = __str__
+
+
+class TestRequestLogging(unittest.TestCase):
+    def test_payload_not_formatted_unless_debug(self):
+        f = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None, logging_level="INFO")
+        f.session = mock.Mock()
+        f.session.request.return_value = mock_response({"id": "1"})
+        f.send_to_api(method="post", url="https://fmc/x", json_data=Unformattable())
+
+    def test_request_log(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "requests.log")
+            f = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None, request_log=path)
+            f.session = mock.Mock()
+            response = mock_response({"id": "1"})
+            response.request.body = b'{"name": "secret"}'
+            response.content = response.text.encode()
+            f.session.request.return_value = response
+            f.send_to_api(method="post", url="https://fmc/x", json_data={"name": "secret"})
+            f.request_logger.handlers[0].close()
+            with open(path) as log:
+                lines = log.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertNotIn("secret", lines[0])
+        record = json.loads(lines[0])
+        self.assertEqual(
+            {k: record[k] for k in ["method", "url", "status", "request_bytes", "response_bytes"]},
+            {
+                "method": "POST",
+                "url": "https://fmc/x",
+                "status": 200,
+                "request_bytes": 18,
+                "response_bytes": 11,
+            },
+        )
+        self.assertGreaterEqual(record["latency_ms"], 0)
+
+    @mock.patch("fmcapi.fmc.time.sleep")
+    def test_request_hooks_and_metrics(self, mock_sleep):
+        f = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None, metrics=True)
+        before = []
+        f.add_request_hooks(before=before.append)
+        responses = [
+            mock_response({}, status_code=429, headers={"Retry-After": "0"}),
+            mock_response({"id": "1"}),
+        ]
+        for response in responses:
+            response.request.body = None
+            response.content = response.text.encode()
+        f.session = mock.Mock()
+        f.session.request.side_effect = responses
+        f.send_to_api(
+            method="get", url="https://fmc/api/fmc_config/v1/domain/x/object/hosts"
+        )
+        self.assertEqual([e["attempt"] for e in before], [0, 1])
+        stats = f.metrics.to_dict()["GET object/hosts"]
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["retries"], 1)
+        self.assertEqual(stats["status"], {429: 1, 200: 1})
+
+    def test_failing_hook_does_not_break_requests(self):
+        f = fmc.FMC(api_key="key", uuid="uuid", rate_limit=None)
+        f.add_request_hooks(before=lambda event: 1 / 0)
+        f.session = mock.Mock()
+        f.session.request.return_value = mock_response({"id": "1"})
+        self.assertEqual(f.send_to_api(method="get", url="https://fmc/x"), {"id": "1"})
+
+
+def token_response(n):
+    return mock.Mock(
+        headers={
+            "X-auth-access-token": f"access-{n}",
+            "X-auth-refresh-token": f"refresh-{n}",
+            "DOMAIN_UUID": "uuid",
+            "DOMAINS": "[]",
+        }
+    )
+
+
+class TestToken(unittest.TestCase):
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.post.side_effect = [token_response(n) for n in range(10)]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmpdir.name, "token.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def urls(self):
+        return [c[0][0].rsplit("/", 1)[1] for c in self.session.post.call_args_list]
+
+    def test_refresh_token_is_used_before_logging_in_again(self):
+        token = fmc.Token(session=self.session)
+        for _ in range(fmc.Token.MAX_REFRESHES + 1):
+            token.token_creation_time -= datetime.timedelta(hours=1)
+            token.get_token()
+        refreshes = ["refreshtoken"] * fmc.Token.MAX_REFRESHES
+        self.assertEqual(self.urls(), ["generatetoken"] + refreshes + ["generatetoken"])
+        self.assertEqual(token.get_token(), "access-4")
+
+    def test_token_is_shared_through_cache_file(self):
+        first = fmc.Token(session=self.session, cache_file=self.cache_file)
+        second = fmc.Token(session=self.session, cache_file=self.cache_file)
+        self.assertEqual(self.session.post.call_count, 1)
+        self.assertEqual(second.get_token(), first.get_token())
+        self.assertEqual(second.uuid, "uuid")
+
+    def test_rejected_cached_token_is_not_reused(self):
+        fmc.Token(session=self.session, cache_file=self.cache_file)
+        token = fmc.Token(session=self.session, cache_file=self.cache_file)
+        token.invalidate()
+        self.assertEqual(token.get_token(), "access-1")
+        self.assertEqual(self.urls(), ["generatetoken", "generatetoken"])
+
+    def test_cache_ignores_other_users(self):
+        fmc.Token(session=self.session, cache_file=self.cache_file)
+        fmc.Token(username="other", session=self.session, cache_file=self.cache_file)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_background_refresh(self):
+        with mock.patch.object(fmc.Token, "BACKGROUND_REFRESH_TIME", 0):
+            token = fmc.Token(session=self.session, background_refresh=True)
+            for _ in range(100):
+                if self.session.post.call_count > 1:
+                    break
+                time.sleep(0.01)
+            token.stop()
+        self.assertEqual(self.urls()[:2], ["generatetoken", "refreshtoken"])
+        self.assertIsNone(token.refresh_thread)
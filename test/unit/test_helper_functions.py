@@ -0,0 +1,57 @@
+"""
+Test helper_functions.py
+"""
+
+import json
+import unittest
+
+from fmcapi.api_objects.helper_functions import (
+    json_chunker,
+    syntax_correcter,
+    syntax_correcter_batch,
+)
+
+
+class TestJsonChunker(unittest.TestCase):
+    def test_chunks_fit_in_max_bytes(self):
+        items = [{"name": f"rule-{i}", "action": "ALLOW"} for i in range(500)]
+        chunks = list(json_chunker(items, max_bytes=4096))
+        self.assertEqual([i for chunk in chunks for i in chunk], items)
+        for chunk in chunks:
+            self.assertLessEqual(len(json.dumps(chunk).encode("utf-8")), 4096)
+        # Chunks are filled as far as the limit allows.
+        self.assertGreater(len(json.dumps(chunks[0] + [items[0]])), 4096)
+
+    def test_exact_fit(self):
+        item = {"a": "x"}
+        size = len(json.dumps([item, item]))
+        self.assertEqual(len(list(json_chunker([item] * 4, max_bytes=size))), 2)
+
+    def test_max_items(self):
+        chunks = list(json_chunker(range(10), max_bytes=10**6, max_items=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_oversized_item_is_sent_alone(self):
+        chunks = list(json_chunker(["x" * 100, "y"], max_bytes=50))
+        self.assertEqual(chunks, [["x" * 100], ["y"]])
+
+
+class TestSyntaxCorrecter(unittest.TestCase):
+    def test_invalid_characters_are_replaced(self):
+        self.assertEqual(syntax_correcter("web server/1.2"), "web_server_1.2")
+        self.assertEqual(syntax_correcter("ok-name_1"), "ok-name_1")
+        self.assertEqual(syntax_correcter("a\nb"), "a_b")
+        self.assertEqual(syntax_correcter(""), "")
+
+    def test_custom_syntax_and_replacer(self):
+        self.assertEqual(
+            syntax_correcter("a b/c", permitted_syntax="[ \\w]", replacer="-"),
+            "a b-c",
+        )
+        self.assertEqual(syntax_correcter("a/b", replacer="\\"), "a\\b")
+
+    def test_batch(self):
+        names = ["web server", "ok", "x/y z"]
+        self.assertEqual(
+            syntax_correcter_batch(names), [syntax_correcter(n) for n in names]
+        )
@@ -0,0 +1,68 @@
+"""
+Test the lazy loading of the api_objects classes.
+"""
+import subprocess
+import sys
+import unittest
+
+
+def run(code):
+    """Run code in a fresh interpreter, so that nothing is imported yet."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_classes_not_imported_by_import_fmcapi(self):
+        out = run(
+            "import sys, fmcapi; "
+            "print('fmcapi.api_objects.object_services.hosts' in sys.modules, 'httpx' in sys.modules)"
+        )
+        self.assertEqual(out, "False False")
+
+    def test_optional_modules_not_imported_by_import_fmcapi(self):
+        out = run(
+            "import sys, fmcapi; "
+            "print('asyncio' in sys.modules, 'sqlite3' in sys.modules)"
+        )
+        self.assertEqual(out, "False False")
+
+    def test_asyncio_not_imported_by_deployment_services(self):
+        out = run(
+            "import sys; from fmcapi.api_objects.deployment_services import *; "
+            "DeploymentPipeline; print('asyncio' in sys.modules)"
+        )
+        self.assertEqual(out, "False")
+
+    def test_classes_imported_on_first_use(self):
+        out = run(
+            "import sys, fmcapi; "
+            "print(fmcapi.Hosts.__module__, 'fmcapi.api_objects.object_services.hosts' in sys.modules, "
+            "fmcapi.Hosts is fmcapi.api_objects.object_services.Hosts)"
+        )
+        self.assertEqual(out, "fmcapi.api_objects.object_services.hosts True True")
+
+    def test_star_import(self):
+        out = run("from fmcapi import *; print(DeviceRecords.__name__, AccessPolicies.__name__)")
+        self.assertEqual(out, "DeviceRecords AccessPolicies")
+
+    def test_subpackage_star_import(self):
+        out = run(
+            "from fmcapi.api_objects.device_group_services import *; "
+            "print(DeviceGroupRecords.__name__)"
+        )
+        self.assertEqual(out, "DeviceGroupRecords")
+
+    def test_every_exported_name_resolves(self):
+        import fmcapi
+
+        for name in fmcapi.__all__:
+            self.assertTrue(hasattr(fmcapi, name), name)
+        self.assertIn("Hosts", dir(fmcapi))
+
+    def test_unknown_name(self):
+        import fmcapi
+
+        with self.assertRaises(AttributeError):
+            fmcapi.NoSuchClass
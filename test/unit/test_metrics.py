@@ -0,0 +1,95 @@
+"""
+Test metrics.py
+"""
+
+import unittest
+
+from fmcapi.metrics import MetricsCollector
+
+BASE = "https://fmc/api/fmc_config/v1/domain/e276abec-e0f2-11e3-8169-6d9ed49b625f"
+HOST_ID = "00505686-4a51-0ed3-0000-004294967299"
+
+
+def event(url, status=200, latency=0.2, attempt=0, method="GET", **kwargs):
+    return dict(
+        {
+            "method": method,
+            "url": url,
+            "status": status,
+            "latency": latency,
+            "attempt": attempt,
+            "wait": 0.0,
+            "request_bytes": 0,
+            "response_bytes": 100,
+        },
+        **kwargs,
+    )
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_endpoint(self):
+        self.assertEqual(
+            MetricsCollector.endpoint(f"{BASE}/object/hosts/{HOST_ID}?expanded=true"),
+            "object/hosts/{id}",
+        )
+        self.assertEqual(
+            MetricsCollector.endpoint(
+                "https://fmc/api/fmc_platform/v1/info/serverversion"
+            ),
+            "info/serverversion",
+        )
+
+    def test_counters(self):
+        metrics = MetricsCollector()
+        metrics.record(event(f"{BASE}/object/hosts?offset=0&limit=1000"))
+        metrics.record(event(f"{BASE}/object/hosts?offset=1000&limit=1000", latency=3))
+        metrics.record(event(f"{BASE}/object/hosts?offset=2000&limit=1000", status=429))
+        metrics.record(
+            event(
+                f"{BASE}/object/hosts?offset=2000&limit=1000",
+                attempt=1,
+                wait=2.0,
+            )
+        )
+        metrics.record(
+            event(f"{BASE}/object/hosts", method="POST", request_bytes=50, latency=0.01)
+        )
+        stats = metrics.to_dict()
+        hosts = stats["GET object/hosts"]
+        self.assertEqual(hosts["requests"], 4)
+        self.assertEqual(hosts["status"], {200: 3, 429: 1})
+        self.assertEqual(hosts["errors"], 1)
+        self.assertEqual(hosts["retries"], 1)
+        self.assertEqual(hosts["pages"], 3)
+        self.assertEqual(hosts["throttle_seconds"], 2.0)
+        self.assertEqual(hosts["response_bytes"], 400)
+        self.assertEqual(hosts["latency_max"], 3)
+        self.assertEqual(hosts["latency_buckets"][0.25], 3)
+        self.assertEqual(hosts["latency_buckets"][5], 4)
+        self.assertEqual(hosts["latency_buckets"]["+Inf"], 4)
+        self.assertEqual(stats["POST object/hosts"]["request_bytes"], 50)
+        self.assertEqual(metrics.top(1)[0][0], "GET object/hosts")
+        metrics.reset()
+        self.assertEqual(metrics.to_dict(), {})
+
+    def test_prometheus(self):
+        metrics = MetricsCollector()
+        metrics.record(event(f"{BASE}/object/hosts", latency=0.07))
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE fmcapi_requests_total counter", text)
+        self.assertIn(
+            'fmcapi_requests_total{method="GET",endpoint="object/hosts",status="200"} 1',
+            text,
+        )
+        self.assertIn(
+            'fmcapi_request_duration_seconds_bucket{method="GET",endpoint="object/hosts",le="0.05"} 0',
+            text,
+        )
+        self.assertIn(
+            'fmcapi_request_duration_seconds_bucket{method="GET",endpoint="object/hosts",le="0.1"} 1',
+            text,
+        )
+        self.assertIn(
+            'fmcapi_request_duration_seconds_count{method="GET",endpoint="object/hosts"} 1',
+            text,
+        )
@@ -0,0 +1,228 @@
+"""
+Test simulator.py
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+import unittest
+import uuid
+
+from fmcapi.asyncfmc import AsyncFMC
+from fmcapi.fmc import FMC
+from fmcapi.api_objects.deployment_services.deploymentpipeline import (
+    DeploymentPipeline,
+)
+from fmcapi.api_objects.object_services.hosts import Hosts
+from fmcapi.simulator import FMCSimulator
+
+
+def hosts(count):
+    return [{"name": f"host-{i}", "value": f"10.0.0.{i % 250}"} for i in range(count)]
+
+
+class TestFMCSimulator(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def fmc(self, simulator, **kwargs):
+        kwargs.setdefault("rate_limit", None)
+        return simulator.attach(FMC(host="fmc", autodeploy=False, **kwargs))
+
+    def test_login_and_server_version(self):
+        simulator = FMCSimulator(domains=["Lab"])
+        with self.fmc(simulator, domain="Lab") as fmc:
+            self.assertEqual(fmc.serverVersion, "7.2.0 (build 82)")
+            self.assertEqual(fmc.uuid, simulator.domains["Global/Lab"])
+
+    def test_wrong_password_is_rejected(self):
+        status, headers, _ = FMCSimulator().handle(
+            "POST",
+            "https://fmc/api/fmc_platform/v1/auth/generatetoken",
+            {"Authorization": "Basic YWRtaW46d3Jvbmc="},
+            b"",
+        )
+        self.assertEqual(status, 401)
+        self.assertNotIn("X-auth-access-token", headers)
+
+    def test_crud(self):
+        simulator = FMCSimulator()
+        with self.fmc(simulator) as fmc:
+            host = Hosts(fmc=fmc, name="web", value="10.0.0.1")
+            host.post()
+            found = Hosts(fmc=fmc)
+            found.get(name="web")
+            self.assertEqual(found.id, host.id)
+            found.value = "10.0.0.2"
+            found.put()
+            self.assertEqual(simulator.objects("object/hosts")[0]["value"], "10.0.0.2")
+            found.delete()
+            self.assertEqual(simulator.objects("object/hosts"), [])
+            # Duplicate names are refused like on a real FMC.
+            Hosts(fmc=fmc, name="web", value="10.0.0.1").post()
+            self.assertIsNone(Hosts(fmc=fmc, name="web", value="10.0.0.1").post())
+
+    def test_paging(self):
+        simulator = FMCSimulator()
+        simulator.load("object/hosts", hosts(2345))
+        with self.fmc(simulator, max_workers=4) as fmc:
+            items = Hosts(fmc=fmc).get()["items"]
+            self.assertEqual(
+                [i["name"] for i in items], [h["name"] for h in hosts(2345)]
+            )
+            self.assertEqual(items[0]["value"], "10.0.0.0")
+        # One token, one server version and three pages.
+        self.assertEqual(simulator.stats()["requests"], 5)
+
+    def test_listing_is_not_expanded_by_default(self):
+        simulator = FMCSimulator()
+        simulator.load("object/hosts", hosts(30))
+        with self.fmc(simulator) as fmc:
+            response = fmc.send_to_api(
+                method="get", url=f"{fmc.configuration_url}/object/hosts?offset=25"
+            )
+        self.assertEqual(len(response["items"]), 5)
+        self.assertEqual(set(response["items"][0]), {"id", "name", "type", "links"})
+        self.assertNotIn("next", response["paging"])
+
+    def test_bulk(self):
+        simulator = FMCSimulator()
+        with self.fmc(simulator, max_workers=2) as fmc:
+            bulk = Hosts(fmc=fmc)
+            bulk.bulk = hosts(300)
+            bulk.bulk_post()
+            self.assertEqual(len(simulator.objects("object/hosts")), 300)
+            delete = Hosts(fmc=fmc)
+            delete.bulk = bulk.bulk_ids[:100]
+            delete.bulk_delete()
+        self.assertEqual(len(simulator.objects("object/hosts")), 200)
+
+    def test_throttling(self):
+        simulator = FMCSimulator(rate_limit=20, period=1)
+        with self.fmc(simulator) as fmc:
+            for _ in range(30):
+                self.assertIsNotNone(
+                    fmc.send_to_api(
+                        method="get", url=f"{fmc.platform_url}/info/serverversion"
+                    )
+                )
+        self.assertGreater(simulator.stats()["throttled"], 0)
+        self.assertEqual(
+            fmc.throttle_stats["throttle_events"], simulator.stats()["throttled"]
+        )
+
+    def test_expired_token_is_renewed(self):
+        simulator = FMCSimulator(token_lifetime=0.2)
+        with self.fmc(simulator) as fmc:
+            time.sleep(0.3)
+            self.assertIsNotNone(
+                fmc.send_to_api(
+                    method="get", url=f"{fmc.configuration_url}/object/hosts"
+                )
+            )
+        self.assertEqual(simulator.stats()["tokens_issued"], 2)
+
+    def test_revoked_token_is_renewed_once(self):
+        simulator = FMCSimulator(latency=lambda method, path: 0.05)
+        with self.fmc(simulator) as fmc:
+            issued = simulator.stats()["tokens_issued"]
+            simulator.tokens.clear()
+            url = f"{fmc.configuration_url}/object/hosts"
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(
+                    executor.map(
+                        lambda _: fmc.send_to_api(method="get", url=url), range(8)
+                    )
+                )
+        self.assertNotIn(None, responses)
+        self.assertEqual(simulator.stats()["tokens_issued"], issued + 1)
+
+    def test_revoked_token_is_renewed_once_async(self):
+        simulator = FMCSimulator(latency=lambda method, path: 0.05)
+
+        async def run():
+            fmc = simulator.attach(
+                AsyncFMC(host="fmc", autodeploy=False, rate_limit=None)
+            )
+            async with fmc:
+                simulator.tokens.clear()
+                url = f"{fmc.configuration_url}/object/hosts"
+                return await asyncio.gather(
+                    *[fmc.asend_to_api(method="get", url=url) for _ in range(8)]
+                )
+
+        self.assertNotIn(None, asyncio.run(run()))
+        self.assertEqual(simulator.stats()["tokens_issued"], 2)
+
+    def test_last_status_code(self):
+        simulator = FMCSimulator()
+        with self.fmc(simulator) as fmc:
+            url = f"{fmc.configuration_url}/object/hosts"
+            self.assertIsNone(fmc.send_to_api(method="get", url=f"{url}/{uuid.uuid4()}"))
+            self.assertEqual(fmc.last_status_code(), 404)
+            fmc.send_to_api(method="get", url=url)
+            self.assertEqual(fmc.last_status_code(), 200)
+
+        async def run():
+            fmc = simulator.attach(
+                AsyncFMC(host="fmc", autodeploy=False, rate_limit=None)
+            )
+            async with fmc:
+
+                def missing():
+                    # A thread other than the event loop's, like the TaskTracker's.
+                    fmc.send_to_api(method="get", url=f"{url}/{uuid.uuid4()}")
+                    return fmc.last_status_code()
+
+                return await asyncio.get_running_loop().run_in_executor(None, missing)
+
+        self.assertEqual(asyncio.run(run()), 404)
+
+    def test_latency(self):
+        simulator = FMCSimulator(
+            latency=lambda method, path: 0.05 if "hosts" in path else 0
+        )
+        with self.fmc(simulator) as fmc:
+            start = time.monotonic()
+            fmc.send_to_api(method="get", url=f"{fmc.configuration_url}/object/hosts")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_deployment(self):
+        simulator = FMCSimulator(task_time=0.1)
+        simulator.load(
+            "deployment/deployabledevices",
+            [
+                {
+                    "name": f"ftd-{i}",
+                    "canBeDeployed": True,
+                    "version": "1000",
+                    "device": {"id": f"device-{i}", "type": "Device"},
+                }
+                for i in range(3)
+            ],
+        )
+        with self.fmc(simulator, wait_time=0) as fmc:
+            fmc.task_tracker.POLL_INTERVAL = 0.05
+            pipeline = DeploymentPipeline(fmc=fmc, settle_time=0)
+            pipeline.POLL_INTERVAL = 0.01
+            result = pipeline.deploy()
+        self.assertEqual(result["status"], "Deployed")
+        self.assertEqual(
+            {device["status"] for device in result["devices"].values()}, {"DEPLOYED"}
+        )
+        self.assertEqual(simulator.objects("deployment/deployabledevices"), [])
+
+    def test_async_fmc(self):
+        simulator = FMCSimulator()
+        simulator.load("object/hosts", hosts(1500))
+
+        async def run():
+            fmc = simulator.attach(
+                AsyncFMC(host="fmc", autodeploy=False, rate_limit=None)
+            )
+            async with fmc:
+                return await Hosts(fmc=fmc).aget()
+
+        self.assertEqual(len(asyncio.run(run())["items"]), 1500)
@@ -0,0 +1,91 @@
+"""
+Test tasktracker.py
+"""
+
+import mock
+import unittest
+
+from fmcapi.api_objects.status_services import TaskTracker
+
+
+class FakeFMC(object):
+    def __init__(self, statuses):
+        self.configuration_url = "https://fmc/api/fmc_config/v1/domain/uuid"
+        self.serverVersion = "7.2.0"
+        self.limit = 1000
+        self.statuses = statuses
+        self.polls = []
+        self.status_code = None
+
+    def supports(self, api_class):
+        return True
+
+    def send_to_api(self, method, url, **kwargs):
+        task_id = url.rsplit("/", 1)[1]
+        self.polls.append(task_id)
+        statuses = self.statuses[task_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if status == "timeout":
+            raise TimeoutError("Read timed out.")
+        if isinstance(status, int):
+            self.status_code = status
+            return None
+        self.status_code = 200
+        return {"id": task_id, "status": status}
+
+    def last_status_code(self):
+        return self.status_code
+
+
+@mock.patch.object(TaskTracker, "POLL_INTERVAL", 0.001)
+@mock.patch.object(TaskTracker, "MAX_POLL_INTERVAL", 0.01)
+class TestTaskTracker(unittest.TestCase):
+    def test_many_tasks_tracked_together(self):
+        fmc = FakeFMC(
+            {
+                "a": ["PENDING", "RUNNING", "SUCCESS"],
+                "b": ["RUNNING", "FAILED"],
+                "c": ["SUCCESS"],
+            }
+        )
+        tracker = TaskTracker(fmc=fmc)
+        finished = []
+        futures = [
+            tracker.track({"id": task_id}, callback=finished.append)
+            for task_id in "abc"
+        ]
+        self.assertEqual(tracker.wait(futures, timeout=5), futures)
+        self.assertEqual([f.status for f in futures], ["SUCCESS", "FAILED", "SUCCESS"])
+        self.assertEqual([f.succeeded() for f in futures], [True, False, True])
+        self.assertEqual(sorted(f.task_id for f in finished), ["a", "b", "c"])
+        self.assertEqual(fmc.polls.count("a"), 3)
+        self.assertEqual(fmc.polls.count("c"), 1)
+
+    def test_task_from_response_metadata(self):
+        fmc = FakeFMC({"a": ["SUCCESS"]})
+        future = TaskTracker(fmc=fmc).track({"metadata": {"task": {"id": "a"}}})
+        self.assertEqual(future.result(timeout=5), {"id": "a", "status": "SUCCESS"})
+
+    def test_timeout(self):
+        fmc = FakeFMC({"a": ["RUNNING"]})
+        future = TaskTracker(fmc=fmc).track("a", timeout=0.05)
+        self.assertEqual(future.result(timeout=5)["status"], "TIMEOUT")
+        self.assertFalse(future.succeeded())
+
+    def test_done_when_missing(self):
+        fmc = FakeFMC({"a": ["PENDING", 404]})
+        future = TaskTracker(fmc=fmc).track("a", done_when_missing=True)
+        self.assertEqual(future.result(timeout=5)["status"], "COMPLETED")
+
+    def test_failed_poll_is_not_missing(self):
+        fmc = FakeFMC({"a": ["PENDING", 500, "timeout", "PENDING"]})
+        future = TaskTracker(fmc=fmc).track("a", timeout=0.1, done_when_missing=True)
+        self.assertEqual(future.result(timeout=5)["status"], "TIMEOUT")
+        self.assertFalse(future.succeeded())
+        self.assertGreater(len(fmc.polls), 3)
+
+    def test_backoff(self):
+        tracker = TaskTracker(fmc=FakeFMC({"a": ["RUNNING"]}))
+        future = tracker.track("a", timeout=0.2)
+        future.result(timeout=5)
+        self.assertEqual(future.poll_interval, 0.01)